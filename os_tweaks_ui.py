@@ -18,6 +18,145 @@ from PySide6.QtGui import QFont
 
 from visual_tweaks_and_logs import GlobalLogger
 
+# Windows' built-in Balanced plan, restored when the plan active before tweaking is unknown
+BALANCED_POWER_PLAN_GUID = "381b4222-f694-41f0-9685-ff5bb260df2e"
+
+
+def get_current_power_plan_guid():
+    """
+    Retrieves the GUID of the current active power plan (Windows only).
+    """
+    if platform.system().lower() != "windows":
+        return None
+    try:
+        result = subprocess.run(
+            ["powercfg", "/getactivescheme"],
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            text=True,
+            creationflags=0x08000000
+        )
+        output = result.stdout.strip()
+        guid_match = re.search(r"GUID: ([A-Fa-f0-9-]+)", output)
+        if guid_match:
+            guid = guid_match.group(1)
+            GlobalLogger.append(f"[OSTweaksPage] Current active power plan GUID: {guid}", is_internal=True)
+            return guid
+    except Exception as e:
+        GlobalLogger.append(f"[OSTweaksPage] Failed to get current power plan GUID: {e}", is_error=True)
+    return None
+
+
+def set_game_mode_registry(enable: bool):
+    """
+    Enables or disables Windows Game Mode via registry.
+    Returns (success: bool, error message or None).
+    """
+    if platform.system().lower() != "windows":
+        GlobalLogger.append("[OSTweaksPage] Attempted Game Mode on non-Windows.", is_internal=True)
+        return False, "Game Mode tweaks are available on Windows only."
+    try:
+        # HKEY_CURRENT_USER\Software\Microsoft\GameBar -> AllowAutoGameMode
+        reg_path_gamebar = r"Software\Microsoft\GameBar"
+        key_gamebar = winreg.CreateKeyEx(winreg.HKEY_CURRENT_USER, reg_path_gamebar)
+        winreg.SetValueEx(key_gamebar, "AllowAutoGameMode", 0, winreg.REG_DWORD, 1 if enable else 0)
+        winreg.CloseKey(key_gamebar)
+
+        # HKEY_CURRENT_USER\System\GameConfigStore -> GameDVR_Enabled
+        reg_path_gamedvr = r"System\GameConfigStore"
+        key_dvr = winreg.CreateKeyEx(winreg.HKEY_CURRENT_USER, reg_path_gamedvr)
+        winreg.SetValueEx(key_dvr, "GameDVR_Enabled", 0, winreg.REG_DWORD, 1 if enable else 0)
+        winreg.CloseKey(key_dvr)
+
+        GlobalLogger.append(f"[OSTweaksPage] Game Mode {'enabled' if enable else 'disabled'} in registry.", is_internal=True)
+        return True, None
+    except Exception as ex:
+        GlobalLogger.append(f"[OSTweaksPage] Failed to set Game Mode registry: {ex}", is_error=True)
+        return False, f"Failed to modify Game Mode registry:\n{ex}"
+
+
+def run_shell_command_silent(command_parts, log_message_base=""):
+    """
+    Runs a shell command silently (Windows only). Returns (success: bool, message: str).
+    """
+    if platform.system().lower() != "windows":
+        GlobalLogger.append(f"[OSTweaksPage] Skipping command on non-Windows: {' '.join(command_parts)}", is_internal=True)
+        return False, "Unsupported OS"
+    try:
+        process = subprocess.run(
+            command_parts,
+            shell=False,
+            capture_output=True,
+            text=True,
+            creationflags=0x08000000  # CREATE_NO_WINDOW
+        )
+        if process.returncode == 0:
+            GlobalLogger.append(f"[OSTweaksPage] {log_message_base}: succeeded.", is_internal=True)
+            return True, "Success"
+        else:
+            error_details = process.stderr.strip() or process.stdout.strip() or f"Return code {process.returncode}"
+            GlobalLogger.append(f"[OSTweaksPage] {log_message_base}: failed: {error_details}", is_error=True)
+            return False, error_details
+    except FileNotFoundError:
+        msg = f"Command not found: {command_parts[0]}"
+        GlobalLogger.append(f"[OSTweaksPage] {log_message_base}: {msg}", is_error=True)
+        return False, msg
+    except Exception as ex:
+        msg = f"Error executing {command_parts}: {ex}"
+        GlobalLogger.append(f"[OSTweaksPage] {log_message_base}: {msg}", is_error=True)
+        return False, msg
+
+
+def restore_os_settings(original_power_plan_guid=None):
+    """
+    Reverts what "Apply All Recommended OS Tweaks" changed, without any UI:
+    Game Mode off, original (or Balanced) power plan, SysMain back to automatic,
+    Xbox Game Bar capture re-enabled. Returns a list of summary lines.
+    """
+    results_summary = []
+
+    # 1. Deactivate Game Mode
+    success_gm, msg_gm = set_game_mode_registry(enable=False)
+    if success_gm:
+        results_summary.append("Game Mode: Deactivated")
+    else:
+        results_summary.append(f"Game Mode: Deactivation failed ({msg_gm})")
+
+    # 2. Restore original or Balanced power plan
+    guid_to_restore = original_power_plan_guid or BALANCED_POWER_PLAN_GUID
+    plan_name = "Original" if original_power_plan_guid else "Balanced"
+    success_restore, msg_restore = run_shell_command_silent(
+        ["powercfg", "/setactive", guid_to_restore],
+        f"Restore Power Plan to {plan_name}"
+    )
+    results_summary.append(f"Power Plan ({plan_name}): {'Restored' if success_restore else f'Failed: {msg_restore}'}")
+
+    # 3. Re-enable SysMain service
+    success_reconfig, msg_reconfig = run_shell_command_silent(
+        ["sc", "config", "SysMain", "start=", "auto"], "Re-enable SysMain"
+    )
+    if success_reconfig:
+        results_summary.append("SysMain Service: Set to Automatic")
+        run_shell_command_silent(["sc", "start", "SysMain"], "Start SysMain")
+    else:
+        results_summary.append(f"SysMain Service: Re-enable failed ({msg_reconfig})")
+
+    # 4. Re-enable Xbox Game Bar (AppCaptureEnabled) in registry
+    try:
+        if platform.system().lower() == "windows":
+            reg_path = r"SOFTWARE\Microsoft\Windows\CurrentVersion\GameDVR"
+            key = winreg.CreateKeyEx(winreg.HKEY_CURRENT_USER, reg_path)
+            winreg.SetValueEx(key, "AppCaptureEnabled", 0, winreg.REG_DWORD, 1)
+            winreg.CloseKey(key)
+            results_summary.append("Xbox Game Bar: Re-enabled")
+            GlobalLogger.append("[OSTweaksPage] AppCaptureEnabled set to 1", is_internal=True)
+    except Exception as ex_gamedvr_restore:
+        results_summary.append(f"Xbox Game Bar: Re-enable failed ({ex_gamedvr_restore})")
+        GlobalLogger.append(f"[OSTweaksPage] Failed re-enabling Game DVR: {ex_gamedvr_restore}", is_error=True)
+
+    GlobalLogger.append("[OSTweaksPage] Completed restoring OS settings.")
+    return results_summary
+
 
 class OSTweaksPage(QWidget):
     """
@@ -118,60 +257,20 @@ class OSTweaksPage(QWidget):
         main_layout.addStretch(1)
 
         # Store original power plan GUID at initialization
-        self._original_power_plan_guid = self._get_current_power_plan_guid()
-
-    def _get_current_power_plan_guid(self):
-        """
-        Retrieves the GUID of the current active power plan (Windows only).
-        """
-        if platform.system().lower() != "windows":
-            return None
-        try:
-            result = subprocess.run(
-                ["powercfg", "/getactivescheme"],
-                stdout=subprocess.PIPE,
-                stderr=subprocess.DEVNULL,
-                text=True,
-                creationflags=0x08000000
-            )
-            output = result.stdout.strip()
-            guid_match = re.search(r"GUID: ([A-Fa-f0-9-]+)", output)
-            if guid_match:
-                guid = guid_match.group(1)
-                GlobalLogger.append(f"[OSTweaksPage] Current active power plan GUID: {guid}", is_internal=True)
-                return guid
-        except Exception as e:
-            GlobalLogger.append(f"[OSTweaksPage] Failed to get current power plan GUID: {e}", is_error=True)
-        return None
+        self._original_power_plan_guid = get_current_power_plan_guid()
 
     def _set_game_mode_registry(self, enable: bool):
         """
-        Enables or disables Windows Game Mode via registry.
+        set_game_mode_registry() with the page's dialogs on failure.
         Returns True on success, False on failure.
         """
-        if platform.system().lower() != "windows":
-            QMessageBox.information(self, "OS Tweaks", "Game Mode tweaks are available on Windows only.")
-            GlobalLogger.append("[OSTweaksPage] Attempted Game Mode on non-Windows.", is_internal=True)
-            return False
-        try:
-            # HKEY_CURRENT_USER\Software\Microsoft\GameBar -> AllowAutoGameMode
-            reg_path_gamebar = r"Software\Microsoft\GameBar"
-            key_gamebar = winreg.CreateKeyEx(winreg.HKEY_CURRENT_USER, reg_path_gamebar)
-            winreg.SetValueEx(key_gamebar, "AllowAutoGameMode", 0, winreg.REG_DWORD, 1 if enable else 0)
-            winreg.CloseKey(key_gamebar)
-
-            # HKEY_CURRENT_USER\System\GameConfigStore -> GameDVR_Enabled
-            reg_path_gamedvr = r"System\GameConfigStore"
-            key_dvr = winreg.CreateKeyEx(winreg.HKEY_CURRENT_USER, reg_path_gamedvr)
-            winreg.SetValueEx(key_dvr, "GameDVR_Enabled", 0, winreg.REG_DWORD, 1 if enable else 0)
-            winreg.CloseKey(key_dvr)
-
-            GlobalLogger.append(f"[OSTweaksPage] Game Mode {'enabled' if enable else 'disabled'} in registry.", is_internal=True)
-            return True
-        except Exception as ex:
-            GlobalLogger.append(f"[OSTweaksPage] Failed to set Game Mode registry: {ex}", is_error=True)
-            QMessageBox.critical(self, "Registry Error", f"Failed to modify Game Mode registry:\n{ex}")
-            return False
+        success, error = set_game_mode_registry(enable)
+        if not success:
+            if platform.system().lower() != "windows":
+                QMessageBox.information(self, "OS Tweaks", error)
+            else:
+                QMessageBox.critical(self, "Registry Error", error)
+        return success
 
     def activate_game_mode_action(self):
         GlobalLogger.append("[OSTweaksPage] Activate Game Mode clicked.")
@@ -191,37 +290,6 @@ class OSTweaksPage(QWidget):
                 "Windows Game Mode has been DEACTIVATED.\nA system restart might be required for full effect."
             )
 
-    def _run_shell_command_silent(self, command_parts, log_message_base=""):
-        """
-        Runs a shell command silently (Windows only). Returns (success: bool, message: str).
-        """
-        if platform.system().lower() != "windows":
-            GlobalLogger.append(f"[OSTweaksPage] Skipping command on non-Windows: {' '.join(command_parts)}", is_internal=True)
-            return False, "Unsupported OS"
-        try:
-            process = subprocess.run(
-                command_parts,
-                shell=False,
-                capture_output=True,
-                text=True,
-                creationflags=0x08000000  # CREATE_NO_WINDOW
-            )
-            if process.returncode == 0:
-                GlobalLogger.append(f"[OSTweaksPage] {log_message_base}: succeeded.", is_internal=True)
-                return True, "Success"
-            else:
-                error_details = process.stderr.strip() or process.stdout.strip() or f"Return code {process.returncode}"
-                GlobalLogger.append(f"[OSTweaksPage] {log_message_base}: failed: {error_details}", is_error=True)
-                return False, error_details
-        except FileNotFoundError:
-            msg = f"Command not found: {command_parts[0]}"
-            GlobalLogger.append(f"[OSTweaksPage] {log_message_base}: {msg}", is_error=True)
-            return False, msg
-        except Exception as ex:
-            msg = f"Error executing {command_parts}: {ex}"
-            GlobalLogger.append(f"[OSTweaksPage] {log_message_base}: {msg}", is_error=True)
-            return False, msg
-
     def apply_all_tweaks_action(self):
         GlobalLogger.append("[OSTweaksPage] Apply All OS Tweaks clicked.")
         reply = QMessageBox.question(
@@ -261,17 +329,17 @@ class OSTweaksPage(QWidget):
                     plan_name = "Ultimate Performance"
             except Exception as e:
                 GlobalLogger.append(f"[OSTweaksPage] Error listing power plans: {e}", is_error=True)
-        success_power, msg_power = self._run_shell_command_silent(
+        success_power, msg_power = run_shell_command_silent(
             ["powercfg", "/setactive", chosen_guid],
             f"Set Power Plan to {plan_name}"
         )
         results_summary.append(f"Power Plan ({plan_name}): {'Applied' if success_power else f'Failed: {msg_power}'}")
 
         # 3. Disable Superfetch (SysMain)
-        success_stop, _ = self._run_shell_command_silent(
+        success_stop, _ = run_shell_command_silent(
             ["sc", "stop", "SysMain"], "Stop SysMain"
         )
-        success_config, msg_config = self._run_shell_command_silent(
+        success_config, msg_config = run_shell_command_silent(
             ["sc", "config", "SysMain", "start=", "disabled"], "Disable SysMain"
         )
         results_summary.append(f"SysMain Service: {'Disabled' if success_config else f'Failed: {msg_config}'}")
@@ -311,48 +379,8 @@ class OSTweaksPage(QWidget):
             GlobalLogger.append("[OSTweaksPage] Restore OS canceled by user.", is_internal=True)
             return
 
-        results_summary = []
-
-        # 1. Deactivate Game Mode
-        if self._set_game_mode_registry(enable=False):
-            results_summary.append("Game Mode: Deactivated")
-        else:
-            results_summary.append("Game Mode: Deactivation failed")
-
-        # 2. Restore original or Balanced power plan
-        balanced_guid = "381b4222-f694-41f0-9685-ff5bb260df2e"
-        guid_to_restore = self._original_power_plan_guid or balanced_guid
-        plan_name = "Original" if self._original_power_plan_guid else "Balanced"
-        success_restore, msg_restore = self._run_shell_command_silent(
-            ["powercfg", "/setactive", guid_to_restore],
-            f"Restore Power Plan to {plan_name}"
-        )
-        results_summary.append(f"Power Plan ({plan_name}): {'Restored' if success_restore else f'Failed: {msg_restore}'}")
-
-        # 3. Re-enable SysMain service
-        success_reconfig, msg_reconfig = self._run_shell_command_silent(
-            ["sc", "config", "SysMain", "start=", "auto"], "Re-enable SysMain"
-        )
-        if success_reconfig:
-            results_summary.append("SysMain Service: Set to Automatic")
-            self._run_shell_command_silent(["sc", "start", "SysMain"], "Start SysMain")
-        else:
-            results_summary.append(f"SysMain Service: Re-enable failed ({msg_reconfig})")
-
-        # 4. Re-enable Xbox Game Bar (AppCaptureEnabled) in registry
-        try:
-            if platform.system().lower() == "windows":
-                reg_path = r"SOFTWARE\Microsoft\Windows\CurrentVersion\GameDVR"
-                key = winreg.CreateKeyEx(winreg.HKEY_CURRENT_USER, reg_path)
-                winreg.SetValueEx(key, "AppCaptureEnabled", 0, winreg.REG_DWORD, 1)
-                winreg.CloseKey(key)
-                results_summary.append("Xbox Game Bar: Re-enabled")
-                GlobalLogger.append("[OSTweaksPage] AppCaptureEnabled set to 1", is_internal=True)
-        except Exception as ex_gamedvr_restore:
-            results_summary.append(f"Xbox Game Bar: Re-enable failed ({ex_gamedvr_restore})")
-            GlobalLogger.append(f"[OSTweaksPage] Failed re-enabling Game DVR: {ex_gamedvr_restore}", is_error=True)
+        results_summary = restore_os_settings(self._original_power_plan_guid)
 
-        GlobalLogger.append("[OSTweaksPage] Completed restoring OS settings.")
         QMessageBox.information(
             self,
             "OS Settings Restored",
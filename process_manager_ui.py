@@ -5,28 +5,27 @@ import time
 import os
 import sys
 import json
+from collections import deque
+from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from operator import itemgetter
+
+# Optional: faster JSON encoder for saving the process list; falls back to json
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 from PySide6.QtWidgets import (
-    QWidget, QVBoxLayout, QLabel, QTableWidget, QTableWidgetItem,
-    QPushButton, QHeaderView, QCheckBox, QTextEdit, QHBoxLayout,
+    QWidget, QVBoxLayout, QLabel, QTableView, QAbstractItemView,
+    QPushButton, QHeaderView, QPlainTextEdit, QHBoxLayout,
     QComboBox, QMessageBox, QApplication, QMenu
 )
-from PySide6.QtCore import Qt, QThread, Signal
-from PySide6.QtGui import QColor, QFont, QAction, QFontDatabase
+from PySide6.QtCore import Qt, QObject, QThread, QTimer, Signal, Slot, QAbstractTableModel, QModelIndex
+from PySide6.QtGui import QColor, QFont, QAction, QTextCursor
 
 from visual_tweaks_and_logs import GlobalLogger
-
-# Load and register the Audiowide font
-def load_custom_font():
-    font_path = os.path.join("resources", "fonts", "Audiowide", "Audiowide-Regular.ttf")
-    if os.path.exists(font_path):
-        font_id = QFontDatabase.addApplicationFont(font_path)
-        if font_id != -1:
-            return QFontDatabase.applicationFontFamilies(font_id)[0]
-    return "Segoe UI"  # Fallback to Segoe UI if font loading fails
-
-# Get the custom font family name
-CUSTOM_FONT = load_custom_font()
+from utils.proc_filter import filter_process
 
 # NAME_DESC_MAP: ensure your full map from the original file is included here.
 NAME_DESC_MAP = {
@@ -94,8 +93,17 @@ NAME_DESC_MAP = {
     "notepad.exe": "Notepad text editor."
 }
 
-# SYSTEM CRITICAL PROCESSES (all lowercase names)
-CRITICAL_PROCESSES = {
+def describe_process(proc):
+    """
+    Description for a process dict from ProcWorker, looked up by name then by exe basename.
+    """
+    return (
+        NAME_DESC_MAP.get(proc['name'].lower())
+        or NAME_DESC_MAP.get(proc['exe'], "No description available.")
+    )
+
+# SYSTEM CRITICAL PROCESSES (lowercased at build time; lookups use lowercase names)
+CRITICAL_PROCESSES = frozenset(name.lower() for name in {
     "system idle process", "system", "smss.exe", "csrss.exe", "wininit.exe",
     "winlogon.exe", "lsass.exe", "services.exe", "svchost.exe", "registry",
     "fontdrvhost.exe", "dwm.exe", "explorer.exe", "sihost.exe", "ctfmon.exe",
@@ -135,93 +143,448 @@ CRITICAL_PROCESSES = {
     "RobloxOptimizerPro_x86_d3d11.exe", "RobloxOptimizerPro_x86_d3d12.exe", "RobloxOptimizerPro_dx11.exe",
     "RobloxOptimizerPro_dx12.exe",
     # (Optionally include your app's executable name if critical)
-}
+})
+
+# C-level sort keys for the worker's Memory/CPU ordering
+_CPU_KEY = itemgetter('cpu')
+_MEM_KEY = itemgetter('mem')
+# (pid, name) snapshot of a process row for the terminate paths
+_PID_NAME = itemgetter('pid', 'name')
+
+# Delay before a Sort By change re-sorts the table, so rapid changes coalesce
+SORT_MODE_DEBOUNCE_MS = 150
+
+# Lines kept in the on-page action log
+LOG_MAX_BLOCKS = 2000
+
+# Coalescing delay for on-page log writes
+LOG_FLUSH_MS = 30
+
+# Upper bound on parallel terminate() calls when killing selected processes
+KILL_MAX_WORKERS = 16
+
+# kernel32 for the auto-terminate fast path (Windows only)
+if sys.platform.startswith("win"):
+    import ctypes
+    from ctypes import wintypes
+
+    PROCESS_TERMINATE = 0x0001
+    _K32 = ctypes.WinDLL("kernel32", use_last_error=True)
+    _K32.OpenProcess.argtypes = (wintypes.DWORD, wintypes.BOOL, wintypes.DWORD)
+    _K32.OpenProcess.restype = wintypes.HANDLE
+    _K32.TerminateProcess.argtypes = (wintypes.HANDLE, wintypes.UINT)
+    _K32.TerminateProcess.restype = wintypes.BOOL
+    _K32.CloseHandle.argtypes = (wintypes.HANDLE,)
+    _K32.CloseHandle.restype = wintypes.BOOL
+else:
+    _K32 = None
 
-class ProcWorker(QThread):
-    update_signal = Signal(list)  # Emits list of process dicts
 
-    def __init__(self, sort_mode="MEM", parent=None):
+def _fast_kill(pid):
+    """
+    OpenProcess(PROCESS_TERMINATE) + TerminateProcess with no psutil bookkeeping.
+    Returns False on any failure so the caller can retry through psutil for a proper error.
+    """
+    handle = _K32.OpenProcess(PROCESS_TERMINATE, False, pid)
+    if not handle:
+        return False
+    try:
+        return bool(_K32.TerminateProcess(handle, 1))
+    finally:
+        _K32.CloseHandle(handle)
+
+
+def kill_process(pid, name, proc=None, fast=False):
+    """
+    Terminate a single PID. Runs on a pool thread, so it only touches psutil
+    and returns (result, pid, name, error) for the caller to log.
+    An already-built psutil.Process can be passed to skip opening a new one.
+    With fast=True on Windows the raw WinAPI call is tried first; psutil only
+    runs when that fails, to classify the failure.
+    """
+    if fast and _K32 is not None and _fast_kill(pid):
+        return "killed", pid, name, None
+    try:
+        if proc is None:
+            proc = psutil.Process(pid)
+        proc.terminate()
+        return "killed", pid, name, None
+    except psutil.NoSuchProcess:
+        return "not_found", pid, name, None
+    except psutil.AccessDenied:
+        return "access_denied", pid, name, None
+    except Exception as e:
+        return "error", pid, name, e
+
+
+class ProcWorker(QObject):
+    """
+    Scans processes on a single-shot QTimer inside its own QThread.
+    The next scan is scheduled relative to how long the last one took, so a slow
+    scan on a loaded machine shortens the wait instead of piling up on a fixed sleep.
+    """
+    # Emits (added, updated, removed) relative to the previous scan:
+    # {pid: proc dict}, {pid: proc dict}, {pid, ...}. Typed as object: PySide6 cannot
+    # marshal int-keyed dicts or sets as QVariant across the queued connection.
+    update_signal = Signal(object, object, object)
+
+    # Auto-terminate runs in this thread: the page emits terminate_requested with
+    # [(pid, name), ...] and gets (terminated, failed, log lines) back in batches.
+    terminate_requested = Signal(list)
+    terminate_progress = Signal(int, int, str)
+    TERMINATE_PROGRESS_EVERY = 32
+
+    SCAN_INTERVAL_MS = 2000
+    MIN_INTERVAL_MS = 500
+
+    def __init__(self, term_pool, parent=None):
         super().__init__(parent)
-        self.sort_mode = sort_mode
         self.running = True
-        GlobalLogger.append(f"[MemoryCleanerWorker] Initialized with sort_mode={sort_mode}", is_internal=True)
-
-    def run(self):
+        self._timer = None
+        self._term_pool = term_pool
+        # Queued: emitted from the GUI thread, handled once this object lives in the worker thread
+        self.terminate_requested.connect(self.terminate_processes)
+        # pid -> (cpu, mem, status) as last emitted
+        self._prev = {}
+        # pid -> psutil.Process reused across scans
+        self._proc_cache = {}
+        GlobalLogger.append("[MemoryCleanerWorker] Initialized.", is_internal=True)
+
+    @Slot()
+    def start(self):
+        """
+        Runs in the worker thread once it has started (connected to QThread.started).
+        """
         GlobalLogger.append("[MemoryCleanerWorker] Thread started.", is_internal=True)
-        while self.running:
-            procs_list = []
-            for p in psutil.process_iter(['pid', 'name', 'username', 'memory_info', 'cpu_percent', 'exe', 'status']):
-                if not self.running:
-                    break
-                try:
-                    info = p.info
-                    pid = info['pid']
-                    name = info['name'] or ""
-                    exe_path = info['exe'] or ""
-                    status = info['status'] or ""
-                    user = info['username'] or "N/A"
-                    mem_mb = info['memory_info'].rss / (1024 * 1024)
-
-                    if not name or not exe_path or pid in (0, 4) or status == psutil.STATUS_ZOMBIE:
-                        continue
-
-                    name_lower = name.lower()
-                    exe_lower = os.path.basename(exe_path).lower()
-
-                    # Skip critical processes
-                    if (
-                        name_lower in CRITICAL_PROCESSES
-                        or exe_lower in CRITICAL_PROCESSES
-                        or (
-                            info['username'] and "system" in info['username'].lower()
-                            and info['memory_info'].rss < 5 * 1024 * 1024
-                        )
-                    ):
-                        continue
-
-                    # Use the CPU percent directly
-                    cpu_percent = p.cpu_percent(interval=None)
-                    if mem_mb < 0.5 and cpu_percent < 0.1:
-                        continue
-
-                    desc = NAME_DESC_MAP.get(name_lower, NAME_DESC_MAP.get(exe_lower, "No description available."))
-
-                    procs_list.append({
-                        'pid': pid,
-                        'name': name,
-                        'cpu': cpu_percent,
-                        'mem': mem_mb,
-                        'user': user,
-                        'status': status,
-                        'desc': desc
-                    })
-                except (psutil.NoSuchProcess, psutil.AccessDenied):
-                    continue
-                except Exception as e:
-                    GlobalLogger.append(f"[MemoryCleanerWorker] Error iterating PID {getattr(p, 'pid', 'N/A')}: {e}", is_error=True)
-                    continue
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.timeout.connect(self.scan)
+
+        # Prime cpu_percent(interval=None): the first call per process always returns 0.0,
+        # so do one non-emitting pass and report real values on the next one.
+        self._collect_processes()
+        if self.running:
+            self._timer.start(self.MIN_INTERVAL_MS)
+
+    @Slot()
+    def scan(self):
+        if not self.running:
+            return
+        started = time.monotonic()
+
+        procs_list = self._collect_processes()
+        if not self.running:
+            return
 
+        # Only ship what changed since the last scan; the table model keeps the rest
+        prev = self._prev
+        current = {}
+        added, updated = {}, {}
+        for proc in procs_list:
+            pid = proc['pid']
+            state = (proc['cpu'], proc['mem'], proc['status'])
+            current[pid] = state
+            old_state = prev.get(pid)
+            if old_state is None:
+                added[pid] = proc
+            elif old_state != state:
+                updated[pid] = proc
+        removed = prev.keys() - current.keys()
+        self._prev = current
+
+        if self.running:
+            if added or updated or removed:
+                self.update_signal.emit(added, updated, removed)
+            elapsed_ms = int((time.monotonic() - started) * 1000)
+            self._timer.start(max(self.MIN_INTERVAL_MS, self.SCAN_INTERVAL_MS - elapsed_ms))
+
+    def _collect_processes(self):
+        procs_list = []
+        crit = CRITICAL_PROCESSES
+
+        # Keep psutil.Process objects (and their cpu_percent baselines) across scans
+        # instead of constructing a new one per PID per cycle; drop PIDs that went away.
+        pids = psutil.pids()
+        cache = self._proc_cache
+        for dead_pid in cache.keys() - set(pids):
+            del cache[dead_pid]
+
+        for pid in pids:
             if not self.running:
                 break
+            # Cheapest rejection first: idle/System PIDs
+            if pid < 5:
+                continue
+            try:
+                p = cache.get(pid)
+                if p is None:
+                    p = cache[pid] = psutil.Process(pid)
 
-            # Sort
-            if self.sort_mode == "CPU":
-                procs_list.sort(key=lambda x: x['cpu'], reverse=True)
-            else:
-                procs_list.sort(key=lambda x: x['mem'], reverse=True)
+                proc = filter_process(p, crit)
+                if proc is not None:
+                    procs_list.append(proc)
+            except psutil.NoSuchProcess:
+                cache.pop(pid, None)
+                continue
+            except psutil.AccessDenied:
+                continue
+            except Exception as e:
+                GlobalLogger.append(f"[MemoryCleanerWorker] Error iterating PID {pid}: {e}", is_error=True)
+                continue
 
-            if self.running:
-                self.update_signal.emit(procs_list)
+        return procs_list
 
-            time.sleep(2.0)
+    @Slot(list)
+    def terminate_processes(self, rows):
+        """
+        Terminate (pid, name) pairs on the terminate pool, reporting progress every
+        TERMINATE_PROGRESS_EVERY results so the GUI thread only handles a few signals.
+        """
+        # Bulk kills go straight to TerminateProcess; the Process objects the scanner
+        # already holds back the psutil fallback that classifies failures.
+        cache = self._proc_cache
+        futures = [
+            self._term_pool.submit(kill_process, pid, name, cache.get(pid), True)
+            for pid, name in rows
+        ]
 
-        GlobalLogger.append("[MemoryCleanerWorker] Thread stopped.", is_internal=True)
+        term_count, fail_count = 0, 0
+        log_lines = []
+        for done, future in enumerate(as_completed(futures), 1):
+            result, pid, name, error = future.result()
+            if result == "killed":
+                term_count += 1
+                log_lines.append(f"[*] Auto-terminated PID {pid} ({name}).")
+                GlobalLogger.append(f"[MemoryCleanerPage] Auto-terminated PID {pid} ({name}).")
+            else:
+                fail_count += 1
+                if result == "error":
+                    GlobalLogger.append(f"[MemoryCleanerPage] Error auto-terminating PID {pid}: {error}", is_error=True)
+            if done % self.TERMINATE_PROGRESS_EVERY == 0 and log_lines:
+                self.terminate_progress.emit(term_count, fail_count, "\n".join(log_lines))
+                log_lines = []
+
+        msg = f"[*] Auto-terminate finished. Terminated: {term_count}, Failed/Skipped: {fail_count}."
+        log_lines.append(msg)
+        self.terminate_progress.emit(term_count, fail_count, "\n".join(log_lines))
+        GlobalLogger.append(f"[MemoryCleanerPage] {msg}", is_internal=True)
 
     def stop(self):
+        """
+        Thread-safe: the flag is checked between processes and before each scan.
+        The owning QThread's event loop must be quit separately.
+        """
         self.running = False
         GlobalLogger.append("[MemoryCleanerWorker] Stop requested.", is_internal=True)
 
 
+class ProcessTableModel(QAbstractTableModel):
+    """
+    Table model over the plain list of process dicts emitted by ProcWorker.
+    Cell text is produced on demand in data(), so only visible rows are formatted.
+    Checkbox state for the "Kill?" column is kept as a set of PIDs so it survives
+    list refreshes and re-sorting.
+    """
+    HEADERS = ["Kill?", "PID", "Name", "CPU (%)", "Memory (MB)", "User", "Status"]
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._rows = []
+        self._checked_pids = set()
+        # Rows are ordered by the page's Memory/CPU mode (descending)
+        self._mode_key = _MEM_KEY
+        # pid -> (cpu, mem, pid_text, cpu_text, mem_text); the view asks for the same
+        # cells on every repaint/scroll, so only reformat when the values change
+        self._fmt_cache = {}
+
+    # --- QAbstractTableModel interface ---
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.HEADERS)
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if orientation == Qt.Horizontal and role == Qt.DisplayRole:
+            return self.HEADERS[section]
+        return None
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        proc = self._rows[index.row()]
+        col = index.column()
+
+        if role == Qt.DisplayRole:
+            if col == 1:
+                return self._formatted(proc)[2]
+            if col == 2:
+                return proc['name']
+            if col == 3:
+                return self._formatted(proc)[3]
+            if col == 4:
+                return self._formatted(proc)[4]
+            if col == 5:
+                return proc['user']
+            if col == 6:
+                return proc['status']
+        elif role == Qt.CheckStateRole and col == 0:
+            return Qt.Checked if proc['pid'] in self._checked_pids else Qt.Unchecked
+        elif role == Qt.TextAlignmentRole and col in (3, 4):
+            return int(Qt.AlignRight | Qt.AlignVCenter)
+        elif role == Qt.ToolTipRole and col == 2:
+            return describe_process(proc)
+        return None
+
+    def setData(self, index, value, role=Qt.EditRole):
+        if not index.isValid() or index.column() != 0 or role != Qt.CheckStateRole:
+            return False
+        pid = self._rows[index.row()]['pid']
+        if Qt.CheckState(value) == Qt.Checked:
+            self._checked_pids.add(pid)
+        else:
+            self._checked_pids.discard(pid)
+        self.dataChanged.emit(index, index, [Qt.CheckStateRole])
+        return True
+
+    def flags(self, index):
+        if not index.isValid():
+            return Qt.NoItemFlags
+        flags = Qt.ItemIsEnabled | Qt.ItemIsSelectable
+        if index.column() == 0:
+            flags |= Qt.ItemIsUserCheckable
+        return flags
+
+    # --- Helpers used by ProcessManagerPage ---
+    def set_mode_key(self, key):
+        """
+        Set the Memory/CPU ordering and re-sort the rows.
+        """
+        self._mode_key = key
+        self._relayout()
+
+    def apply_delta(self, added, updated, removed):
+        """
+        Apply one worker delta: remove vanished PIDs, update changed rows in place,
+        append new ones, then restore the sort order. Only touched rows are signalled.
+        """
+        if removed:
+            self._checked_pids -= removed
+            for pid in removed:
+                self._fmt_cache.pop(pid, None)
+            doomed = [row for row, p in enumerate(self._rows) if p['pid'] in removed]
+            # Remove contiguous runs from the bottom up so earlier row numbers stay valid
+            while doomed:
+                last = doomed.pop()
+                first = last
+                while doomed and doomed[-1] == first - 1:
+                    first = doomed.pop()
+                self.beginRemoveRows(QModelIndex(), first, last)
+                del self._rows[first:last + 1]
+                self.endRemoveRows()
+
+        if updated:
+            first = last = None
+            for row, proc in enumerate(self._rows):
+                new_proc = updated.get(proc['pid'])
+                if new_proc is not None:
+                    self._rows[row] = new_proc
+                    if first is None:
+                        first = row
+                    last = row
+            if first is not None:
+                self.dataChanged.emit(self.index(first, 1), self.index(last, len(self.HEADERS) - 1))
+
+        if added:
+            start = len(self._rows)
+            self.beginInsertRows(QModelIndex(), start, start + len(added) - 1)
+            self._rows.extend(added.values())
+            self.endInsertRows()
+
+        self._relayout()
+
+    def process_at(self, row):
+        return self._rows[row]
+
+    def processes(self):
+        return self._rows
+
+    def checked_processes(self):
+        return [p for p in self._rows if p['pid'] in self._checked_pids]
+
+    def all_checked(self):
+        return bool(self._rows) and len(self._checked_pids) == len(self._rows)
+
+    def set_all_checked(self, checked):
+        if checked:
+            self._checked_pids = {p['pid'] for p in self._rows}
+        else:
+            self._checked_pids.clear()
+        if self._rows:
+            self.dataChanged.emit(self.index(0, 0), self.index(len(self._rows) - 1, 0), [Qt.CheckStateRole])
+
+    def _formatted(self, proc):
+        pid, cpu, mem = proc['pid'], proc['cpu'], proc['mem']
+        cached = self._fmt_cache.get(pid)
+        if cached is None or cached[0] != cpu or cached[1] != mem:
+            pid_text = cached[2] if cached is not None else str(pid)
+            cached = (cpu, mem, pid_text, f"{cpu:.1f}", f"{mem:.2f}")
+            self._fmt_cache[pid] = cached
+        return cached
+
+    def _relayout(self):
+        """
+        Re-sort the rows, keeping persistent indexes (selection, current item) on the same PIDs.
+        """
+        new_rows = sorted(self._rows, key=self._mode_key, reverse=True)
+        if all(a is b for a, b in zip(new_rows, self._rows)):
+            return
+        self.layoutAboutToBeChanged.emit()
+        old_pids = [p['pid'] for p in self._rows]
+        self._rows = new_rows
+        new_row_by_pid = {p['pid']: row for row, p in enumerate(new_rows)}
+        for old_index in self.persistentIndexList():
+            new_row = new_row_by_pid[old_pids[old_index.row()]]
+            self.changePersistentIndex(old_index, self.index(new_row, old_index.column()))
+        self.layoutChanged.emit()
+
+
+# Dark theme for the Memory Cleaner page; built once, shared by every instance
+PAGE_STYLESHEET = """
+    QWidget { background-color: #1E1E2F; color: #E0E0E0; font-family: "Segoe UI", sans-serif; }
+    QLabel { color: #E0E0E0; }
+    QPushButton {
+        font-size: 14px; color: #FFFFFF; border-radius: 5px; padding: 8px 12px; min-height: 36px; font-weight: 500;
+    }
+    QPushButton#selectAllBtn { background-color: #5E5EFF; }
+    QPushButton#selectAllBtn:hover { background-color: #4A4AFF; }
+    QPushButton#killBtn { background-color: #FF5E5E; }
+    QPushButton#killBtn:hover { background-color: #E04A4A; }
+    QPushButton#saveBtn { background-color: #17A2B8; }
+    QPushButton#saveBtn:hover { background-color: #117A8B; }
+    QComboBox {
+        font-size: 14px; padding: 6px; border: 1px solid #44444F; border-radius: 4px;
+        background-color: #2A2A3E; color: #E0E0E0;
+    }
+    QTableView {
+        background-color: #2A2A3E; color: #E0E0E0; gridline-color: #44444F;
+        font-size: 13px; border: none;
+    }
+    QHeaderView::section {
+        background-color: #3A3A3A; color: #FFFFFF; padding: 4px; font-weight: bold;
+    }
+    QTableView::item:selected {
+        background-color: #4A4AFF; color: #FFFFFF;
+    }
+    QPlainTextEdit#logArea {
+        background-color: #2A2A3E; border: 1px solid #44444F; color: #E0E0E0;
+        font-family: Consolas, monospace; font-size: 12px; padding: 6px;
+    }
+    QMenu { background-color: #2A2A3E; color: #E0E0E0; }
+    QMenu::item:selected { background-color: #4A4AFF; }
+"""
+
+
 class ProcessManagerPage(QWidget):
     """
     Modern dark-themed "Memory Cleaner" page:
@@ -234,49 +597,16 @@ class ProcessManagerPage(QWidget):
       - Logs all actions to both on-page log and GlobalLogger
     """
 
+    # Carries each finished Kill Selected future back to the GUI thread
+    kill_finished = Signal(object)
+
     def __init__(self, main_window_instance=None):
         super().__init__()
         self.main_window = main_window_instance
         GlobalLogger.append("[MemoryCleanerPage] Initializing.", is_internal=True)
 
-        # Will store latest processes data for saving
-        self.last_processes_data = []
-
         # Dark theme for the page
-        self.setStyleSheet("""
-            QWidget { background-color: #1E1E2F; color: #E0E0E0; font-family: "Segoe UI", sans-serif; }
-            QLabel { color: #E0E0E0; }
-            QPushButton {
-                font-size: 14px; color: #FFFFFF; border-radius: 5px; padding: 8px 12px; min-height: 36px; font-weight: 500;
-            }
-            QPushButton#selectAllBtn { background-color: #5E5EFF; }
-            QPushButton#selectAllBtn:hover { background-color: #4A4AFF; }
-            QPushButton#killBtn { background-color: #FF5E5E; }
-            QPushButton#killBtn:hover { background-color: #E04A4A; }
-            QPushButton#saveBtn { background-color: #17A2B8; }
-            QPushButton#saveBtn:hover { background-color: #117A8B; }
-            QComboBox {
-                font-size: 14px; padding: 6px; border: 1px solid #44444F; border-radius: 4px;
-                background-color: #2A2A3E; color: #E0E0E0;
-            }
-            QTableWidget {
-                background-color: #2A2A3E; color: #E0E0E0; gridline-color: #44444F;
-                font-size: 13px; border: none;
-            }
-            QHeaderView::section {
-                background-color: #3A3A3A; color: #FFFFFF; padding: 4px; font-weight: bold;
-            }
-            QTableWidget::item:selected {
-                background-color: #4A4AFF; color: #FFFFFF;
-            }
-            QCheckBox { color: #E0E0E0; }
-            QTextEdit#logArea {
-                background-color: #2A2A3E; border: 1px solid #44444F; color: #E0E0E0;
-                font-family: Consolas, monospace; font-size: 12px; padding: 6px;
-            }
-            QMenu { background-color: #2A2A3E; color: #E0E0E0; }
-            QMenu::item:selected { background-color: #4A4AFF; }
-        """)
+        self.setStyleSheet(PAGE_STYLESHEET)
 
         layout = QVBoxLayout(self)
         layout.setContentsMargins(20, 20, 20, 20)
@@ -295,15 +625,23 @@ class ProcessManagerPage(QWidget):
         self.mode_combo = QComboBox()
         self.mode_combo.addItems(["Memory Usage", "CPU Usage"])
         self.mode_combo.setCurrentText("Memory Usage")
-        self.mode_combo.currentTextChanged.connect(self.change_sort_mode)
+        # Scrolling through the combo fires once per step; only re-sort for where it settles
+        self.sort_mode_timer = QTimer(self)
+        self.sort_mode_timer.setSingleShot(True)
+        self.sort_mode_timer.setInterval(SORT_MODE_DEBOUNCE_MS)
+        self.sort_mode_timer.timeout.connect(lambda: self.change_sort_mode(self.mode_combo.currentText()))
+        self.mode_combo.currentTextChanged.connect(self.sort_mode_timer.start)
         mode_layout.addWidget(mode_label)
         mode_layout.addWidget(self.mode_combo)
         mode_layout.addStretch()
         layout.addLayout(mode_layout)
 
         # Table: Kill?, PID, Name, CPU, Memory, User, Status
-        self.table = QTableWidget(0, 7)
-        self.table.setHorizontalHeaderLabels(["Kill?", "PID", "Name", "CPU (%)", "Memory (MB)", "User", "Status"])
+        self.process_model = ProcessTableModel(self)
+        self.table = QTableView()
+        self.table.setModel(self.process_model)
+        self.table.setSelectionBehavior(QAbstractItemView.SelectRows)
+        self.table.verticalHeader().setVisible(False)
         header = self.table.horizontalHeader()
         header.setSectionResizeMode(0, QHeaderView.ResizeToContents)
         header.setSectionResizeMode(1, QHeaderView.ResizeToContents)
@@ -343,33 +681,64 @@ class ProcessManagerPage(QWidget):
         log_label = QLabel("Action Log:")
         log_label.setFont(QFont("Segoe UI", 14, QFont.Bold))
         layout.addWidget(log_label)
-        self.log_text_edit = QTextEdit()
+        self.log_text_edit = QPlainTextEdit()
         self.log_text_edit.setObjectName("logArea")
         self.log_text_edit.setReadOnly(True)
         self.log_text_edit.setFixedHeight(120)
+        # Bound the on-page log; older lines drop off instead of growing forever
+        self.log_text_edit.setMaximumBlockCount(LOG_MAX_BLOCKS)
+        self.log_text_edit.setCenterOnScroll(False)
+
+        # Log lines are buffered and written to the widget in one append per flush
+        # Bounded like the widget itself, so a burst the GUI cannot flush yet
+        # evicts the oldest lines instead of growing the buffer
+        self._log_buf = deque(maxlen=LOG_MAX_BLOCKS)
+        # Cursor kept at the end of the document for inserting flushed chunks
+        self._log_cursor = QTextCursor(self.log_text_edit.document())
+        self._log_cursor.movePosition(QTextCursor.End)
+        self._log_flush = QTimer(self)
+        self._log_flush.setSingleShot(True)
+        self._log_flush.setInterval(LOG_FLUSH_MS)
+        self._log_flush.timeout.connect(self._flush_log)
         layout.addWidget(self.log_text_edit)
 
+
+        # Shared pool for terminate() calls (kill selected / auto-terminate)
+        self._term_pool = ThreadPoolExecutor(max_workers=KILL_MAX_WORKERS, thread_name_prefix="term")
+        # Kill Selected results still outstanding, and the tallies for its summary
+        self._kill_pending = 0
+        self._kill_counts = {}
+        self.kill_finished.connect(self._on_kill_finished)
+
         # Start worker thread
-        self.worker_thread = ProcWorker(sort_mode="MEM", parent=self)
-        self.worker_thread.update_signal.connect(self.populate_table_data)
+        self.worker = ProcWorker(self._term_pool)
+        self.worker_thread = QThread(self)
+        self.worker.moveToThread(self.worker_thread)
+        self.worker_thread.started.connect(self.worker.start)
+        self.worker_thread.finished.connect(self.worker.deleteLater)
+        self.worker.update_signal.connect(self.populate_table_data)
+        self.worker.terminate_progress.connect(self.on_terminate_progress)
         self.worker_thread.start()
 
+    @property
+    def last_processes_data(self):
+        """
+        Latest process rows for saving: the model's own list, not a per-refresh copy.
+        Rows are replaced (never mutated) when the worker reports changes.
+        """
+        return self.process_model.processes()
+
     def open_table_context_menu(self, position):
         """
         Context menu: copy PID/Name or kill single process.
         """
-        selected_items = self.table.selectedItems()
-        if not selected_items:
+        selected_rows = self.table.selectionModel().selectedRows()
+        if not selected_rows:
             return
 
-        row = selected_items[0].row()
-        pid_item = self.table.item(row, 1)
-        name_item = self.table.item(row, 2)
-        if not pid_item or not name_item:
-            return
-
-        pid_val = pid_item.text()
-        name_val = name_item.text()
+        proc = self.process_model.process_at(selected_rows[0].row())
+        pid_val = str(proc['pid'])
+        name_val = proc['name']
 
         menu = QMenu(self)
         copy_pid_action = QAction(f"Copy PID: {pid_val}", self)
@@ -392,10 +761,10 @@ class ProcessManagerPage(QWidget):
         try:
             clipboard = QApplication.clipboard()
             clipboard.setText(text)
-            self.log_text_edit.append(f"[*] {item_type} '{text}' copied to clipboard.")
+            self._log(f"[*] {item_type} '{text}' copied to clipboard.")
             GlobalLogger.append(f"[MemoryCleanerPage] Copied {item_type} '{text}' to clipboard.")
         except Exception as e:
-            self.log_text_edit.append(f"[-] Error copying {item_type} to clipboard: {e}")
+            self._log(f"[-] Error copying {item_type} to clipboard: {e}")
             GlobalLogger.append(f"[MemoryCleanerPage] Error copying {item_type} to clipboard: {e}", is_error=True)
 
     def kill_single_process_from_menu(self, pid, name):
@@ -409,152 +778,65 @@ class ProcessManagerPage(QWidget):
             try:
                 p = psutil.Process(pid)
                 p.terminate()
-                self.log_text_edit.append(f"[*] Terminated PID {pid} ({name}).")
+                self._log(f"[*] Terminated PID {pid} ({name}).")
                 GlobalLogger.append(f"[MemoryCleanerPage] Terminated PID {pid} ({name}).")
             except psutil.NoSuchProcess:
-                self.log_text_edit.append(f"[*] PID {pid} ({name}) no longer exists.")
+                self._log(f"[*] PID {pid} ({name}) no longer exists.")
                 GlobalLogger.append(f"[MemoryCleanerPage] PID {pid} ({name}) not found when killing.")
             except psutil.AccessDenied:
-                self.log_text_edit.append(f"[-] Access denied for PID {pid} ({name}).")
+                self._log(f"[-] Access denied for PID {pid} ({name}).")
                 GlobalLogger.append(f"[MemoryCleanerPage] Access denied terminating PID {pid} ({name}).", is_error=True)
                 QMessageBox.warning(self, "Access Denied", f"Could not terminate {name} (PID: {pid}). Run as admin?")
             except Exception as e:
-                self.log_text_edit.append(f"[-] Error terminating PID {pid} ({name}): {e}")
+                self._log(f"[-] Error terminating PID {pid} ({name}): {e}")
                 GlobalLogger.append(f"[MemoryCleanerPage] Error terminating PID {pid} ({name}): {e}", is_error=True)
 
     def change_sort_mode(self, text):
         mode = "CPU" if text == "CPU Usage" else "MEM"
-        if self.worker_thread:
-            self.worker_thread.sort_mode = mode
+        if self.process_model:
+            self.process_model.set_mode_key(_CPU_KEY if mode == "CPU" else _MEM_KEY)
             GlobalLogger.append(f"[MemoryCleanerPage] Sort mode changed to {mode}.", is_internal=True)
-            self.log_text_edit.append(f"[*] Sorting by {text}.")
+            self._log(f"[*] Sorting by {text}.")
 
-    def populate_table_data(self, processes_data):
+    def populate_table_data(self, added, updated, removed):
         """
-        Update table rows with the latest process data and store it for saving.
+        Apply the worker's latest delta to the table model.
+        Selection follows its PIDs through the model's persistent indexes.
         """
-        # Store latest data
-        self.last_processes_data = processes_data.copy()
-
-        # Preserve checked PIDs and selected row indices
-        checked_pids = set()
-        selected_rows = {idx.row() for idx in self.table.selectedIndexes()}
-
-        for row in range(self.table.rowCount()):
-            widget = self.table.cellWidget(row, 0)
-            pid_item = self.table.item(row, 1)
-            if widget and pid_item:
-                chk = widget.findChild(QCheckBox)
-                if chk and chk.isChecked():
-                    try:
-                        checked_pids.add(int(pid_item.text()))
-                    except ValueError:
-                        pass
-
-        # Clear table
-        self.table.setSortingEnabled(False)
-        self.table.setRowCount(0)
-
-        restored_rows = []
-
-        for i, proc in enumerate(processes_data):
-            self.table.insertRow(i)
-
-            # Checkbox cell
-            chk = QCheckBox()
-            if proc['pid'] in checked_pids:
-                chk.setChecked(True)
-            container = QWidget()
-            layout = QHBoxLayout(container)
-            layout.addWidget(chk)
-            layout.setAlignment(Qt.AlignCenter)
-            layout.setContentsMargins(0, 0, 0, 0)
-            self.table.setCellWidget(i, 0, container)
-
-            # PID
-            pid_item = QTableWidgetItem(str(proc['pid']))
-            pid_item.setFlags(pid_item.flags() & ~Qt.ItemIsEditable)
-            self.table.setItem(i, 1, pid_item)
-
-            # Name (with tooltip = description)
-            name_item = QTableWidgetItem(proc['name'])
-            name_item.setToolTip(proc['desc'])
-            name_item.setFlags(name_item.flags() & ~Qt.ItemIsEditable)
-            self.table.setItem(i, 2, name_item)
-
-            # CPU
-            cpu_item = QTableWidgetItem(f"{proc['cpu']:.1f}")
-            cpu_item.setTextAlignment(Qt.AlignRight | Qt.AlignVCenter)
-            cpu_item.setFlags(cpu_item.flags() & ~Qt.ItemIsEditable)
-            self.table.setItem(i, 3, cpu_item)
-
-            # Memory
-            mem_item = QTableWidgetItem(f"{proc['mem']:.2f}")
-            mem_item.setTextAlignment(Qt.AlignRight | Qt.AlignVCenter)
-            mem_item.setFlags(mem_item.flags() & ~Qt.ItemIsEditable)
-            self.table.setItem(i, 4, mem_item)
-
-            # User
-            user_item = QTableWidgetItem(proc['user'])
-            user_item.setFlags(user_item.flags() & ~Qt.ItemIsEditable)
-            self.table.setItem(i, 5, user_item)
-
-            # Status
-            status_item = QTableWidgetItem(proc['status'])
-            status_item.setFlags(status_item.flags() & ~Qt.ItemIsEditable)
-            self.table.setItem(i, 6, status_item)
-
-            if i in selected_rows:
-                restored_rows.append(i)
-
-        # Restore selection
-        for row_idx in restored_rows:
-            self.table.selectRow(row_idx)
-
-        self.table.setSortingEnabled(True)
+        # A delta can emit several remove/insert/dataChanged/layoutChanged signals;
+        # suspend painting so the view and header repaint once at the end.
+        # (Model signals stay connected: QTableView needs them to track rows.)
+        header = self.table.horizontalHeader()
+        self.table.setUpdatesEnabled(False)
+        header.setUpdatesEnabled(False)
+        try:
+            self.process_model.apply_delta(added, updated, removed)
+        finally:
+            header.setUpdatesEnabled(True)
+            self.table.setUpdatesEnabled(True)
 
     def toggle_select_all(self):
         GlobalLogger.append("[MemoryCleanerPage] Select/Deselect All clicked.", is_internal=True)
-        select_all = False
-        for row in range(self.table.rowCount()):
-            container = self.table.cellWidget(row, 0)
-            if container:
-                chk = container.findChild(QCheckBox)
-                if chk and not chk.isChecked():
-                    select_all = True
-                    break
-
-        for row in range(self.table.rowCount()):
-            container = self.table.cellWidget(row, 0)
-            if container:
-                chk = container.findChild(QCheckBox)
-                if chk:
-                    chk.setChecked(select_all)
-
-        self.log_text_edit.append(f"[*] {'Selected' if select_all else 'Deselected'} all processes.")
+        select_all = not self.process_model.all_checked()
+        # One dataChanged for the whole checkbox column; repaint once afterwards
+        self.table.setUpdatesEnabled(False)
+        try:
+            self.process_model.set_all_checked(select_all)
+        finally:
+            self.table.setUpdatesEnabled(True)
+        self._log(f"[*] {'Selected' if select_all else 'Deselected'} all processes.")
 
     def kill_selected_processes(self):
         GlobalLogger.append("[MemoryCleanerPage] Kill Selected Processes clicked.", is_internal=True)
-        to_kill = []
-        for row in range(self.table.rowCount()):
-            container = self.table.cellWidget(row, 0)
-            if container:
-                chk = container.findChild(QCheckBox)
-                if chk and chk.isChecked():
-                    try:
-                        pid = int(self.table.item(row, 1).text())
-                        name = self.table.item(row, 2).text()
-                        to_kill.append({'pid': pid, 'name': name})
-                    except Exception as e:
-                        GlobalLogger.append(f"[MemoryCleanerPage] Error reading row {row}: {e}", is_error=True)
+        to_kill = list(map(_PID_NAME, self.process_model.checked_processes()))
 
         if not to_kill:
             QMessageBox.information(self, "Kill Processes", "No processes selected.")
-            self.log_text_edit.append("[*] No processes selected to terminate.")
+            self._log("[*] No processes selected to terminate.")
             GlobalLogger.append("[MemoryCleanerPage] No selected processes to kill.", is_internal=True)
             return
 
-        sample = ", ".join([p['name'] for p in to_kill[:3]])
+        sample = ", ".join([name for _, name in to_kill[:3]])
         if len(to_kill) > 3:
             sample += "..."
 
@@ -564,35 +846,51 @@ class ProcessManagerPage(QWidget):
             QMessageBox.Yes | QMessageBox.No, QMessageBox.No
         )
         if confirm != QMessageBox.Yes:
-            self.log_text_edit.append("[*] Termination cancelled by user.")
+            self._log("[*] Termination cancelled by user.")
             GlobalLogger.append("[MemoryCleanerPage] Termination cancelled.", is_internal=True)
             return
 
-        killed, failed, not_found = 0, 0, 0
-        for proc in to_kill:
-            pid, name = proc['pid'], proc['name']
-            try:
-                p = psutil.Process(pid)
-                p.terminate()
-                killed += 1
-                self.log_text_edit.append(f"[*] Terminated PID {pid} ({name}).")
-                GlobalLogger.append(f"[MemoryCleanerPage] Terminated PID {pid} ({name}).")
-            except psutil.NoSuchProcess:
-                not_found += 1
-                self.log_text_edit.append(f"[*] PID {pid} ({name}) not found.")
-                GlobalLogger.append(f"[MemoryCleanerPage] PID {pid} ({name}) not found.", is_internal=True)
-            except psutil.AccessDenied:
-                failed += 1
-                self.log_text_edit.append(f"[-] Access denied for PID {pid} ({name}).")
-                GlobalLogger.append(f"[MemoryCleanerPage] Access denied terminating PID {pid} ({name}).", is_error=True)
-            except Exception as e:
-                failed += 1
-                self.log_text_edit.append(f"[-] Error terminating PID {pid} ({name}): {e}")
-                GlobalLogger.append(f"[MemoryCleanerPage] Error terminating PID {pid} ({name}): {e}", is_error=True)
+        # Opening a handle and terminating is kernel-bound, so run the PIDs in parallel;
+        # each result comes back via kill_finished and is logged on the GUI thread
+        self.kill_selected_btn.setEnabled(False)
+        self._kill_pending = len(to_kill)
+        self._kill_counts = {"killed": 0, "failed": 0, "not_found": 0}
+        for pid, name in to_kill:
+            future = self._term_pool.submit(kill_process, pid, name)
+            future.add_done_callback(self.kill_finished.emit)
+
+    @Slot(object)
+    def _on_kill_finished(self, future):
+        try:
+            result, pid, name, error = future.result()
+        except Exception as e:
+            result, pid, name, error = "error", "?", "?", e
+        if result == "killed":
+            self._kill_counts["killed"] += 1
+            self._log(f"[*] Terminated PID {pid} ({name}).")
+            GlobalLogger.append(f"[MemoryCleanerPage] Terminated PID {pid} ({name}).")
+        elif result == "not_found":
+            self._kill_counts["not_found"] += 1
+            self._log(f"[*] PID {pid} ({name}) not found.")
+            GlobalLogger.append(f"[MemoryCleanerPage] PID {pid} ({name}) not found.", is_internal=True)
+        elif result == "access_denied":
+            self._kill_counts["failed"] += 1
+            self._log(f"[-] Access denied for PID {pid} ({name}).")
+            GlobalLogger.append(f"[MemoryCleanerPage] Access denied terminating PID {pid} ({name}).", is_error=True)
+        else:
+            self._kill_counts["failed"] += 1
+            self._log(f"[-] Error terminating PID {pid} ({name}): {error}")
+            GlobalLogger.append(f"[MemoryCleanerPage] Error terminating PID {pid} ({name}): {error}", is_error=True)
 
-        summary = f"[*] Summary – Terminated: {killed}, Failed: {failed}, Not Found: {not_found}."
-        self.log_text_edit.append(summary)
+        self._kill_pending -= 1
+        if self._kill_pending:
+            return
+        counts = self._kill_counts
+        summary = (f"[*] Summary – Terminated: {counts['killed']}, Failed: {counts['failed']}, "
+                   f"Not Found: {counts['not_found']}.")
+        self._log(summary)
         GlobalLogger.append(f"[MemoryCleanerPage] {summary}", is_internal=True)
+        self.kill_selected_btn.setEnabled(True)
 
     def save_process_list_to_file(self):
         """
@@ -601,7 +899,7 @@ class ProcessManagerPage(QWidget):
         GlobalLogger.append("[MemoryCleanerPage] Save Process List clicked.", is_internal=True)
         if not self.last_processes_data:
             QMessageBox.information(self, "Save Process List", "No process data available to save.")
-            self.log_text_edit.append("[*] No process data available to save.")
+            self._log("[*] No process data available to save.")
             GlobalLogger.append("[MemoryCleanerPage] Attempted to save with no data.", is_internal=True)
             return
 
@@ -610,11 +908,11 @@ class ProcessManagerPage(QWidget):
             procs.append({
                 "pid": proc['pid'],
                 "name": proc['name'],
-                "cpu": f"{proc['cpu']:.1f}",
-                "mem": f"{proc['mem']:.2f}",
+                "cpu": round(proc['cpu'], 1),
+                "mem": round(proc['mem'], 2),
                 "user": proc['user'],
                 "status": proc['status'],
-                "desc": proc['desc']
+                "desc": describe_process(proc)
             })
 
         if getattr(sys, "frozen", False):
@@ -624,56 +922,81 @@ class ProcessManagerPage(QWidget):
         file_path = os.path.join(base_dir, "memory_cleaner_process_list.json")
 
         try:
-            with open(file_path, "w", encoding="utf-8") as f:
-                json.dump(procs, f, indent=4)
-            self.log_text_edit.append(f"[*] Process list saved to: {file_path}")
+            if orjson is not None:
+                Path(file_path).write_bytes(orjson.dumps(procs, option=orjson.OPT_INDENT_2))
+            else:
+                Path(file_path).write_text(json.dumps(procs, indent=2), encoding="utf-8")
+            self._log(f"[*] Process list saved to: {file_path}")
             GlobalLogger.append(f"[MemoryCleanerPage] Saved process list to {file_path}.")
             QMessageBox.information(self, "Save Successful", f"List saved to:\n{file_path}")
         except Exception as e:
-            self.log_text_edit.append(f"[-] Error saving process list: {e}")
+            self._log(f"[-] Error saving process list: {e}")
             GlobalLogger.append(f"[MemoryCleanerPage] Error saving process list: {e}", is_error=True)
             QMessageBox.critical(self, "Save Error", f"Could not save list:\n{e}")
 
     def disable_non_critical(self):
         """
         Auto-terminate non-critical processes (called by Dashboard).
+        Only the (pid, name) snapshot is taken here; the worker thread does the terminating.
         """
         GlobalLogger.append("[MemoryCleanerPage] Auto-terminate non-critical initiated.", is_internal=True)
-        self.log_text_edit.append("[*] Auto-terminating non-critical processes...")
+        self._log("[*] Auto-terminating non-critical processes...")
 
-        term_count, fail_count = 0, 0
-        for row in range(self.table.rowCount()):
-            try:
-                pid = int(self.table.item(row, 1).text())
-                name = self.table.item(row, 2).text()
-                p = psutil.Process(pid)
-                p.terminate()
-                term_count += 1
-                self.log_text_edit.append(f"[*] Auto-terminated PID {pid} ({name}).")
-                GlobalLogger.append(f"[MemoryCleanerPage] Auto-terminated PID {pid} ({name}).")
-            except (psutil.NoSuchProcess, psutil.AccessDenied, psutil.ZombieProcess):
-                fail_count += 1
-            except Exception as e:
-                fail_count += 1
-                GlobalLogger.append(f"[MemoryCleanerPage] Error auto-terminating PID {pid}: {e}", is_error=True)
+        rows = list(map(_PID_NAME, self.process_model.processes()))
+        self.worker.terminate_requested.emit(rows)
 
-        msg = f"[*] Auto-terminate finished. Terminated: {term_count}, Failed/Skipped: {fail_count}."
-        self.log_text_edit.append(msg)
-        GlobalLogger.append(f"[MemoryCleanerPage] {msg}", is_internal=True)
+    def on_terminate_progress(self, term_count, fail_count, text):
+        """
+        Auto-terminate progress from the worker thread.
+        """
+        self._log(text)
+
+    def _log(self, message):
+        """
+        Queue a line for the on-page log; bursts are coalesced into one append.
+        """
+        self._log_buf.append(message)
+        if not self._log_flush.isActive():
+            self._log_flush.start()
+
+    def _flush_log(self):
+        # Nobody sees a hidden page: leave the (bounded) buffer for showEvent
+        if not self.isVisible():
+            return
+        if self._log_buf:
+            text = "\n".join(self._log_buf)
+            self._log_buf.clear()
+            cursor = self._log_cursor
+            cursor.movePosition(QTextCursor.End)
+            if not cursor.atStart():
+                text = "\n" + text
+            cursor.insertText(text)
+            scroll_bar = self.log_text_edit.verticalScrollBar()
+            scroll_bar.setValue(scroll_bar.maximum())
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        self._flush_log()
 
     def shutdown(self):
         """
-        Called on app exit: stop the worker thread cleanly.
+        Called on app exit: stop the worker thread cleanly and release the terminate pool.
         """
         GlobalLogger.append("[MemoryCleanerPage] Shutdown initiated.", is_internal=True)
         if hasattr(self, 'worker_thread') and self.worker_thread.isRunning():
-            self.worker_thread.stop()
+            self.worker.stop()
+            self.worker_thread.quit()
             if not self.worker_thread.wait(3000):
                 GlobalLogger.append("[MemoryCleanerPage] Worker did not stop; force terminating.", is_error=True)
                 self.worker_thread.terminate()
                 self.worker_thread.wait()
             else:
                 GlobalLogger.append("[MemoryCleanerPage] Worker stopped gracefully.", is_internal=True)
+        if hasattr(self, '_term_pool'):
+            self._term_pool.shutdown(wait=False, cancel_futures=True)
+        if hasattr(self, '_log_flush'):
+            self._log_flush.stop()
+            self._flush_log()
         GlobalLogger.append("[MemoryCleanerPage] Shutdown complete.", is_internal=True)
 
 
@@ -1,32 +1,186 @@
 # roblox_tweaks_ui.py
 
-import subprocess
 import os
+import subprocess
 import sys
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+
+import psutil
 
 from PySide6.QtWidgets import (
     QWidget,
     QVBoxLayout,
     QLabel,
     QPushButton,
-    QTextEdit,
+    QPlainTextEdit,
     QFrame,
     QSizePolicy,
     QHBoxLayout,
     QMessageBox
 )
-from PySide6.QtCore import Qt
-from PySide6.QtGui import QFont
+from PySide6.QtCore import Qt, QTimer, Signal, Slot
+from PySide6.QtGui import QFont, QTextCursor
 
 from visual_tweaks_and_logs import GlobalLogger
 from utils.path_utils import resource_path  # For bundling the FPS Unlocker executable
 
-# On Windows, hide console windows when starting subprocesses
+# Hide console windows on Windows
 if sys.platform.startswith("win"):
     CREATE_NO_WINDOW = 0x08000000
 else:
     CREATE_NO_WINDOW = 0
 
+# Coalescing delay for log box writes
+LOG_FLUSH_MS = 30
+
+# Lines kept in the log box
+LOG_MAX_BLOCKS = 2000
+
+# Bundled FPS Unlocker, relative to the resource root
+FPS_UNLOCKER_RELATIVE_PATH = os.path.join("resources", "rbxfpsunlocker", "rbxfpsunlocker.exe")
+
+# Image name of the running FPS Unlocker
+FPS_UNLOCKER_PROCESS_NAME = "rbxfpsunlocker.exe"
+
+
+@lru_cache(maxsize=1)
+def _resolve_fps_exe():
+    return resource_path(FPS_UNLOCKER_RELATIVE_PATH)
+
+
+def terminate_by_name(process_name, skip_pid=None):
+    """
+    Terminate every process whose image name matches process_name (except skip_pid).
+    Returns (killed count, list of error strings for matches that could not be stopped).
+    """
+    target = process_name.lower()
+    killed = 0
+    errors = []
+    for p in psutil.process_iter(['name']):
+        name = p.info['name']
+        if not name or name.lower() != target or p.pid == skip_pid:
+            continue
+        try:
+            p.terminate()
+            killed += 1
+        except psutil.NoSuchProcess:
+            pass  # Exited on its own
+        except psutil.Error as e:
+            errors.append(f"PID {p.pid}: {e}")
+    return killed, errors
+
+
+def _is_fps_unlocker_pid(pid):
+    """
+    True if pid is still a running FPS Unlocker (and not a reused PID).
+    """
+    try:
+        name = psutil.Process(pid).name()
+    except psutil.Error:
+        return False
+    return name.lower() == FPS_UNLOCKER_PROCESS_NAME.lower()
+
+
+def terminate_pid(pid, process_name):
+    """
+    Terminate the process with this PID if it is still process_name.
+    Returns (killed count, list of error strings), like terminate_by_name.
+    """
+    try:
+        p = psutil.Process(pid)
+        if p.name().lower() != process_name.lower():
+            return 0, []  # Exited, and the PID was reused
+        p.terminate()
+        return 1, []
+    except psutil.NoSuchProcess:
+        return 0, []  # Exited on its own
+    except psutil.Error as e:
+        return 0, [f"PID {pid}: {e}"]
+
+
+def stop_fps_unlocker(pid=None):
+    """
+    Stop the FPS Unlocker: pid first (if this page launched one), then, on Windows,
+    any other instance by image name. Returns (killed count, list of error strings).
+    """
+    killed, errors = terminate_pid(pid, FPS_UNLOCKER_PROCESS_NAME) if pid is not None else (0, [])
+    if sys.platform.startswith("win"):
+        more_killed, more_errors = terminate_by_name(FPS_UNLOCKER_PROCESS_NAME, skip_pid=pid)
+        killed += more_killed
+        errors += more_errors
+    return killed, errors
+
+
+# Dark theme for the Roblox Tweaks page; built once, shared by every instance
+PAGE_STYLESHEET = """
+    QWidget {
+        background-color: #1E1E2F;  /* Dark background */
+        font-family: "Segoe UI", sans-serif;
+    }
+    QLabel#pageTitle {
+        font-size: 24px;
+        font-weight: bold;
+        color: #FFFFFF;
+        margin-bottom: 15px;
+    }
+    QLabel#sectionTitle {
+        font-size: 18px;
+        font-weight: 600;
+        color: #CFCFDF;
+        margin-bottom: 12px;
+    }
+    QLabel#comingSoonLabel {
+        font-size: 16px;
+        font-style: italic;
+        color: #AAAAAA;
+        margin-top: 20px;
+    }
+    QPlainTextEdit#logBox {
+        background-color: #2A2A3E;
+        color: #EEEEEE;
+        border: 1px solid #44444F;
+        border-radius: 5px;
+        font-family: Consolas, monospace;
+        font-size: 13px;
+    }
+    QFrame#contentFrame {
+        background-color: #2A2A3E;
+        border: 1px solid #44444F;
+        border-radius: 8px;
+    }
+    QPushButton {
+        font-size: 14px;
+        padding: 8px 16px;
+        border-radius: 5px;
+        font-weight: 500;
+        min-width: 180px;
+        color: #FFFFFF;
+    }
+    QPushButton#unlockBtn {
+        background-color: #28A745;
+        border: 1px solid #1E7E34;
+    }
+    QPushButton#unlockBtn:hover {
+        background-color: #218838;
+    }
+    QPushButton#unlockBtn:pressed {
+        background-color: #1E7E34;
+    }
+    QPushButton#stopBtn {
+        background-color: #DC3545;
+        border: 1px solid #C82333;
+    }
+    QPushButton#stopBtn:hover {
+        background-color: #C82333;
+    }
+    QPushButton#stopBtn:pressed {
+        background-color: #A71D2A;
+    }
+"""
+
 
 class RobloxTweaksPage(QWidget):
     """
@@ -39,77 +193,24 @@ class RobloxTweaksPage(QWidget):
       - All existing logic and logging preserved
     """
 
+    # Carries the finished stop future back to the GUI thread
+    kill_finished = Signal(object)
+    # Carries (pid, exit code) of a launched FPS Unlocker back to the GUI thread
+    fps_exited = Signal(object)
+
     def __init__(self, main_window_instance=None):
         super().__init__()
         self.main_window = main_window_instance
         GlobalLogger.append("[RobloxTweaksPage] Initializing.", is_internal=True)
 
+        # Resolve the FPS Unlocker once; existence is re-checked only after a miss or failed launch
+        self._fps_exe_path = _resolve_fps_exe()
+        self._fps_exe_exists = os.path.isfile(self._fps_exe_path)
+        # PID of the FPS Unlocker started from this page; it outlives the app
+        self._fps_pid = None
+
         # ─── Overall Page Styling ─────────────────────────────────────────────────
-        self.setStyleSheet("""
-            QWidget {
-                background-color: #1E1E2F;  /* Dark background */
-                font-family: "Segoe UI", sans-serif;
-            }
-            QLabel#pageTitle {
-                font-size: 24px;
-                font-weight: bold;
-                color: #FFFFFF;
-                margin-bottom: 15px;
-            }
-            QLabel#sectionTitle {
-                font-size: 18px;
-                font-weight: 600;
-                color: #CFCFDF;
-                margin-bottom: 12px;
-            }
-            QLabel#comingSoonLabel {
-                font-size: 16px;
-                font-style: italic;
-                color: #AAAAAA;
-                margin-top: 20px;
-            }
-            QTextEdit#logBox {
-                background-color: #2A2A3E;
-                color: #EEEEEE;
-                border: 1px solid #44444F;
-                border-radius: 5px;
-                font-family: Consolas, monospace;
-                font-size: 13px;
-            }
-            QFrame#contentFrame {
-                background-color: #2A2A3E;
-                border: 1px solid #44444F;
-                border-radius: 8px;
-            }
-            QPushButton {
-                font-size: 14px;
-                padding: 8px 16px;
-                border-radius: 5px;
-                font-weight: 500;
-                min-width: 180px;
-                color: #FFFFFF;
-            }
-            QPushButton#unlockBtn {
-                background-color: #28A745;
-                border: 1px solid #1E7E34;
-            }
-            QPushButton#unlockBtn:hover {
-                background-color: #218838;
-            }
-            QPushButton#unlockBtn:pressed {
-                background-color: #1E7E34;
-            }
-            QPushButton#stopBtn {
-                background-color: #DC3545;
-                border: 1px solid #C82333;
-            }
-            QPushButton#stopBtn:hover {
-                background-color: #C82333;
-            }
-            QPushButton#stopBtn:pressed {
-                background-color: #A71D2A;
-            }
-        """)
+        self.setStyleSheet(PAGE_STYLESHEET)
 
         # ─── Main Layout ─────────────────────────────────────────────────────────────
         main_layout = QVBoxLayout(self)
@@ -134,12 +235,31 @@ class RobloxTweaksPage(QWidget):
         content_layout.addWidget(section_title, alignment=Qt.AlignLeft)
 
         # Log Box (read-only)
-        self.log_box = QTextEdit()
+        self.log_box = QPlainTextEdit()
         self.log_box.setObjectName("logBox")
         self.log_box.setReadOnly(True)
         self.log_box.setFixedHeight(100)
+        # Bound the log; older lines drop off instead of growing forever
+        self.log_box.setMaximumBlockCount(LOG_MAX_BLOCKS)
+        self.log_box.setCenterOnScroll(False)
         content_layout.addWidget(self.log_box)
 
+        # Log lines are buffered and written to the box in one append per flush
+        # Capped at what the box can show; oldest lines fall off if flushes lag
+        self._log_buf = deque(maxlen=LOG_MAX_BLOCKS)
+        # Cursor kept at the end of the document for inserting flushed chunks
+        self._log_cursor = QTextCursor(self.log_box.document())
+        self._log_cursor.movePosition(QTextCursor.End)
+        self._log_flush = QTimer(self)
+        self._log_flush.setSingleShot(True)
+        self._log_flush.setInterval(LOG_FLUSH_MS)
+        self._log_flush.timeout.connect(self._flush_log)
+
+        # Stop requests run here so the GUI thread never waits on process enumeration
+        self._kill_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="fpskill")
+        self.kill_finished.connect(self._on_kill_finished)
+        self.fps_exited.connect(self._on_fps_exited)
+
         # Buttons (side by side)
         buttons_layout = QHBoxLayout()
         buttons_layout.setSpacing(15)
@@ -174,30 +294,47 @@ class RobloxTweaksPage(QWidget):
     def launch_fps_unlocker_action(self):
         GlobalLogger.append("[RobloxTweaksPage] 'Unlock Roblox FPS' button clicked.")
 
-        # Determine the bundled executable path via resource_path
-        relative_exe_path = os.path.join("resources", "rbxfpsunlocker", "rbxfpsunlocker.exe")
-        exe_abs_path = resource_path(relative_exe_path)
+        if self._fps_pid is not None and _is_fps_unlocker_pid(self._fps_pid):
+            self._notify("info", "[*] FPS Unlocker is already running.")
+            return
+        self._fps_pid = None
+
+        # Bundled executable path, resolved once in __init__
+        relative_exe_path = FPS_UNLOCKER_RELATIVE_PATH
+        exe_abs_path = self._fps_exe_path
         GlobalLogger.append(f"[RobloxTweaksPage] Resolved FPS Unlocker path: {exe_abs_path}")
 
-        if exe_abs_path and os.path.isfile(exe_abs_path):
+        if not self._fps_exe_exists:
+            # It may have been restored since the last check
+            self._fps_exe_exists = os.path.isfile(exe_abs_path)
+
+        if self._fps_exe_exists:
             try:
-                # Launch the FPS Unlocker silently (Windows only)
-                subprocess.Popen(
+                # Launch the FPS Unlocker silently; its output is never read
+                proc = subprocess.Popen(
                     [exe_abs_path],
-                    creationflags=CREATE_NO_WINDOW if sys.platform.startswith("win") else 0
+                    stdin=subprocess.DEVNULL,
+                    stdout=subprocess.DEVNULL,
+                    stderr=subprocess.DEVNULL,
+                    creationflags=CREATE_NO_WINDOW
                 )
-                success_msg = "[+] FPS Unlocker started successfully."
-                GlobalLogger.append(f"[RobloxTweaksPage] {success_msg}")
-                self.log_box.append(success_msg)
-            except Exception as ex:
-                err_msg = f"[-] Failed to launch FPS Unlocker: {ex}"
-                GlobalLogger.append(f"[RobloxTweaksPage] {err_msg}", is_error=True)
-                self.log_box.append(err_msg)
-                QMessageBox.critical(
-                    self,
-                    "Launch Error",
-                    f"Could not start FPS Unlocker.\nPath: {exe_abs_path}\nError: {ex}"
+            except OSError as ex:
+                self._fps_exe_exists = os.path.isfile(exe_abs_path)
+                self._notify(
+                    "critical",
+                    f"[-] Failed to launch FPS Unlocker: {ex}",
+                    title="Launch Error",
+                    details=f"Could not start FPS Unlocker.\nPath: {exe_abs_path}\nError: {ex}"
                 )
+                return
+            self._fps_pid = proc.pid
+            # Daemon thread, so it neither keeps the app alive nor stops the unlocker on exit
+            threading.Thread(
+                target=lambda: self.fps_exited.emit((proc.pid, proc.wait())),
+                name="fpswatch",
+                daemon=True
+            ).start()
+            self._notify("success", "[+] FPS Unlocker started successfully.")
         else:
             not_found_msg = (
                 f"[-] FPS Unlocker executable NOT FOUND.\n"
@@ -205,76 +342,102 @@ class RobloxTweaksPage(QWidget):
                 f"Relative path: {relative_exe_path}\n"
                 f"Ensure it's included in 'resources/rbxfpsunlocker/'."
             )
-            GlobalLogger.append(f"[RobloxTweaksPage] {not_found_msg}", is_error=True)
-            self.log_box.append(not_found_msg)
-            QMessageBox.warning(
-                self,
-                "File Not Found",
-                not_found_msg
-            )
+            self._notify("warning", not_found_msg, title="File Not Found")
 
     def terminate_fps_unlocker_action(self):
         GlobalLogger.append("[RobloxTweaksPage] 'Stop FPS Unlocker' button clicked.")
 
-        process_name = "rbxfpsunlocker.exe"
-        if not sys.platform.startswith("win"):
-            msg = "[-] Stopping FPS Unlocker by process name is supported only on Windows."
-            GlobalLogger.append(f"[RobloxTweaksPage] {msg}", is_error=True)
-            self.log_box.append(msg)
-            QMessageBox.information(
-                self,
-                "Platform Support",
-                "Terminating by process name is implemented on Windows only."
-            )
+        pid, self._fps_pid = self._fps_pid, None
+        if pid is None and not sys.platform.startswith("win"):
+            # Nothing the user can do about it, so no dialog
+            self._notify("error", "[-] Stopping FPS Unlocker by process name is supported only on Windows.")
             return
 
+        # Stop our instance and any others off the GUI thread; the result comes back via kill_finished
+        self.stop_btn.setEnabled(False)
+        future = self._kill_pool.submit(stop_fps_unlocker, pid)
+        future.add_done_callback(self.kill_finished.emit)
+
+    @Slot(object)
+    def _on_fps_exited(self, result):
+        pid, code = result
+        if pid == self._fps_pid:
+            self._fps_pid = None
+        self._notify("info", f"[*] FPS Unlocker (PID {pid}) exited with code {code}.")
+
+    @Slot(object)
+    def _on_kill_finished(self, future):
+        self.stop_btn.setEnabled(True)
+        process_name = FPS_UNLOCKER_PROCESS_NAME
         try:
-            # Use taskkill on Windows to stop the process
-            result = subprocess.run(
-                ["taskkill", "/F", "/IM", process_name],
-                capture_output=True,
-                text=True,
-                creationflags=CREATE_NO_WINDOW,
-                check=False
-            )
+            killed, errors = future.result()
 
-            if result.returncode == 0:
-                success_msg = f"[+] FPS Unlocker ({process_name}) terminated successfully."
-                GlobalLogger.append(f"[RobloxTweaksPage] {success_msg}")
-                self.log_box.append(success_msg)
-            elif result.returncode == 128 or "not found" in result.stdout.lower() or "not found" in result.stderr.lower():
-                not_running_msg = f"[*] FPS Unlocker ({process_name}) was not found running."
-                GlobalLogger.append(f"[RobloxTweaksPage] {not_running_msg}", is_internal=True)
-                self.log_box.append(not_running_msg)
-            else:
-                err_details = result.stderr.strip() or result.stdout.strip() or f"Exit code {result.returncode}"
-                err_msg = f"[-] Failed to stop FPS Unlocker. Details: {err_details}"
-                GlobalLogger.append(f"[RobloxTweaksPage] {err_msg}", is_error=True)
-                self.log_box.append(err_msg)
-                QMessageBox.warning(
-                    self,
-                    "Termination Error",
-                    f"Could not stop {process_name}.\nDetails: {err_details}"
+            if killed:
+                self._notify("success", f"[+] FPS Unlocker ({process_name}) terminated successfully.")
+            elif not errors:
+                self._notify("info", f"[*] FPS Unlocker ({process_name}) was not found running.")
+            if errors:
+                err_details = "; ".join(errors)
+                self._notify(
+                    "warning",
+                    f"[-] Failed to stop FPS Unlocker. Details: {err_details}",
+                    title="Termination Error",
+                    details=f"Could not stop {process_name}.\nDetails: {err_details}"
                 )
-        except FileNotFoundError:
-            critical_err_msg = "[-] 'taskkill' command not found on this system."
-            GlobalLogger.append(f"[RobloxTweaksPage] {critical_err_msg}", is_error=True)
-            self.log_box.append(critical_err_msg)
-            QMessageBox.critical(
-                self,
-                "System Error",
-                critical_err_msg
-            )
         except Exception as ex:
-            unexpected_err_msg = f"[-] Unexpected error while stopping FPS Unlocker: {ex}"
-            GlobalLogger.append(f"[RobloxTweaksPage] {unexpected_err_msg}", is_error=True)
-            self.log_box.append(unexpected_err_msg)
-            QMessageBox.critical(
-                self,
-                "Unexpected Error",
-                unexpected_err_msg
+            self._notify(
+                "critical",
+                f"[-] Unexpected error while stopping FPS Unlocker: {ex}",
+                title="Unexpected Error"
             )
 
+    def _notify(self, level, message, title=None, details=None):
+        """
+        Report an outcome to GlobalLogger and the log box.
+        Only "warning" and "critical" open a modal box (showing details if given);
+        "success", "info" and "error" stay in the log so the event loop keeps running.
+        """
+        GlobalLogger.append(
+            f"[RobloxTweaksPage] {message}",
+            is_error=level in ("error", "warning", "critical"),
+            is_internal=level == "info"
+        )
+        self._log(message)
+        if level == "warning":
+            QMessageBox.warning(self, title, details or message)
+        elif level == "critical":
+            QMessageBox.critical(self, title, details or message)
+
+    def _log(self, message):
+        """
+        Queue a line for the log box; bursts are coalesced into one append.
+        """
+        self._log_buf.append(message)
+        if not self._log_flush.isActive():
+            self._log_flush.start()
+
+    def _flush_log(self):
+        # Nobody sees a hidden page: leave the (bounded) buffer for showEvent
+        if not self.isVisible():
+            return
+        if self._log_buf:
+            text = "\n".join(self._log_buf)
+            self._log_buf.clear()
+            cursor = self._log_cursor
+            cursor.movePosition(QTextCursor.End)
+            if not cursor.atStart():
+                text = "\n" + text
+            cursor.insertText(text)
+            scroll_bar = self.log_box.verticalScrollBar()
+            scroll_bar.setValue(scroll_bar.maximum())
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        self._flush_log()
+
     def shutdown(self):
         GlobalLogger.append("[RobloxTweaksPage] Shutdown.", is_internal=True)
-        # No cleanup needed, since FPS Unlocker runs as a detached process
+        # The FPS Unlocker is left running; only its exit watcher (a daemon thread) goes away
+        self._log_flush.stop()
+        self._flush_log()
+        self._kill_pool.shutdown(wait=False, cancel_futures=True)
@@ -4,40 +4,312 @@ import os
 import sys
 import json
 import subprocess  # For DNS restore
-import platform
 import re
+import functools
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from pathlib import Path
+
+# Optional: faster JSON for profile files; falls back to json
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QLabel, QCheckBox, QComboBox,
     QPushButton, QHBoxLayout, QListWidget, QLineEdit,
-    QMessageBox, QTextEdit, QApplication, QSpacerItem, QSizePolicy,
+    QMessageBox, QPlainTextEdit, QApplication, QSpacerItem, QSizePolicy,
     QFrame, QScrollArea
 )
-from PySide6.QtCore import QSettings, Qt
-from PySide6.QtGui import QFont, QFontDatabase
+from PySide6.QtCore import QObject, QSettings, QThread, QTimer, Qt, Signal, Slot
+from PySide6.QtGui import QFont, QFontDatabase, QTextCursor
 
 from visual_tweaks_and_logs import GlobalLogger
 from utils.path_utils import app_data_path
 
-from roblox_tweaks_ui import RobloxTweaksPage as RTPageForRestore
-from os_tweaks_ui import OSTweaksPage as OSTweaksPageForRestore
+from roblox_tweaks_ui import terminate_by_name, FPS_UNLOCKER_PROCESS_NAME
+from os_tweaks_ui import restore_os_settings
 from tcp_optimizer_ui import restore_settings as restore_tcp_settings_backup
 from tcp_optimizer_ui import BACKUP_FILE as TCP_BACKUP_FILE
 
 SETTINGS_FILE = app_data_path('settings.ini')
 PROFILES_DIR = app_data_path('profiles')
 
-# Load and register the Audiowide font
-def load_custom_font():
-    font_path = os.path.join("resources", "fonts", "Audiowide", "Audiowide-Regular.ttf")
-    if os.path.exists(font_path):
-        font_id = QFontDatabase.addApplicationFont(font_path)
+# General settings stored in SETTINGS_FILE, with their defaults
+GENERAL_SETTINGS_DEFAULTS = {
+    "run_on_startup": False,
+    "run_as_admin": True,
+    "auto_optimize_on_launch": False,
+}
+
+# Characters Windows does not allow in file names
+INVALID_PROFILE_NAME_RE = re.compile(r'[\\/:*?"<>|]')
+
+# `netsh interface show interface` rows for connected adapters, and its column separator
+IFACE_LINE_RE = re.compile(r"^\s*Enabled\s+Connected", re.IGNORECASE)
+IFACE_SPLIT_RE = re.compile(r"\s{2,}")
+
+# Lines kept in the log viewer; older lines are dropped from the widget, not the file
+LOG_VIEWER_MAX_BLOCKS = 1000
+
+# Evaluated once at import; the restore steps only consult this flag
+_IS_WINDOWS = os.name == "nt"
+
+# Refresh requests arriving within this window are coalesced into a single log read
+LOG_REFRESH_DEBOUNCE_MS = 100
+
+# Bundled Audiowide font, resolved next to this module rather than the working directory
+FONT_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "resources", "fonts", "Audiowide", "Audiowide-Regular.ttf")
+
+# Load and register the Audiowide font on first use; QFontDatabase needs a QApplication,
+# so importing this module stays cheap and later pages reuse the resolved family name.
+@functools.cache
+def get_custom_font():
+    if os.path.isfile(FONT_PATH):
+        font_id = QFontDatabase.addApplicationFont(FONT_PATH)
         if font_id != -1:
             return QFontDatabase.applicationFontFamilies(font_id)[0]
     return "Segoe UI"  # Fallback to Segoe UI if font loading fails
 
-# Get the custom font family name
-CUSTOM_FONT = load_custom_font()
+# Dark theme for the Settings page; {font} is filled in once by get_page_stylesheet()
+PAGE_STYLESHEET = """
+    QWidget {{
+        background-color: #1E1E2F;
+        color: #E0E0E0;
+        font-family: "{font}", sans-serif;
+    }}
+    QLabel#pageTitle {{
+        font-size: 24px;
+        font-weight: bold;
+        margin-bottom: 15px;
+        color: #FFFFFF;
+    }}
+    QLabel.sectionTitle {{
+        font-size: 18px;
+        font-weight: bold;
+        margin-top: 20px;
+        margin-bottom: 8px;
+        color: #CFCFDF;
+    }}
+    QCheckBox {{
+        font-size: 14px;
+        spacing: 6px;
+    }}
+    QCheckBox::indicator {{
+        width: 18px;
+        height: 18px;
+    }}
+    QCheckBox::indicator:unchecked {{
+        border: 1px solid #666;
+        background: #2A2A3E;
+        border-radius: 3px;
+    }}
+    QCheckBox::indicator:checked {{
+        background: #5E5EFF;
+        border: 1px solid #5E5EFF;
+        border-radius: 3px;
+    }}
+    QComboBox, QLineEdit, QListWidget {{
+        background-color: #2A2A3E;
+        color: #E0E0E0;
+        border: 1px solid #44444F;
+        border-radius: 5px;
+        padding: 5px 10px;
+        font-size: 14px;
+    }}
+    QComboBox:hover, QLineEdit:hover, QListWidget:hover {{
+        border: 1px solid #5E5EFF;
+    }}
+    QPushButton {{
+        font-size: 14px;
+        color: #FFFFFF;
+        padding: 10px 18px;
+        border-radius: 6px;
+        font-weight: 500;
+        min-height: 40px;
+        background-color: #5E5EFF;
+        border: 1px solid #4A4AFF;
+    }}
+    QPushButton:hover {{
+        background-color: #4A4AFF;
+    }}
+    QPushButton:pressed {{
+        background-color: #3A3AE6;
+    }}
+    QPushButton:disabled {{
+        background-color: #3e3e5e;
+        color: #AAAAAA;
+        border-color: #3e3e5e;
+    }}
+    QPushButton#restoreAllBtn {{
+        background-color: #FF5E5E;
+        border: 1px solid #E04A4A;
+        font-weight: bold;
+    }}
+    QPushButton#restoreAllBtn:hover {{
+        background-color: #E04A4A;
+    }}
+    QPlainTextEdit#logViewer {{
+        background-color: #2A2A3E;
+        color: #E0E0E0;
+        border: 1px solid #44444F;
+        border-radius: 5px;
+        font-family: Consolas, monospace;
+        font-size: 12px;
+        padding: 8px;
+    }}
+    QFrame#restoreFrame {{
+        background-color: #2A2A3E;
+        border: 2px solid #FF5E5E;
+        border-radius: 8px;
+        margin-top: 25px;
+        padding: 18px;
+    }}
+    QLabel#restoreTitle {{
+        font-size: 20px;
+        font-weight: bold;
+        color: #FF5E5E;
+        margin-bottom: 12px;
+        qproperty-alignment: AlignCenter;
+    }}
+    QLabel#restoreInfoLabel {{
+        font-size: 13px;
+        color: #E0E0E0;
+        line-height: 1.4;
+    }}
+    QScrollArea {{
+        border: none;
+        background-color: transparent;
+    }}
+"""
+
+# Page stylesheet with the custom font substituted; formatted on first use and then shared
+@functools.cache
+def get_page_stylesheet():
+    return PAGE_STYLESHEET.format(font=get_custom_font())
+
+
+def restore_fps_unlocker_step():
+    """
+    Full restore step: stop any running FPS Unlocker. Returns a summary line.
+    """
+    try:
+        killed, errors = terminate_by_name(FPS_UNLOCKER_PROCESS_NAME)
+        if errors:
+            return f"- Roblox FPS Unlocker: Could not stop every instance ({'; '.join(errors)})."
+        if killed:
+            return f"- Roblox FPS Unlocker: Terminated ({killed} process(es))."
+        return "- Roblox FPS Unlocker: Not running."
+    except Exception as e_fps:
+        GlobalLogger.append(f"[RestoreDefaults] Error terminating FPS Unlocker: {e_fps}", is_error=True)
+        return f"- Roblox FPS Unlocker: Error during termination ({e_fps})."
+
+
+def restore_os_tweaks_step():
+    """
+    Full restore step: revert the OS tweaks. Returns a summary line.
+    """
+    try:
+        os_results = restore_os_settings()
+        return f"- OS Tweaks: {'; '.join(os_results)}."
+    except Exception as e_os:
+        GlobalLogger.append(f"[RestoreDefaults] Error initiating OS Tweaks restoration: {e_os}", is_error=True)
+        return f"- OS Tweaks: Error initiating restoration ({e_os})."
+
+
+def restore_dns_step():
+    """
+    Full restore step: put every connected interface back on DHCP DNS (Windows only).
+    Returns a summary line.
+    """
+    if not _IS_WINDOWS:
+        return "- DNS: Restore to DHCP is Windows-specific, skipped."
+    try:
+        # Parse the adapter table as netsh writes it instead of buffering the whole output
+        restored_dns_ifaces = []
+        with subprocess.Popen(
+            ["netsh", "interface", "show", "interface"],
+            stdout=subprocess.PIPE,
+            creationflags=0x08000000,
+            encoding='utf-8',
+            errors='ignore'
+        ) as proc:
+            for line in proc.stdout:
+                if IFACE_LINE_RE.match(line):
+                    parts = IFACE_SPLIT_RE.split(line.strip())
+                    if len(parts) >= 3:
+                        iface_name = parts[-1]
+                        if iface_name:
+                            restored_dns_ifaces.append(iface_name)
+        if proc.returncode:
+            raise subprocess.CalledProcessError(proc.returncode, proc.args)
+        if restored_dns_ifaces:
+            # One netsh session reads every reset from stdin instead of two launches per interface
+            netsh_script = "".join(
+                f'interface ipv4 set dns name="{iface_name}" source=dhcp\n'
+                f'interface ipv6 set dns name="{iface_name}" source=dhcp\n'
+                for iface_name in restored_dns_ifaces
+            )
+            subprocess.run(
+                ["netsh"],
+                input=netsh_script + "exit\n",
+                text=True,
+                capture_output=True,
+                check=False,
+                creationflags=0x08000000
+            )
+        return f"- DNS: Restored to DHCP for interfaces: {', '.join(restored_dns_ifaces) if restored_dns_ifaces else 'No active interfaces found'}."
+    except Exception as e_dns:
+        GlobalLogger.append(f"[RestoreDefaults] DNS restore error: {e_dns}", is_error=True)
+        return f"- DNS: Failed to restore to DHCP: {e_dns}"
+
+
+def restore_tcp_step():
+    """
+    Full restore step: restore TCP settings from backup or Windows defaults. Returns a summary line.
+    """
+    try:
+        tcp_restore_logs = restore_tcp_settings_backup()
+        GlobalLogger.append(f"[RestoreDefaults] TCP settings restore attempt logs:\n{tcp_restore_logs}")
+        return "- TCP Settings: Restoration to backup/defaults attempted."
+    except Exception as e_tcp:
+        GlobalLogger.append(f"[RestoreDefaults] Error restoring TCP settings: {e_tcp}", is_error=True)
+        return f"- TCP Settings: Error during restore attempt ({e_tcp})."
+
+
+# System restore steps run in parallel by "Perform Full Restore"; summary lines keep this order
+RESTORE_STEPS = (
+    restore_fps_unlocker_step,
+    restore_os_tweaks_step,
+    restore_dns_step,
+    restore_tcp_step,
+)
+
+
+class RestoreWorker(QObject):
+    """
+    Runs RESTORE_STEPS side by side inside its own QThread.
+    Each summary line is emitted through progress as its step finishes; finished carries
+    all of them in RESTORE_STEPS order once the last step has reported back.
+    """
+    progress = Signal(str)
+    finished = Signal(list)
+
+    @Slot()
+    def run(self):
+        results = [None] * len(RESTORE_STEPS)
+        with ThreadPoolExecutor(max_workers=len(RESTORE_STEPS), thread_name_prefix="restore") as pool:
+            futures = {pool.submit(step): index for index, step in enumerate(RESTORE_STEPS)}
+            for future in as_completed(futures):
+                try:
+                    line = future.result()
+                except Exception as e_step:
+                    line = f"- Restore step failed: {e_step}"
+                    GlobalLogger.append(f"[RestoreDefaults] Restore step failed: {e_step}", is_error=True)
+                results[futures[future]] = line
+                self.progress.emit(line)
+        self.finished.emit(results)
+
 
 class SettingsPage(QWidget):
     """
@@ -58,119 +330,15 @@ class SettingsPage(QWidget):
 
         # QSettings for persistent settings
         self.settings_handler = QSettings(SETTINGS_FILE, QSettings.Format.IniFormat)
+        # Read the general settings once; later reads and change checks use this copy
+        self._settings_cache = {
+            key: self.settings_handler.value(key, default, type=bool)
+            for key, default in GENERAL_SETTINGS_DEFAULTS.items()
+        }
 
         # ---------- Overall Page Style ----------
         # Dark background and light text, consistent with modern UI
-        self.setStyleSheet(f"""
-            QWidget {{
-                background-color: #1E1E2F;
-                color: #E0E0E0;
-                font-family: "{CUSTOM_FONT}", sans-serif;
-            }}
-            QLabel#pageTitle {{
-                font-size: 24px;
-                font-weight: bold;
-                margin-bottom: 15px;
-                color: #FFFFFF;
-            }}
-            QLabel.sectionTitle {{
-                font-size: 18px;
-                font-weight: bold;
-                margin-top: 20px;
-                margin-bottom: 8px;
-                color: #CFCFDF;
-            }}
-            QCheckBox {{
-                font-size: 14px;
-                spacing: 6px;
-            }}
-            QCheckBox::indicator {{
-                width: 18px;
-                height: 18px;
-            }}
-            QCheckBox::indicator:unchecked {{
-                border: 1px solid #666;
-                background: #2A2A3E;
-                border-radius: 3px;
-            }}
-            QCheckBox::indicator:checked {{
-                background: #5E5EFF;
-                border: 1px solid #5E5EFF;
-                border-radius: 3px;
-            }}
-            QComboBox, QLineEdit, QListWidget {{
-                background-color: #2A2A3E;
-                color: #E0E0E0;
-                border: 1px solid #44444F;
-                border-radius: 5px;
-                padding: 5px 10px;
-                font-size: 14px;
-            }}
-            QComboBox:hover, QLineEdit:hover, QListWidget:hover {{
-                border: 1px solid #5E5EFF;
-            }}
-            QPushButton {{
-                font-size: 14px;
-                color: #FFFFFF;
-                padding: 10px 18px;
-                border-radius: 6px;
-                font-weight: 500;
-                min-height: 40px;
-                background-color: #5E5EFF;
-                border: 1px solid #4A4AFF;
-            }}
-            QPushButton:hover {{
-                background-color: #4A4AFF;
-            }}
-            QPushButton:pressed {{
-                background-color: #3A3AE6;
-            }}
-            QPushButton:disabled {{
-                background-color: #3e3e5e;
-                color: #AAAAAA;
-                border-color: #3e3e5e;
-            }}
-            QPushButton#restoreAllBtn {{
-                background-color: #FF5E5E;
-                border: 1px solid #E04A4A;
-                font-weight: bold;
-            }}
-            QPushButton#restoreAllBtn:hover {{
-                background-color: #E04A4A;
-            }}
-            QTextEdit#logViewer {{
-                background-color: #2A2A3E;
-                color: #E0E0E0;
-                border: 1px solid #44444F;
-                border-radius: 5px;
-                font-family: Consolas, monospace;
-                font-size: 12px;
-                padding: 8px;
-            }}
-            QFrame#restoreFrame {{
-                background-color: #2A2A3E;
-                border: 2px solid #FF5E5E;
-                border-radius: 8px;
-                margin-top: 25px;
-                padding: 18px;
-            }}
-            QLabel#restoreTitle {{
-                font-size: 20px;
-                font-weight: bold;
-                color: #FF5E5E;
-                margin-bottom: 12px;
-                qproperty-alignment: AlignCenter;
-            }}
-            QLabel#restoreInfoLabel {{
-                font-size: 13px;
-                color: #E0E0E0;
-                line-height: 1.4;
-            }}
-            QScrollArea {{
-                border: none;
-                background-color: transparent;
-            }}
-        """)
+        self.setStyleSheet(get_page_stylesheet())
 
         # ---------- Main Scroll Area & Content ----------
         self.content_widget = QWidget()
@@ -191,19 +359,19 @@ class SettingsPage(QWidget):
 
         # Run on Startup
         self.startup_chk = QCheckBox("Run Roblox Optimizer Pro on System Startup")
-        self.startup_chk.setChecked(self.settings_handler.value("run_on_startup", False, type=bool))
+        self.startup_chk.setChecked(self._settings_cache["run_on_startup"])
         self.startup_chk.setToolTip("If checked, the application will attempt to start when Windows boots.")
         content_layout.addWidget(self.startup_chk)
 
         # Always run as Admin
         self.admin_chk = QCheckBox("Always Attempt to Run as Administrator (Recommended)")
-        self.admin_chk.setChecked(self.settings_handler.value("run_as_admin", True, type=bool))
+        self.admin_chk.setChecked(self._settings_cache["run_as_admin"])
         self.admin_chk.setToolTip("Ensures features requiring elevation work correctly. Restart app after changing.")
         content_layout.addWidget(self.admin_chk)
 
         # Auto-Optimize on Launch
         self.autoopt_chk = QCheckBox("Enable Auto-Optimize on Roblox Launch")
-        self.autoopt_chk.setChecked(self.settings_handler.value("auto_optimize_on_launch", False, type=bool))
+        self.autoopt_chk.setChecked(self._settings_cache["auto_optimize_on_launch"])
         self.autoopt_chk.setToolTip("If checked, Auto-Optimize runs before Roblox starts via the Dashboard.")
         content_layout.addWidget(self.autoopt_chk)
 
@@ -224,6 +392,8 @@ class SettingsPage(QWidget):
 
         self.profile_list = QListWidget()
         self.profile_list.setFixedHeight(120)
+        # Profile names last read from PROFILES_DIR; None means re-scan on the next refresh
+        self._profile_cache = None
         self.refresh_profile_list_display()
         content_layout.addWidget(self.profile_list)
 
@@ -245,10 +415,20 @@ class SettingsPage(QWidget):
         logs_label.setObjectName("sectionTitle")
         content_layout.addWidget(logs_label)
 
-        self.log_viewer = QTextEdit()
+        self.log_viewer = QPlainTextEdit()
         self.log_viewer.setObjectName("logViewer")
         self.log_viewer.setReadOnly(True)
         self.log_viewer.setMinimumHeight(200)
+        self.log_viewer.setMaximumBlockCount(LOG_VIEWER_MAX_BLOCKS)
+        # Byte offset into the log file that the viewer has shown up to; refreshes append from here
+        self._last_log_len = 0
+        # GlobalLogger generation that offset belongs to; None until the first read
+        self._last_log_generation = None
+        self._log_cursor = QTextCursor(self.log_viewer.document())
+        self._refresh_timer = QTimer(self)
+        self._refresh_timer.setSingleShot(True)
+        self._refresh_timer.setInterval(LOG_REFRESH_DEBOUNCE_MS)
+        self._refresh_timer.timeout.connect(self._do_refresh_log)
         content_layout.addWidget(self.log_viewer)
 
         log_btn_layout = QHBoxLayout()
@@ -307,6 +487,12 @@ class SettingsPage(QWidget):
         self.clear_log_button.clicked.connect(self.clear_log_file_action)
         self.restore_all_defaults_btn.clicked.connect(self.execute_full_restore_to_defaults)
 
+        # Full restore runs in a RestoreWorker thread so netsh/powercfg/sc never block the GUI thread
+        self._restore_confirm = None
+        self._restore_thread = None
+        self._restore_worker = None
+        self._restore_summary = None
+
         # Load log on initialization
         self.refresh_log_display_action()
         GlobalLogger.append("[SettingsPage] Initialization complete with QScrollArea.", is_internal=True)
@@ -314,21 +500,24 @@ class SettingsPage(QWidget):
     def refresh_profile_list_display(self):
         """
         Refresh the QListWidget that shows saved profiles (JSON files in PROFILES_DIR).
+        The directory is only re-scanned after the cache was invalidated by a save/delete.
         """
-        self.profile_list.clear()
-        if not os.path.exists(PROFILES_DIR):
-            try:
-                os.makedirs(PROFILES_DIR, exist_ok=True)
-            except OSError:
-                pass
+        if self._profile_cache is not None:
+            return
 
-        if os.path.exists(PROFILES_DIR):
-            try:
-                for file_name in os.listdir(PROFILES_DIR):
-                    if file_name.endswith(".json"):
-                        self.profile_list.addItem(file_name[:-5])
-            except OSError as e:
-                GlobalLogger.append(f"[SettingsPage] Error reading profiles directory {PROFILES_DIR}: {e}", is_error=True)
+        names = []
+        try:
+            with os.scandir(PROFILES_DIR) as entries:
+                names = sorted(e.name[:-5] for e in entries if e.name.endswith(".json") and e.is_file())
+            self._profile_cache = names
+        except FileNotFoundError:
+            # Created in __init__ and recreated by the next save; no directory means no profiles
+            self._profile_cache = names
+        except OSError as e:
+            GlobalLogger.append(f"[SettingsPage] Error reading profiles directory {PROFILES_DIR}: {e}", is_error=True)
+        # One batch insert instead of an addItem() (and model update) per profile
+        self.profile_list.clear()
+        self.profile_list.addItems(names)
         GlobalLogger.append("[SettingsPage] Profile list refreshed.", is_internal=True)
 
     def save_current_settings_as_profile(self):
@@ -339,7 +528,7 @@ class SettingsPage(QWidget):
         if not profile_name:
             QMessageBox.warning(self, "Save Profile Error", "Please enter a name for the settings profile.")
             return
-        if any(c in profile_name for c in r'\/:*?"<>|'):
+        if INVALID_PROFILE_NAME_RE.search(profile_name):
             QMessageBox.warning(self, "Save Profile Error", "Profile name contains invalid characters.")
             return
 
@@ -349,10 +538,19 @@ class SettingsPage(QWidget):
             "auto_optimize_on_launch": self.autoopt_chk.isChecked(),
         }
         file_path = os.path.join(PROFILES_DIR, profile_name + ".json")
+        # Serialize in memory and write the file in one call
+        if orjson is not None:
+            payload = orjson.dumps(profile_data, option=orjson.OPT_INDENT_2)
+        else:
+            payload = json.dumps(profile_data, indent=2).encode("utf-8")
         try:
-            os.makedirs(PROFILES_DIR, exist_ok=True)
-            with open(file_path, "w", encoding="utf-8") as f:
-                json.dump(profile_data, f, indent=4)
+            try:
+                Path(file_path).write_bytes(payload)
+            except FileNotFoundError:
+                # PROFILES_DIR was removed after startup; recreate it and retry once
+                os.makedirs(PROFILES_DIR, exist_ok=True)
+                Path(file_path).write_bytes(payload)
+            self._profile_cache = None
             self.refresh_profile_list_display()
             self.profile_input.clear()
             QMessageBox.information(self, "Profile Saved", f"Settings profile '{profile_name}' saved.")
@@ -374,26 +572,25 @@ class SettingsPage(QWidget):
         file_path = os.path.join(PROFILES_DIR, profile_name + ".json")
         if not os.path.exists(file_path):
             QMessageBox.critical(self, "Load Profile Error", f"Profile file not found: {file_path}")
+            self._profile_cache = None
             self.refresh_profile_list_display()
             return
 
         try:
-            with open(file_path, "r", encoding="utf-8") as f:
-                profile_data = json.load(f)
+            if orjson is not None:
+                profile_data = orjson.loads(Path(file_path).read_bytes())
+            else:
+                profile_data = json.loads(Path(file_path).read_text(encoding="utf-8"))
         except Exception as e:
             QMessageBox.critical(self, "Load Profile Error", f"Failed to read profile '{profile_name}':\n{e}")
             return
 
-        # Apply loaded values to checkboxes
-        self.startup_chk.setChecked(profile_data.get("run_on_startup", False))
-        self.admin_chk.setChecked(profile_data.get("run_as_admin", True))
-        self.autoopt_chk.setChecked(profile_data.get("auto_optimize_on_launch", False))
-
-        # Save loaded settings back to QSettings
-        self.settings_handler.setValue("run_on_startup", self.startup_chk.isChecked())
-        self.settings_handler.setValue("run_as_admin", self.admin_chk.isChecked())
-        self.settings_handler.setValue("auto_optimize_on_launch", self.autoopt_chk.isChecked())
-        self.settings_handler.sync()
+        # Apply loaded values to the checkboxes and QSettings
+        self._apply_general_settings(
+            bool(profile_data.get("run_on_startup", False)),
+            bool(profile_data.get("run_as_admin", True)),
+            bool(profile_data.get("auto_optimize_on_launch", False)),
+        )
 
         # No theme to apply anymore
 
@@ -421,11 +618,13 @@ class SettingsPage(QWidget):
             try:
                 if os.path.exists(file_path):
                     os.remove(file_path)
+                    self._profile_cache = None
                     self.refresh_profile_list_display()
                     QMessageBox.information(self, "Profile Deleted", f"Profile '{profile_name}' deleted.")
                     GlobalLogger.append(f"[SettingsPage] Profile '{profile_name}' deleted.")
                 else:
                     QMessageBox.warning(self, "Delete Profile Error", f"Profile file '{profile_name}' not found.")
+                    self._profile_cache = None
                     self.refresh_profile_list_display()
             except Exception as e:
                 QMessageBox.critical(self, "Delete Profile Error", f"Failed to delete profile '{profile_name}':\n{e}")
@@ -433,12 +632,27 @@ class SettingsPage(QWidget):
 
     def refresh_log_display_action(self):
         """
-        Load the latest log from GlobalLogger into the QTextEdit.
+        Schedule a log viewer refresh; a burst of requests results in one read.
         """
-        GlobalLogger.append("[SettingsPage] Refresh Log View clicked.", is_internal=True)
-        self.log_viewer.setPlainText(GlobalLogger.get_log())
-        scrollbar = self.log_viewer.verticalScrollBar()
-        scrollbar.setValue(scrollbar.maximum())
+        self._refresh_timer.start()
+
+    def _do_refresh_log(self):
+        """
+        Append log lines written since the last refresh to the log viewer.
+        Nothing new past the stored offset means no text to insert and no relayout.
+        """
+        new_text, self._last_log_len, reset, self._last_log_generation = GlobalLogger.get_log_since(
+            self._last_log_len, self._last_log_generation
+        )
+        if reset:
+            # The file was cleared or rotated behind our back; start the view over
+            self.log_viewer.clear()
+        if not new_text:
+            return
+        cursor = self._log_cursor
+        cursor.movePosition(QTextCursor.End)
+        cursor.insertText(new_text)
+        self.log_viewer.moveCursor(QTextCursor.End)
 
     def clear_log_file_action(self):
         """
@@ -453,7 +667,9 @@ class SettingsPage(QWidget):
         )
         if reply == QMessageBox.StandardButton.Yes:
             status_msg = GlobalLogger.clear_log()
-            self.log_viewer.setPlainText(status_msg + "\nLog is now empty.")
+            self._last_log_len = 0
+            self._last_log_generation = None
+            self.log_viewer.setPlainText(status_msg + "\nLog is now empty.\n")
             GlobalLogger.append(f"[SettingsPage] Log file cleared by user. Status: {status_msg}", is_internal=True)
             QMessageBox.information(self, "Log File Cleared", status_msg)
 
@@ -462,119 +678,132 @@ class SettingsPage(QWidget):
         Restores all settings (app + system) to defaults. This is largely irreversible.
         """
         GlobalLogger.append("[SettingsPage] 'Perform Full Restore' button clicked.", is_internal=True)
-        reply = QMessageBox.warning(
-            self, "Confirm Full Restore",
-            "This will reset application settings and attempt to revert system tweaks.\n"
-            "ARE YOU ABSOLUTELY SURE YOU WANT TO PROCEED?",
-            QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.Cancel,
-            QMessageBox.StandardButton.Cancel
-        )
-        if reply != QMessageBox.StandardButton.Yes:
+        # Opened with open() rather than exec(): the event loop keeps running while it is up
+        if self._restore_confirm is None:
+            self._restore_confirm = QMessageBox(
+                QMessageBox.Icon.Warning, "Confirm Full Restore",
+                "This will reset application settings and attempt to revert system tweaks.\n"
+                "ARE YOU ABSOLUTELY SURE YOU WANT TO PROCEED?",
+                QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.Cancel,
+                self
+            )
+            self._restore_confirm.setDefaultButton(QMessageBox.StandardButton.Cancel)
+            self._restore_confirm.finished.connect(self._on_restore_confirm_finished)
+        self._restore_confirm.open()
+
+    @Slot(int)
+    def _on_restore_confirm_finished(self, _result):
+        box = self._restore_confirm
+        clicked = box.clickedButton()
+        if clicked is None or box.standardButton(clicked) != QMessageBox.StandardButton.Yes:
             GlobalLogger.append("[SettingsPage] Full restore cancelled by user.", is_internal=True)
             return
+        self._start_full_restore()
 
+    def _start_full_restore(self):
+        """
+        Resets the app settings here and hands the system restore steps to a RestoreWorker.
+        """
         # Prepare a small text area to log summary (appended to log_viewer)
         summary_log = ["[+] Full Restore to Defaults - Summary:"]
 
         # 1. Reset Application Settings to default
         GlobalLogger.append("[RestoreDefaults] Resetting application settings to defaults.", is_internal=True)
-        self.startup_chk.setChecked(False)
-        self.admin_chk.setChecked(True)
-        self.autoopt_chk.setChecked(False)
-        self.settings_handler.setValue("run_on_startup", False)
-        self.settings_handler.setValue("run_as_admin", True)
-        self.settings_handler.setValue("auto_optimize_on_launch", False)
-        self.settings_handler.sync()
+        self._apply_general_settings(
+            GENERAL_SETTINGS_DEFAULTS["run_on_startup"],
+            GENERAL_SETTINGS_DEFAULTS["run_as_admin"],
+            GENERAL_SETTINGS_DEFAULTS["auto_optimize_on_launch"],
+        )
         summary_log.append("- Application Settings: Reset to defaults (run_on_startup=False, run_as_admin=True, autoopt=False).")
 
-        # 2. Terminate FPS Unlocker
-        try:
-            rt_page_temp = RTPageForRestore()
-            rt_page_temp.terminate_fps_unlocker_action()
-            summary_log.append("- Roblox FPS Unlocker: Termination attempted.")
-        except Exception as e_fps:
-            summary_log.append(f"- Roblox FPS Unlocker: Error during termination ({e_fps}).")
-            GlobalLogger.append(f"[RestoreDefaults] Error terminating FPS Unlocker: {e_fps}", is_error=True)
-
-        # 3. Restore OS Tweaks
-        try:
-            os_tweaks_temp = OSTweaksPageForRestore()
-            os_tweaks_temp.restore_os_settings_action()
-            summary_log.append("- OS Tweaks: Restoration process initiated.")
-        except Exception as e_os:
-            summary_log.append(f"- OS Tweaks: Error initiating restoration ({e_os}).")
-            GlobalLogger.append(f"[RestoreDefaults] Error initiating OS Tweaks restoration: {e_os}", is_error=True)
-
-        # 4. Restore DNS to DHCP (Windows only)
-        if platform.system().lower().startswith("win"):
-            try:
-                interfaces_output = subprocess.check_output(
-                    ["netsh", "interface", "show", "interface"],
-                    universal_newlines=True,
-                    creationflags=0x08000000,
-                    encoding='utf-8',
-                    errors='ignore'
-                )
-                restored_dns_ifaces = []
-                for line in interfaces_output.splitlines():
-                    if re.match(r"^\s*Enabled\s+Connected", line, re.IGNORECASE):
-                        parts = re.split(r"\s{2,}", line.strip())
-                        if len(parts) >= 3:
-                            iface_name = parts[-1]
-                            if iface_name:
-                                subprocess.run(
-                                    ["netsh", "interface", "ipv4", "set", "dns", f"name=\"{iface_name}\"", "source=dhcp"],
-                                    check=False,
-                                    creationflags=0x08000000
-                                )
-                                subprocess.run(
-                                    ["netsh", "interface", "ipv6", "set", "dns", f"name=\"{iface_name}\"", "source=dhcp"],
-                                    check=False,
-                                    creationflags=0x08000000
-                                )
-                                restored_dns_ifaces.append(iface_name)
-                msg_dns = f"- DNS: Restored to DHCP for interfaces: {', '.join(restored_dns_ifaces) if restored_dns_ifaces else 'No active interfaces found'}."
-                summary_log.append(msg_dns)
-            except Exception as e_dns:
-                summary_log.append(f"- DNS: Failed to restore to DHCP: {e_dns}")
-                GlobalLogger.append(f"[RestoreDefaults] DNS restore error: {e_dns}", is_error=True)
-        else:
-            summary_log.append("- DNS: Restore to DHCP is Windows-specific, skipped.")
-
-        # 5. Restore TCP Settings
-        try:
-            tcp_restore_logs = restore_tcp_settings_backup()
-            summary_log.append("- TCP Settings: Restoration to backup/defaults attempted.")
-            GlobalLogger.append(f"[RestoreDefaults] TCP settings restore attempt logs:\n{tcp_restore_logs}")
-        except Exception as e_tcp:
-            summary_log.append(f"- TCP Settings: Error during restore attempt ({e_tcp}).")
-            GlobalLogger.append(f"[RestoreDefaults] Error restoring TCP settings: {e_tcp}", is_error=True)
+        # 2-5. System restores run in a worker thread; each step's line is shown as it finishes
+        # and the sequence completes in _on_restore_finished
+        self.restore_all_defaults_btn.setEnabled(False)
+        self._restore_summary = summary_log
+        self.log_viewer.appendPlainText("[*] Full restore in progress...")
+
+        if self._restore_thread is not None:
+            # Left over from the previous restore; its event loop has already been told to quit
+            self._restore_thread.wait()
+            self._restore_thread.deleteLater()
+        self._restore_thread = QThread(self)
+        self._restore_worker = RestoreWorker()
+        self._restore_worker.moveToThread(self._restore_thread)
+        self._restore_thread.started.connect(self._restore_worker.run)
+        self._restore_worker.progress.connect(self.log_viewer.appendPlainText)
+        self._restore_worker.finished.connect(self._on_restore_finished)
+        self._restore_worker.finished.connect(self._restore_thread.quit)
+        self._restore_thread.start()
+
+    @Slot(list)
+    def _on_restore_finished(self, step_lines):
+        summary_log = self._restore_summary + step_lines
+        self._restore_summary = None
 
         # 6. Clear application log file
         clear_log_status = GlobalLogger.clear_log()
         summary_log.append(f"- Application Log File: {clear_log_status}")
-        self.refresh_log_display_action()
+        self._last_log_len = 0
+        self._last_log_generation = None
+        self.log_viewer.clear()
+        # Read right away so the summary below lands after the fresh log lines
+        self._refresh_timer.stop()
+        self._do_refresh_log()
 
         # Show summary in log_viewer and info dialog
         final_summary_text = "\n".join(summary_log)
-        self.log_viewer.append(f"\n{final_summary_text}")
-        QMessageBox.information(
-            self, "Full Restore Complete",
+        self.log_viewer.appendPlainText(f"\n{final_summary_text}")
+        self.restore_all_defaults_btn.setEnabled(True)
+        done_box = QMessageBox(
+            QMessageBox.Icon.Information, "Full Restore Complete",
             "The full restore to defaults sequence has finished.\n"
             "Some changes may require a system restart.\n\n"
-            "Summary of actions:\n" + final_summary_text
+            "Summary of actions:\n" + final_summary_text,
+            QMessageBox.StandardButton.Ok,
+            self
         )
+        done_box.setAttribute(Qt.WA_DeleteOnClose)
+        done_box.open()
         GlobalLogger.append("[RestoreDefaults] Full restore sequence completed.", is_internal=True)
 
+    def _apply_general_settings(self, startup, admin, autoopt):
+        """
+        Set the three general checkboxes and store the values in one pass.
+        """
+        self.startup_chk.setChecked(startup)
+        self.admin_chk.setChecked(admin)
+        self.autoopt_chk.setChecked(autoopt)
+        self._store_settings({
+            "run_on_startup": startup,
+            "run_as_admin": admin,
+            "auto_optimize_on_launch": autoopt,
+        })
+
+    def _store_settings(self, values):
+        """
+        Write changed general settings to QSettings, skipping values that already match.
+        Nothing is synced here; QSettings flushes on its own and shutdown() syncs explicitly.
+        """
+        for key, value in values.items():
+            if self._settings_cache.get(key) != value:
+                self._settings_cache[key] = value
+                self.settings_handler.setValue(key, value)
+
     def shutdown(self):
         """
         Called when the application is closing.
         Saves any final UI state into QSettings.
         """
         GlobalLogger.append("[SettingsPage] Shutdown: saving current UI settings to INI.", is_internal=True)
-        self.settings_handler.setValue("run_on_startup", self.startup_chk.isChecked())
-        self.settings_handler.setValue("run_as_admin", self.admin_chk.isChecked())
-        self.settings_handler.setValue("auto_optimize_on_launch", self.autoopt_chk.isChecked())
+        if self._restore_thread is not None and self._restore_thread.isRunning():
+            # Steps are external commands; let them finish rather than leave the system half-restored
+            self._restore_thread.quit()
+            self._restore_thread.wait()
+        self._store_settings({
+            "run_on_startup": self.startup_chk.isChecked(),
+            "run_as_admin": self.admin_chk.isChecked(),
+            "auto_optimize_on_launch": self.autoopt_chk.isChecked(),
+        })
         self.settings_handler.sync()
         status = self.settings_handler.status()
         if status != QSettings.Status.NoError:
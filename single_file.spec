@@ -21,6 +21,28 @@ if not os.path.exists(main_script):
         "Make sure that path is correct and that launcher_script.py actually exists there."
     )
 
+# ─── 3b) Compile the Memory Cleaner's process filter with mypyc (optional) ─────
+# utils/proc_filter.py is fully annotated for mypyc. When mypyc is installed the C
+# extension is built next to it, and the import (and so this bundle) picks it up in
+# place of the .py. Without mypyc, or if the build fails, any old extension is removed
+# so the current pure-Python module is bundled instead of stale compiled code.
+import glob
+import importlib.util
+import subprocess
+
+proc_filter_src = os.path.join("utils", "proc_filter.py")
+proc_filter_built = False
+if importlib.util.find_spec("mypyc") is not None:
+    result = subprocess.run([sys.executable, "-m", "mypyc", proc_filter_src], cwd=project_dir)
+    proc_filter_built = result.returncode == 0
+    if not proc_filter_built:
+        print(f"WARNING: mypyc failed on {proc_filter_src} (exit code {result.returncode}); bundling it uncompiled.")
+else:
+    print(f"WARNING: mypyc not installed; bundling {proc_filter_src} uncompiled.")
+if not proc_filter_built:
+    for stale in glob.glob(os.path.join(project_dir, "utils", "proc_filter.*.pyd")):
+        os.remove(stale)
+
 # ─── 4) Icon path (optional). Make sure resources/icon.ico exists under project_dir ───
 icon_path = os.path.join(project_dir, "resources", "icon.ico")
 if not os.path.exists(icon_path):
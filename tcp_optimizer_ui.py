@@ -6,60 +6,135 @@ import json
 import os
 import sys
 import re  # For parsing netsh output
-import platform  # To check OS
+import time
+import threading
+from collections import deque
+from dataclasses import dataclass
+from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
+
+# Optional: faster JSON for the backup file; falls back to json
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QLabel, QComboBox, QPushButton,
-    QTextEdit, QMessageBox, QHBoxLayout, QGridLayout, QFrame, QApplication,
+    QPlainTextEdit, QMessageBox, QHBoxLayout, QGridLayout, QFrame, QApplication,
     QSpacerItem, QSizePolicy
 )
-from PySide6.QtCore import Qt
-from PySide6.QtGui import QFont, QFontDatabase
+from PySide6.QtCore import Qt, QObject, QTimer, Signal, Slot
+from PySide6.QtGui import QFont, QTextCursor
 
 from visual_tweaks_and_logs import GlobalLogger
 from utils.path_utils import app_data_path  # For consistent backup file location
 
+# Evaluated once at import; every Windows-only helper below checks this flag
+_IS_WINDOWS = sys.platform == "win32"
+
 # Registry path for global TCP/IP parameters
 REG_PATH_GLOBAL_TCP = r"SYSTEM\CurrentControlSet\Services\Tcpip\Parameters"
 
+# Registry change notifications for the TCP value cache (pywin32, Windows only)
+REG_WATCH_SUPPORTED = False
+if _IS_WINDOWS:
+    try:
+        import win32api
+        import win32con
+        import win32event
+        from PySide6.QtCore import QWinEventNotifier
+        REG_WATCH_SUPPORTED = True
+    except ImportError:
+        GlobalLogger.append(
+            "[TCPOptimizer] pywin32 not found; TCP registry values will be re-read on every refresh.",
+            is_error=True, is_internal=True
+        )
+
+# Values under REG_PATH_GLOBAL_TCP as last read or written: {value_name: value or _REG_MISSING}.
+# None unless a TcpRegistryWatcher is running, since only the watcher sees changes made elsewhere.
+_REG_CACHE = None
+_REG_MISSING = object()
+# Guards _REG_CACHE between job threads and the watcher. The watcher bumps the generation on
+# every change, and values are only stored if it hasn't moved since before they were read or
+# written, so a stale value can't be put back after the cache was cleared.
+_REG_CACHE_LOCK = threading.Lock()
+_REG_CACHE_GENERATION = 0
+
 # Backup file location using centralized app_data_path
 BACKUP_FILE = app_data_path("tcp_optimizer_backup.json")
 
-# Load and register the Audiowide font
-def load_custom_font():
-    font_path = os.path.join("resources", "fonts", "Audiowide", "Audiowide-Regular.ttf")
-    if os.path.exists(font_path):
-        font_id = QFontDatabase.addApplicationFont(font_path)
-        if font_id != -1:
-            return QFontDatabase.applicationFontFamilies(font_id)[0]
-    return "Segoe UI"  # Fallback to Segoe UI if font loading fails
+# How long a "netsh ... show" result is reused, so a backup followed by a stats refresh queries once
+NETSH_QUERY_CACHE_TTL = 2.0
+
+# netsh "set" processes launched at once when applying a profile
+NETSH_SET_WORKERS = 4
+
+# Both TCP queries piped into one netsh session instead of launching netsh once per query
+NETSH_QUERY_SCRIPT = "interface tcp show global\ninterface tcp show supplemental\nexit\n"
 
-# Get the custom font family name
-CUSTOM_FONT = load_custom_font()
+# Lines kept in the action log
+LOG_MAX_BLOCKS = 1000
+
+# Coalescing delay for action log writes
+LOG_FLUSH_MS = 100
 
 # --- Helper Functions for Registry and Commands ---
 
-def run_shell_command(command_list, check_return_code=True):
+# Shared by every command launch (Popen copies it): the window is created hidden
+if _IS_WINDOWS:
+    _STARTUPINFO = subprocess.STARTUPINFO()
+    _STARTUPINFO.dwFlags |= subprocess.STARTF_USESHOWWINDOW
+    _STARTUPINFO.wShowWindow = subprocess.SW_HIDE
+else:
+    _STARTUPINFO = None
+
+# CREATE_NO_WINDOW | CREATE_NEW_PROCESS_GROUP: no console, and no Ctrl+C/Break from ours
+_CREATION_FLAGS = 0x08000000 | 0x00000200
+
+# Words that mark command output as a failure; one case-insensitive scan instead of several lower() copies
+ERROR_OUTPUT_RE = re.compile(r"error|invalid|incorrect", re.IGNORECASE)
+
+# Results of read-only commands run with cache_ttl:
+# {(tuple(command_list), input_text): (monotonic time, result)}.
+# Cleared by _invalidate_netsh_cache() whenever a netsh "set" has run.
+_NETSH_CACHE = {}
+
+
+def _invalidate_netsh_cache():
+    _NETSH_CACHE.clear()
+
+
+def run_shell_command(command_list, check_return_code=True, cache_ttl=0, input_text=None):
     """
     Executes a shell command (Windows-only for TCP tuning).
     Returns a string with stdout or error details.
+    With cache_ttl > 0, a result from the same command younger than cache_ttl seconds is reused.
+    input_text, if given, is written to the command's stdin.
     """
-    if platform.system().lower() != "windows":
+    if not _IS_WINDOWS:
         return "Error: Shell commands for TCP tuning are Windows-specific in this module."
+    if cache_ttl > 0:
+        cache_key = (tuple(command_list), input_text)
+        cached = _NETSH_CACHE.get(cache_key)
+        if cached is not None and time.monotonic() - cached[0] < cache_ttl:
+            return cached[1]
+        result = run_shell_command(command_list, check_return_code, input_text=input_text)
+        _NETSH_CACHE[cache_key] = (time.monotonic(), result)
+        return result
     try:
-        creationflags = 0x08000000  # CREATE_NO_WINDOW
         process = subprocess.run(
             command_list,
             shell=False,
+            input=input_text.encode("utf-8") if input_text is not None else None,
             capture_output=True,
-            text=True,
             check=False,
-            creationflags=creationflags,
-            encoding='utf-8',
-            errors='ignore'
+            startupinfo=_STARTUPINFO,
+            creationflags=_CREATION_FLAGS
         )
-        output = process.stdout.strip() if process.stdout else ""
-        error_output = process.stderr.strip() if process.stderr else ""
+        # Captured as bytes and decoded once each, rather than through a text-mode wrapper
+        output = process.stdout.decode("utf-8", errors="ignore").strip() if process.stdout else ""
+        error_output = process.stderr.decode("utf-8", errors="ignore").strip() if process.stderr else ""
 
         log_msg = (
             f"Cmd: {' '.join(command_list)}, RC: {process.returncode}, "
@@ -70,13 +145,13 @@ def run_shell_command(command_list, check_return_code=True):
         if check_return_code and process.returncode != 0:
             combined_error = (
                 error_output if error_output
-                else output if "error" in output.lower() or "invalid" in output.lower()
+                else output if ERROR_OUTPUT_RE.search(output)
                 else f"Command failed with code {process.returncode}"
             )
             return f"Error: {combined_error}"
 
         # Prioritize meaningful stdout
-        if output and "Ok." not in output and "error" not in output.lower() and "invalid" not in output.lower():
+        if output and "Ok." not in output and not ERROR_OUTPUT_RE.search(output):
             return output
         elif error_output:
             return f"Info/Error: {error_output}"
@@ -94,12 +169,22 @@ def run_shell_command(command_list, check_return_code=True):
         return f"Error: {msg}"
 
 
+def _reg_cache_store(updates, generation):
+    """
+    Stores {value_name: value or _REG_MISSING} in _REG_CACHE, unless caching is off or the
+    watcher has seen a change since generation was read.
+    """
+    with _REG_CACHE_LOCK:
+        if _REG_CACHE is not None and generation == _REG_CACHE_GENERATION:
+            _REG_CACHE.update(updates)
+
+
 def set_registry_dword(reg_path, value_name, value_data):
     """
     Sets a DWORD registry value under HKLM for the given path.
     Returns a message string indicating success or failure.
     """
-    if platform.system().lower() != "windows":
+    if not _IS_WINDOWS:
         return "Error: Windows-only."
     try:
         key = winreg.CreateKeyEx(
@@ -108,8 +193,11 @@ def set_registry_dword(reg_path, value_name, value_data):
             0,
             winreg.KEY_SET_VALUE | winreg.KEY_WOW64_64KEY
         )
+        generation = _REG_CACHE_GENERATION
         winreg.SetValueEx(key, value_name, 0, winreg.REG_DWORD, int(value_data))
         winreg.CloseKey(key)
+        if reg_path == REG_PATH_GLOBAL_TCP:
+            _reg_cache_store({value_name: int(value_data)}, generation)
         msg = f"[+] Registry Set: HKLM\\{reg_path}\\{value_name} = {value_data} (DWORD)"
         GlobalLogger.append(msg, is_internal=True)
         return msg
@@ -123,13 +211,83 @@ def set_registry_dword(reg_path, value_name, value_data):
         return msg
 
 
-def get_registry_dword(reg_path, value_name, default_value="N/A"):
+def _set_registry_dword_int(key, reg_path, value_name, value):
     """
-    Reads a DWORD registry value under HKLM for the given path.
-    Returns the integer value or default_value if not found or on error.
+    Writes an int DWORD value through an already opened key, with no coercion.
+    For internal callers such as TCP_PROFILES; backup data goes through set_registry_dword.
+    Returns a message string indicating success or failure.
+    """
+    generation = _REG_CACHE_GENERATION
+    try:
+        winreg.SetValueEx(key, value_name, 0, winreg.REG_DWORD, value)
+    except OSError as e:
+        msg = f"[-] Registry Error: Failed to set '{value_name}' in HKLM\\{reg_path}: {e}"
+        GlobalLogger.append(msg, is_error=True)
+        return msg
+    if reg_path == REG_PATH_GLOBAL_TCP:
+        _reg_cache_store({value_name: value}, generation)
+    msg = f"[+] Registry Set: HKLM\\{reg_path}\\{value_name} = {value} (DWORD)"
+    GlobalLogger.append(msg, is_internal=True)
+    return msg
+
+
+def set_registry_dwords_bulk(reg_path, values):
     """
-    if platform.system().lower() != "windows":
-        return default_value
+    Sets several DWORD registry values under HKLM for the given path, opening the key once.
+    values maps value names to ints. Returns one message string per value, in order.
+    """
+    if not _IS_WINDOWS:
+        return ["Error: Windows-only."] * len(values)
+    try:
+        key = winreg.CreateKeyEx(
+            winreg.HKEY_LOCAL_MACHINE,
+            reg_path,
+            0,
+            winreg.KEY_SET_VALUE | winreg.KEY_WOW64_64KEY
+        )
+    except OSError as e:
+        msg = f"[-] Registry Error: Failed to open HKLM\\{reg_path} for writing: {e}"
+        GlobalLogger.append(msg, is_error=True)
+        return [msg] * len(values)
+
+    try:
+        return [
+            _set_registry_dword_int(key, reg_path, value_name, value)
+            for value_name, value in values.items()
+        ]
+    finally:
+        winreg.CloseKey(key)
+
+
+def get_registry_dwords_bulk(reg_path, value_names, default_value="N/A"):
+    """
+    Reads several DWORD registry values under HKLM for the given path, opening the key once.
+    Returns a dict mapping each value name to its integer value, default_value if not found,
+    "WrongType(<type>)" if it isn't a DWORD, or "Error" on failure.
+    Values under REG_PATH_GLOBAL_TCP come from _REG_CACHE when a watcher keeps it current.
+    """
+    value_names = list(value_names)
+    if not _IS_WINDOWS:
+        return dict.fromkeys(value_names, default_value)
+
+    # generation stays None when this path isn't cached
+    generation = None
+    results = {}
+    pending = value_names
+    if reg_path == REG_PATH_GLOBAL_TCP:
+        with _REG_CACHE_LOCK:
+            if _REG_CACHE is not None:
+                generation = _REG_CACHE_GENERATION
+                pending = []
+                for value_name in value_names:
+                    cached = _REG_CACHE.get(value_name)
+                    if cached is None:
+                        pending.append(value_name)
+                    else:
+                        results[value_name] = default_value if cached is _REG_MISSING else cached
+        if not pending:
+            return {value_name: results[value_name] for value_name in value_names}
+
     try:
         key = winreg.OpenKey(
             winreg.HKEY_LOCAL_MACHINE,
@@ -137,24 +295,55 @@ def get_registry_dword(reg_path, value_name, default_value="N/A"):
             0,
             winreg.KEY_READ | winreg.KEY_WOW64_64KEY
         )
-        value, reg_type = winreg.QueryValueEx(key, value_name)
-        winreg.CloseKey(key)
-        if reg_type == winreg.REG_DWORD:
-            return value
-        else:
-            GlobalLogger.append(
-                f"[TCPOptimizer] Registry value HKLM\\{reg_path}\\{value_name} is not DWORD (Type: {reg_type}).",
-                is_error=True
-            )
-            return f"WrongType({reg_type})"
     except FileNotFoundError:
-        return default_value
+        results.update(dict.fromkeys(pending, default_value))
+        return {value_name: results[value_name] for value_name in value_names}
     except Exception as e:
         GlobalLogger.append(
-            f"[TCPOptimizer] Error getting registry value HKLM\\{reg_path}\\{value_name}: {e}",
+            f"[TCPOptimizer] Error opening registry key HKLM\\{reg_path}: {e}",
             is_error=True
         )
-        return "Error"
+        results.update(dict.fromkeys(pending, "Error"))
+        return {value_name: results[value_name] for value_name in value_names}
+
+    fetched = {}
+    try:
+        for value_name in pending:
+            try:
+                value, reg_type = winreg.QueryValueEx(key, value_name)
+            except FileNotFoundError:
+                results[value_name] = default_value
+                fetched[value_name] = _REG_MISSING
+                continue
+            except Exception as e:
+                GlobalLogger.append(
+                    f"[TCPOptimizer] Error getting registry value HKLM\\{reg_path}\\{value_name}: {e}",
+                    is_error=True
+                )
+                results[value_name] = "Error"
+                continue
+            if reg_type == winreg.REG_DWORD:
+                results[value_name] = value
+                fetched[value_name] = value
+            else:
+                GlobalLogger.append(
+                    f"[TCPOptimizer] Registry value HKLM\\{reg_path}\\{value_name} is not DWORD (Type: {reg_type}).",
+                    is_error=True
+                )
+                results[value_name] = f"WrongType({reg_type})"
+    finally:
+        winreg.CloseKey(key)
+    if generation is not None and fetched:
+        _reg_cache_store(fetched, generation)
+    return {value_name: results[value_name] for value_name in value_names}
+
+
+def get_registry_dword(reg_path, value_name, default_value="N/A"):
+    """
+    Reads a DWORD registry value under HKLM for the given path.
+    Returns the integer value or default_value if not found or on error.
+    """
+    return get_registry_dwords_bulk(reg_path, (value_name,), default_value)[value_name]
 
 
 # --- TCP Parameter Definitions and Profiles ---
@@ -173,6 +362,14 @@ TCP_REG_PARAMS_INFO = {
     "RFC 1323 Timestamps (Netsh Global)": (None, "default", "Global setting for RFC 1323 timestamps via netsh (e.g., enabled, disabled, default)."),
 }
 
+# Registry-backed entries of TCP_REG_PARAMS_INFO, worked out once: display name -> value name
+DISPLAY_TO_REG_NAME = {
+    display_name: reg_name
+    for display_name, (reg_name, _, _) in TCP_REG_PARAMS_INFO.items()
+    if reg_name
+}
+REG_VALUE_NAMES = tuple(DISPLAY_TO_REG_NAME.values())
+
 TCP_PROFILES = {
     "Windows Default (Recommended Restore)": {
         "description": "Resets TCP settings towards typical Windows defaults (e.g., Normal auto-tuning, CTCP/Default congestion).",
@@ -200,23 +397,92 @@ TCP_PROFILES = {
     }
 }
 
+# Profile name -> description shown under the profile combo box
+TCP_PROFILE_DESCRIPTIONS = {
+    profile_name: profile.get("description", "No description available.")
+    for profile_name, profile in TCP_PROFILES.items()
+}
+
+
+# 'show global' lines we read, mapped to their netsh setting names
+NETSH_GLOBAL_KEYS = {
+    "receive window auto-tuning level": "autotuninglevel",
+    "receive-side scaling state": "rss",
+    "ecn capability": "ecncapability",
+    "rfc 1323 timestamps": "timestamps",
+}
+
+# One 'Key Name        : Value' pattern covering every key above, so the output is scanned once
+NETSH_GLOBAL_RE = re.compile(
+    r"^\s*(" + "|".join(re.escape(key) for key in NETSH_GLOBAL_KEYS) + r")\s*:\s*(\S+)",
+    re.MULTILINE | re.IGNORECASE
+)
+
+# Every congestion provider line in 'show supplemental', tagged with the block header
+# ('Effective settings' or 'Template: internet') when it sits inside one of those blocks
+SUPP_CONGESTION_RE = re.compile(
+    r"(?:(Effective settings|Template\s*:\s*internet)\s*-+\s*(?:(?!\n\s*Template).)*?)?"
+    r"Congestion Control Provider\s+:\s+(\w+)",
+    re.DOTALL | re.IGNORECASE
+)
+
 
-def _parse_netsh_show_output(output_str, key_name, default_val="N/A"):
+def _parse_netsh_global_output(output_str):
     """
-    Parses 'Key Name        : Value' lines from netsh output.
-    Returns the captured value (lowercased), or default_val if not found.
+    Parses the 'show global' keys in NETSH_GLOBAL_KEYS from netsh output in a single pass.
+    Returns {setting: value (lowercased)}, with "N/A" for any key that wasn't found.
     """
-    try:
-        pattern = rf"^\s*{re.escape(key_name)}\s*:\s*(\S+)"
-        match = re.search(pattern, output_str, re.MULTILINE | re.IGNORECASE)
-        if match:
-            return match.group(1).strip().lower()
-    except Exception as e:
-        GlobalLogger.append(
-            f"[TCPOptimizer] Regex parse error for key '{key_name}': {e}",
-            is_error=True
-        )
-    return default_val
+    found = {}
+    for match in NETSH_GLOBAL_RE.finditer(output_str):
+        found.setdefault(NETSH_GLOBAL_KEYS[match.group(1).lower()], match.group(2).strip().lower())
+    return {setting: found.get(setting, "N/A") for setting in NETSH_GLOBAL_KEYS.values()}
+
+
+def _parse_congestion_provider(supp_out):
+    """
+    Finds the congestion provider in 'show supplemental' output in a single pass.
+    Prefers the 'Effective settings' block, then the internet template, then any provider line.
+    Returns the provider (lowercased), or "N/A (Parse)" if there is none.
+    """
+    providers = {}
+    for match in SUPP_CONGESTION_RE.finditer(supp_out):
+        header = (match.group(1) or "").lower()
+        block = "effective" if header.startswith("effective") else "internet" if header else "other"
+        providers.setdefault(block, match.group(2).lower())
+    return providers.get("effective") or providers.get("internet") or providers.get("other", "N/A (Parse)")
+
+
+def _run_netsh_batch():
+    """
+    Runs 'show global' and 'show supplemental' in a single netsh process fed from stdin.
+    Returns (global_out, supp_out). The key and block regexes only match lines from their
+    own section, so both are the combined output when the batch succeeds; otherwise each
+    query falls back to its own netsh call.
+    The output is read whole rather than streamed: it is a few KB that netsh ends on its own
+    after 'exit', each section is parsed in one regex pass, and the full text is what the
+    query cache shares between callers.
+    """
+    batch_out = run_shell_command(
+        ["netsh"],
+        check_return_code=False,
+        cache_ttl=NETSH_QUERY_CACHE_TTL,
+        input_text=NETSH_QUERY_SCRIPT
+    )
+    if batch_out and "Error" not in batch_out and "Congestion Control Provider" in batch_out:
+        return batch_out, batch_out
+
+    GlobalLogger.append("[TCPOptimizer] Batched netsh query failed; querying separately.", is_internal=True)
+    global_out = run_shell_command(
+        ["netsh", "interface", "tcp", "show", "global"],
+        check_return_code=False,
+        cache_ttl=NETSH_QUERY_CACHE_TTL
+    )
+    supp_out = run_shell_command(
+        ["netsh", "int", "tcp", "show", "supplemental"],
+        check_return_code=False,
+        cache_ttl=NETSH_QUERY_CACHE_TTL
+    )
+    return global_out, supp_out
 
 
 def query_current_netsh_settings():
@@ -224,68 +490,27 @@ def query_current_netsh_settings():
     Queries 'netsh interface tcp show global' and 'netsh interface tcp show supplemental'
     Returns a dict with keys: autotuninglevel, rss, ecncapability, timestamps, congestionprovider.
     """
-    if platform.system().lower() != "windows":
+    if not _IS_WINDOWS:
         return {}
 
     settings = {}
 
-    # Query global TCP settings
-    global_out = run_shell_command(
-        ["netsh", "interface", "tcp", "show", "global"],
-        check_return_code=False
-    )
+    global_out, supp_out = _run_netsh_batch()
+
+    # Parse global TCP settings
     if "Error" not in global_out and global_out:
-        settings["autotuninglevel"] = _parse_netsh_show_output(global_out, "Receive Window Auto-Tuning Level")
-        settings["rss"] = _parse_netsh_show_output(global_out, "Receive-Side Scaling State")
-        settings["ecncapability"] = _parse_netsh_show_output(global_out, "ECN Capability")
-        settings["timestamps"] = _parse_netsh_show_output(global_out, "RFC 1323 Timestamps")
+        settings.update(_parse_netsh_global_output(global_out))
     else:
         GlobalLogger.append(
             f"[TCPOptimizer] Error or no output querying netsh global settings: '{global_out}'",
             is_error=True
         )
-        for key in ["autotuninglevel", "rss", "ecncapability", "timestamps"]:
+        for key in NETSH_GLOBAL_KEYS.values():
             settings[key] = "Error Querying"
 
-    # Query supplemental TCP settings
-    supp_out = run_shell_command(
-        ["netsh", "int", "tcp", "show", "supplemental"],
-        check_return_code=False
-    )
+    # Parse supplemental TCP settings
     if "Error" not in supp_out and supp_out:
-        effective_settings_block = re.search(
-            r"Effective settings\s*-+\s*(.*?)(?=\n\s*Template|\Z)",
-            supp_out,
-            re.DOTALL | re.IGNORECASE
-        )
-        search_block = effective_settings_block.group(1) if effective_settings_block else supp_out
-
-        congestion_match = re.search(
-            r"Congestion Control Provider\s+:\s+(\w+)",
-            search_block,
-            re.IGNORECASE
-        )
-        if congestion_match:
-            settings["congestionprovider"] = congestion_match.group(1).lower()
-        else:
-            internet_template_block = re.search(
-                r"Template\s*:\s*internet\s*-+\s*(.*?)(?=\n\s*Template|\Z)",
-                supp_out,
-                re.DOTALL | re.IGNORECASE
-            )
-            if internet_template_block:
-                search_block_internet = internet_template_block.group(1)
-                congestion_match_internet = re.search(
-                    r"Congestion Control Provider\s+:\s+(\w+)",
-                    search_block_internet,
-                    re.IGNORECASE
-                )
-                if congestion_match_internet:
-                    settings["congestionprovider"] = congestion_match_internet.group(1).lower()
-                else:
-                    settings["congestionprovider"] = "N/A (Parse)"
-            else:
-                settings["congestionprovider"] = "N/A (Parse)"
+        settings["congestionprovider"] = _parse_congestion_provider(supp_out)
     else:
         GlobalLogger.append(
             f"[TCPOptimizer] Error or no output querying netsh supplemental settings: '{supp_out}'",
@@ -301,25 +526,26 @@ def backup_current_tcp_settings():
     Backs up current registry and netsh TCP settings into BACKUP_FILE (JSON).
     Returns a status message string.
     """
-    if platform.system().lower() != "windows":
+    if not _IS_WINDOWS:
         return "Backup skipped (Windows-only)."
     GlobalLogger.append("[TCPOptimizer] Backing up current TCP settings.", is_internal=True)
 
     backup_data = {"registry": {}, "netsh": {}}
-    for _, (reg_name, _, _) in TCP_REG_PARAMS_INFO.items():
-        if reg_name:
-            backup_data["registry"][reg_name] = get_registry_dword(
-                REG_PATH_GLOBAL_TCP,
-                reg_name,
-                "N/A_NotSet"
-            )
+    backup_data["registry"] = get_registry_dwords_bulk(REG_PATH_GLOBAL_TCP, REG_VALUE_NAMES, "N/A_NotSet")
 
     backup_data["netsh"] = query_current_netsh_settings()
 
     try:
         os.makedirs(os.path.dirname(BACKUP_FILE), exist_ok=True)
-        with open(BACKUP_FILE, "w", encoding="utf-8") as f:
-            json.dump(backup_data, f, indent=4)
+        if orjson is not None:
+            payload = orjson.dumps(backup_data, option=orjson.OPT_INDENT_2)
+        else:
+            payload = json.dumps(backup_data, indent=4).encode("utf-8")
+        # Write beside the old backup and swap it in, so a crash mid-write can't corrupt it
+        tmp_file = BACKUP_FILE + ".tmp"
+        with open(tmp_file, "wb") as f:
+            f.write(payload)
+        os.replace(tmp_file, BACKUP_FILE)
         msg = f"[*] Current TCP settings backed up to {BACKUP_FILE}"
         GlobalLogger.append(msg, is_internal=True)
         return msg
@@ -334,44 +560,77 @@ def _apply_profile_logic(profile_name, logs_list_ref):
     Applies the registry and netsh settings for the given profile_name,
     appending log messages to logs_list_ref.
     """
-    if platform.system().lower() != "windows":
+    if not _IS_WINDOWS:
         return
     profile = TCP_PROFILES.get(profile_name)
     if not profile:
         logs_list_ref.append(f"[-] Profile '{profile_name}' not found.")
         return
 
+    # Only write what differs from the current state; a re-apply is then mostly free.
+    # Both reads are usually served from the cache filled by the backup just before.
+    profile_registry = profile.get("registry", {})
+    current_registry = get_registry_dwords_bulk(REG_PATH_GLOBAL_TCP, profile_registry)
+    current_netsh = query_current_netsh_settings()
+
     logs_list_ref.append(f"\n[*] Applying Registry settings for '{profile_name}':")
-    for reg_name, value in profile.get("registry", {}).items():
-        logs_list_ref.append(set_registry_dword(REG_PATH_GLOBAL_TCP, reg_name, value))
+    registry_changes = {}
+    for reg_name, value in profile_registry.items():
+        if current_registry.get(reg_name) == value:
+            logs_list_ref.append(f"[*] Registry Skipped: {reg_name} is already {value}")
+        else:
+            registry_changes[reg_name] = value
+    if registry_changes:
+        logs_list_ref.extend(set_registry_dwords_bulk(REG_PATH_GLOBAL_TCP, registry_changes))
 
-    logs_list_ref.append(f"\n[*] Applying Netsh Global settings for '{profile_name}':")
+    global_items, global_skipped = [], []
     for setting, value in profile.get("netsh_global", {}).items():
-        cmd = ["netsh", "interface", "tcp", "set", "global", f"{setting}={value}"]
-        logs_list_ref.append(f"  Executing: {' '.join(cmd)}")
-        result = run_shell_command(cmd, check_return_code=False)
-        logs_list_ref.append(f"  Result: {result}")
-        if "error" in result.lower() or "invalid" in result.lower() or "incorrect" in result.lower():
+        if str(current_netsh.get(setting, "")).lower() == str(value).lower():
+            global_skipped.append(f"  Skipped {setting} (already {value})")
+            continue
+        global_items.append((setting, value, ["netsh", "interface", "tcp", "set", "global", f"{setting}={value}"]))
+
+    supp_items, supp_skipped = [], []
+    for setting, value in profile.get("netsh_supplemental", {}).items():
+        if setting != "congestionprovider":
+            continue
+        if str(current_netsh.get(setting, "")).lower() == str(value).lower():
+            supp_skipped.append(f"  Skipped {setting} (already {value})")
+            continue
+        supp_items.append((setting, value, [
+            "netsh", "int", "tcp", "set", "supplemental",
+            "template=internet", f"congestionprovider={value}"
+        ]))
+
+    # Each set touches a different setting, so the netsh processes can run side by side;
+    # results are logged afterwards in profile order
+    with ThreadPoolExecutor(max_workers=NETSH_SET_WORKERS, thread_name_prefix="netshset") as pool:
+        global_futures = [pool.submit(run_shell_command, cmd, False) for _, _, cmd in global_items]
+        supp_futures = [pool.submit(run_shell_command, cmd, False) for _, _, cmd in supp_items]
+
+    logs_list_ref.append(f"\n[*] Applying Netsh Global settings for '{profile_name}':")
+    logs_list_ref.extend(global_skipped)
+    for (setting, value, cmd), future in zip(global_items, global_futures):
+        result = future.result()
+        logs_list_ref.extend((f"  Executing: {' '.join(cmd)}", f"  Result: {result}"))
+        if ERROR_OUTPUT_RE.search(result):
             GlobalLogger.append(
                 f"[TCPOptimizer] Possible error applying netsh global {setting}={value}: {result}",
                 is_error=True
             )
 
     logs_list_ref.append(f"\n[*] Applying Netsh Supplemental settings for '{profile_name}':")
-    for setting, value in profile.get("netsh_supplemental", {}).items():
-        if setting == "congestionprovider":
-            cmd = [
-                "netsh", "int", "tcp", "set", "supplemental",
-                "template=internet", f"congestionprovider={value}"
-            ]
-            logs_list_ref.append(f"  Executing: {' '.join(cmd)}")
-            result = run_shell_command(cmd, check_return_code=False)
-            logs_list_ref.append(f"  Result: {result}")
-            if "error" in result.lower() or "invalid" in result.lower() or "incorrect" in result.lower():
-                GlobalLogger.append(
-                    f"[TCPOptimizer] Possible error applying netsh supplemental {setting}={value}: {result}",
-                    is_error=True
-                )
+    logs_list_ref.extend(supp_skipped)
+    for (setting, value, cmd), future in zip(supp_items, supp_futures):
+        result = future.result()
+        logs_list_ref.extend((f"  Executing: {' '.join(cmd)}", f"  Result: {result}"))
+        if ERROR_OUTPUT_RE.search(result):
+            GlobalLogger.append(
+                f"[TCPOptimizer] Possible error applying netsh supplemental {setting}={value}: {result}",
+                is_error=True
+            )
+
+    _invalidate_netsh_cache()
 
 
 def apply_all(profile_name_to_apply):
@@ -379,7 +638,7 @@ def apply_all(profile_name_to_apply):
     Called by Dashboard. Backs up current settings, applies selected profile,
     and returns a concatenated log string.
     """
-    if platform.system().lower() != "windows":
+    if not _IS_WINDOWS:
         return "TCP Optimization is Windows-only."
     GlobalLogger.append(f"[TCPOptimizer] apply_all called for profile: {profile_name_to_apply}", is_internal=True)
 
@@ -395,13 +654,52 @@ def apply_all(profile_name_to_apply):
     return final_log_string
 
 
+def _run_netsh_entries(entries, logs):
+    """
+    entries holds log lines (str) and (log prefix, command) pairs. The commands run side by side
+    on NETSH_SET_WORKERS threads; logs gets every line in entry order, each command's result
+    appended to its prefix.
+    """
+    with ThreadPoolExecutor(max_workers=NETSH_SET_WORKERS, thread_name_prefix="netshset") as pool:
+        futures = {
+            index: pool.submit(run_shell_command, entry[1], False)
+            for index, entry in enumerate(entries)
+            if isinstance(entry, tuple)
+        }
+    for index, entry in enumerate(entries):
+        logs.append(f"{entry[0]}{futures[index].result()}" if index in futures else entry)
+
+
+# Backup values that can't be written back as-is; "unset" ones mean the value didn't exist
+INVALID_REG_BACKUP_VALUES = frozenset({"N/A", "Error", "N/A_NotSet", None})
+UNSET_REG_BACKUP_VALUES = frozenset({"N/A_NotSet", None})
+INVALID_NETSH_BACKUP_VALUES = frozenset({"N/A", "Error", "Error Querying", "N/A (Parse)", None, ""})
+
+
+@dataclass(slots=True, frozen=True)
+class BackupSnapshot:
+    """
+    Contents of BACKUP_FILE: registry {value_name: value} and netsh {setting: value}.
+    """
+    registry: dict
+    netsh: dict
+
+    @classmethod
+    def load(cls, path):
+        if orjson is not None:
+            data = orjson.loads(Path(path).read_bytes())
+        else:
+            data = json.loads(Path(path).read_text(encoding="utf-8"))
+        return cls(registry=data.get("registry", {}), netsh=data.get("netsh", {}))
+
+
 def restore_settings():
     """
     Called by Restore Defaults and UI button.
     Restores TCP settings from BACKUP_FILE if it exists; otherwise applies Windows default profile.
     Returns a concatenated log string.
     """
-    if platform.system().lower() != "windows":
+    if not _IS_WINDOWS:
         return "Restore skipped (Windows-only)."
     GlobalLogger.append("[TCPOptimizer] Attempting to restore TCP settings.", is_internal=True)
 
@@ -410,16 +708,15 @@ def restore_settings():
 
     if os.path.exists(BACKUP_FILE):
         try:
-            with open(BACKUP_FILE, "r", encoding="utf-8") as f:
-                backup_data = json.load(f)
+            snapshot = BackupSnapshot.load(BACKUP_FILE)
             logs.append(f"[*] Restoring TCP settings using backup file: {BACKUP_FILE}")
 
             # Restore registry settings
             logs.append("\n  Restoring Registry settings from backup:")
-            for reg_name, value in backup_data.get("registry", {}).items():
-                if value not in ["N/A", "Error", "N/A_NotSet", None]:
+            for reg_name, value in snapshot.registry.items():
+                if value not in INVALID_REG_BACKUP_VALUES:
                     logs.append(f"    {set_registry_dword(REG_PATH_GLOBAL_TCP, reg_name, value)}")
-                elif value in ["N/A_NotSet", None]:
+                elif value in UNSET_REG_BACKUP_VALUES:
                     try:
                         key = winreg.OpenKey(
                             winreg.HKEY_LOCAL_MACHINE,
@@ -427,8 +724,10 @@ def restore_settings():
                             0,
                             winreg.KEY_SET_VALUE | winreg.KEY_WOW64_64KEY
                         )
+                        generation = _REG_CACHE_GENERATION
                         winreg.DeleteValue(key, reg_name)
                         winreg.CloseKey(key)
+                        _reg_cache_store({reg_name: _REG_MISSING}, generation)
                         logs.append(f"    [*] Registry value {reg_name} deleted (restored to OS default/unset).")
                     except FileNotFoundError:
                         logs.append(
@@ -442,46 +741,44 @@ def restore_settings():
                         f"    [*] Skipped restoring registry value {reg_name} due to invalid backup value: {value}"
                     )
 
-            # Restore netsh settings
-            logs.append("\n  Restoring Netsh settings from backup:")
-            backed_up_netsh = backup_data.get("netsh", {})
+            # Restore netsh settings. Every command below sets a different setting, so they are
+            # collected as (log prefix, command) entries and run side by side at the end.
+            netsh_entries = ["\n  Restoring Netsh settings from backup:"]
             applied_from_backup = set()
 
-            for setting, value in backed_up_netsh.items():
-                if value not in ["N/A", "Error", "Error Querying", "N/A (Parse)", None, ""]:
+            for setting, value in snapshot.netsh.items():
+                if value not in INVALID_NETSH_BACKUP_VALUES:
                     if setting in TCP_PROFILES[profile_to_restore_to]["netsh_global"]:
                         cmd = ["netsh", "interface", "tcp", "set", "global", f"{setting}={value}"]
-                        logs.append(f"    Restoring global '{setting}' to '{value}': {run_shell_command(cmd, False)}")
+                        netsh_entries.append((f"    Restoring global '{setting}' to '{value}': ", cmd))
                         applied_from_backup.add(setting)
                     elif setting in TCP_PROFILES[profile_to_restore_to]["netsh_supplemental"]:
                         cmd = [
                             "netsh", "int", "tcp", "set", "supplemental",
                             "template=internet", f"{setting}={value}"
                         ]
-                        logs.append(
-                            f"    Restoring supplemental '{setting}' to '{value}' for internet template: "
-                            f"{run_shell_command(cmd, False)}"
-                        )
+                        netsh_entries.append((
+                            f"    Restoring supplemental '{setting}' to '{value}' for internet template: ",
+                            cmd
+                        ))
                         applied_from_backup.add(setting)
                     else:
-                        logs.append(
+                        netsh_entries.append(
                             f"    [*] Unknown netsh setting '{setting}' in backup with value '{value}', skipping."
                         )
                 else:
-                    logs.append(
+                    netsh_entries.append(
                         f"    [*] Invalid or missing backup value for netsh setting '{setting}', "
                         f"will apply from '{profile_to_restore_to}' profile if defined there."
                     )
 
             # Apply defaults for any netsh settings not restored from backup
-            logs.append(f"\n  Applying '{profile_to_restore_to}' values for remaining netsh settings:")
+            netsh_entries.append(f"\n  Applying '{profile_to_restore_to}' values for remaining netsh settings:")
             default_profile_netsh_global = TCP_PROFILES[profile_to_restore_to]["netsh_global"]
             for setting, value in default_profile_netsh_global.items():
                 if setting not in applied_from_backup:
                     cmd = ["netsh", "interface", "tcp", "set", "global", f"{setting}={value}"]
-                    logs.append(
-                        f"    Applying default global '{setting}' to '{value}': {run_shell_command(cmd, False)}"
-                    )
+                    netsh_entries.append((f"    Applying default global '{setting}' to '{value}': ", cmd))
 
             default_profile_netsh_supp = TCP_PROFILES[profile_to_restore_to]["netsh_supplemental"]
             for setting, value in default_profile_netsh_supp.items():
@@ -490,10 +787,12 @@ def restore_settings():
                         "netsh", "int", "tcp", "set", "supplemental",
                         "template=internet", f"{setting}={value}"
                     ]
-                    logs.append(
-                        f"    Applying default supplemental '{setting}' to '{value}' for internet template: "
-                        f"{run_shell_command(cmd, False)}"
-                    )
+                    netsh_entries.append((
+                        f"    Applying default supplemental '{setting}' to '{value}' for internet template: ",
+                        cmd
+                    ))
+
+            _run_netsh_entries(netsh_entries, logs)
 
         except Exception as e_read_backup:
             logs.append(
@@ -512,6 +811,7 @@ def restore_settings():
         GlobalLogger.append("[TCPOptimizer] No backup file. Applying default profile.", is_internal=True)
         _apply_profile_logic(profile_to_restore_to, logs)
 
+    _invalidate_netsh_cache()
     logs.append("\n[*] TCP settings restoration process complete. A system REBOOT is highly recommended.")
     return "\n".join(logs)
 
@@ -521,13 +821,14 @@ def query_current_tcp_parameters_for_display():
     Queries current registry and netsh TCP parameters for UI display.
     Returns a dict mapping display names to their current values (strings).
     """
-    if platform.system().lower() != "windows":
+    if not _IS_WINDOWS:
         return {name: "N/A (Non-Windows)" for name in TCP_REG_PARAMS_INFO.keys()}
 
-    params_display = {}
-    for display_name, (reg_name, _, _) in TCP_REG_PARAMS_INFO.items():
-        if reg_name:
-            params_display[display_name] = str(get_registry_dword(REG_PATH_GLOBAL_TCP, reg_name))
+    reg_values = get_registry_dwords_bulk(REG_PATH_GLOBAL_TCP, REG_VALUE_NAMES)
+    params_display = {
+        display_name: str(reg_values[reg_name])
+        for display_name, reg_name in DISPLAY_TO_REG_NAME.items()
+    }
 
     current_netsh = query_current_netsh_settings()
     params_display["TCP Window Auto-Tuning Level"] = current_netsh.get("autotuninglevel", "N/A")
@@ -543,6 +844,62 @@ def query_current_tcp_parameters_for_display():
     return params_display
 
 
+class TcpRegistryWatcher(QObject):
+    """
+    Turns on _REG_CACHE and clears it whenever a value under REG_PATH_GLOBAL_TCP changes.
+    RegNotifyChangeKeyValue signals an event that a QWinEventNotifier picks up on the GUI
+    thread; the notification is re-armed after each change.
+    """
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        global _REG_CACHE
+        self._key = win32api.RegOpenKeyEx(
+            win32con.HKEY_LOCAL_MACHINE,
+            REG_PATH_GLOBAL_TCP,
+            0,
+            win32con.KEY_NOTIFY | win32con.KEY_WOW64_64KEY
+        )
+        self._event = win32event.CreateEvent(None, True, False, None)
+        self._notifier = QWinEventNotifier(int(self._event), self)
+        self._notifier.activated.connect(self._on_key_changed)
+        self._arm()
+        with _REG_CACHE_LOCK:
+            _REG_CACHE = {}
+        GlobalLogger.append("[TCPOptimizer] Watching TCP registry key for changes.", is_internal=True)
+
+    def _arm(self):
+        win32event.ResetEvent(self._event)
+        win32api.RegNotifyChangeKeyValue(
+            self._key, False, win32con.REG_NOTIFY_CHANGE_LAST_SET, self._event, True
+        )
+
+    @Slot()
+    def _on_key_changed(self):
+        global _REG_CACHE_GENERATION
+        with _REG_CACHE_LOCK:
+            _REG_CACHE_GENERATION += 1
+            if _REG_CACHE is not None:
+                _REG_CACHE.clear()
+        try:
+            self._arm()
+        except Exception as e:
+            GlobalLogger.append(f"[TCPOptimizer] Could not re-arm registry watcher: {e}", is_error=True)
+            self.close()
+
+    def close(self):
+        """
+        Stops watching and turns the cache off again.
+        """
+        global _REG_CACHE, _REG_CACHE_GENERATION
+        with _REG_CACHE_LOCK:
+            _REG_CACHE_GENERATION += 1
+            _REG_CACHE = None
+        self._notifier.setEnabled(False)
+        self._key.Close()
+        self._event.Close()
+
+
 class TCPOptimizerPage(QWidget):
     """
     Dark-themed "TCP/IP Optimizer" page:
@@ -554,11 +911,18 @@ class TCPOptimizerPage(QWidget):
       • All existing functionality (backup, apply, restore) preserved exactly.
     """
 
+    # ("apply" | "restore", finished future) for a background TCP job, delivered on the GUI thread
+    job_finished = Signal(str, object)
+
     def __init__(self, main_window_instance=None):
         super().__init__()
         self.main_window = main_window_instance
         GlobalLogger.append("[TCPOptimizerPage] Initializing.", is_internal=True)
 
+        # Apply/restore run here: a profile apply spawns around ten netsh/reg calls
+        self._job_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="tcpjob")
+        self.job_finished.connect(self._on_job_finished)
+
         # Overall dark page background
         self.setStyleSheet("""
             QWidget { background-color: #1E1E2F; font-family: "Segoe UI", sans-serif; }
@@ -577,7 +941,7 @@ class TCPOptimizerPage(QWidget):
                 min-height: 45px; font-size: 14px; border-radius: 5px;
             }
             QPushButton#restoreBtn:hover { background-color: #E04A4A; }
-            QTextEdit#logBox {
+            QPlainTextEdit#logBox {
                 background-color: #1A1A28; color: #EEEEEE; border: 1px solid #44444F;
                 border-radius: 5px; font-family: Consolas, monospace; font-size: 12px;
             }
@@ -611,7 +975,20 @@ class TCPOptimizerPage(QWidget):
         stats_header_label.setObjectName("statHeader")
         self.stats_grid_layout.addWidget(stats_header_label, 0, 0, 1, 4)
 
+        # Registry values stay cached between refreshes while this watcher is running
+        self._reg_watcher = None
+        if REG_WATCH_SUPPORTED:
+            try:
+                self._reg_watcher = TcpRegistryWatcher(self)
+            except Exception as e:
+                GlobalLogger.append(f"[TCPOptimizerPage] Registry watcher unavailable: {e}", is_error=True)
+
         self.displayed_stat_labels = {}
+        self._stat_rows = []
+        # Text each value label currently shows, so refreshes only touch labels that changed
+        self._last_stat_values = {}
+        # Set when a refresh was skipped because the page was hidden; showEvent catches up
+        self._stats_dirty = False
         self._populate_current_stats_display(self.stats_grid_layout, initial_load=True)
         main_layout.addWidget(self.stats_frame)
 
@@ -662,92 +1039,171 @@ class TCPOptimizerPage(QWidget):
         log_area_label.setStyleSheet("font-size: 15px; font-weight: bold; color: #FFFFFF; margin-top: 15px;")
         main_layout.addWidget(log_area_label)
 
-        self.log_text_edit = QTextEdit()
+        self.log_text_edit = QPlainTextEdit()
         self.log_text_edit.setObjectName("logBox")
         self.log_text_edit.setReadOnly(True)
         self.log_text_edit.setMinimumHeight(180)
+        # Append-only log: bounded, no undo history, no rewrapping of old lines
+        self.log_text_edit.setMaximumBlockCount(LOG_MAX_BLOCKS)
+        self.log_text_edit.setUndoRedoEnabled(False)
+        self.log_text_edit.setLineWrapMode(QPlainTextEdit.LineWrapMode.NoWrap)
+        # Cursor kept at the end of the document for inserting log batches
+        self._log_cursor = QTextCursor(self.log_text_edit.document())
+        # Log lines are buffered and written to the box in one batch per flush
+        self._log_buf = deque(maxlen=LOG_MAX_BLOCKS)
+        self._log_flush = QTimer(self)
+        self._log_flush.setSingleShot(True)
+        self._log_flush.setInterval(LOG_FLUSH_MS)
+        self._log_flush.timeout.connect(self._flush_log)
         main_layout.addWidget(self.log_text_edit)
 
         main_layout.addStretch(1)
 
-        # On Windows, back up and refresh stats immediately
-        if platform.system().lower() == "windows":
+        # On Windows, back up the current settings (the stats grid was just filled above)
+        if _IS_WINDOWS:
             backup_msg = backup_current_tcp_settings()
-            self.log_text_edit.append(backup_msg)
-            self._refresh_displayed_stats()
+            self._log(backup_msg)
         else:
-            self.log_text_edit.append("[-] TCP Optimization features are Windows-only.")
+            self._log("[-] TCP Optimization features are Windows-only.")
             self.apply_btn.setEnabled(False)
             self.restore_btn.setEnabled(False)
             self.profile_combo.setEnabled(False)
-            self._populate_current_stats_display(self.stats_grid_layout, initial_load=True)
+            # Nothing to show without Windows; the grid was never filled
+            self.stats_frame.hide()
 
-    def _populate_current_stats_display(self, grid_layout_ref, initial_load=False):
+    def _populate_current_stats_display(self, grid_layout_ref, initial_load=False, current_params=None):
         """
         Populates or refreshes the grid of current TCP parameters.
         initial_load=True sets up QLabel widgets; else updates existing labels' text.
+        current_params, if given, is used instead of querying again.
+        Does nothing off Windows, where there are no parameters to show.
+        """
+        if not _IS_WINDOWS:
+            return
+        if current_params is None:
+            current_params = query_current_tcp_parameters_for_display()
+
+        # Hold off painting until every label is in place: one layout pass instead of one per widget
+        stats_widget = grid_layout_ref.parentWidget()
+        stats_widget.setUpdatesEnabled(False)
+        try:
+            if initial_load:
+                self._build_stats_grid(grid_layout_ref, current_params)
+            else:
+                last_values = self._last_stat_values
+                for param_display_name, value_widget in self._stat_rows:
+                    value_str = str(current_params.get(param_display_name, "N/A"))
+                    if last_values.get(param_display_name) != value_str:
+                        value_widget.setText(value_str)
+                        last_values[param_display_name] = value_str
+        finally:
+            stats_widget.setUpdatesEnabled(True)
+
+    def _build_stats_grid(self, grid_layout_ref, current_params):
+        """
+        Creates the name/value label pairs for _populate_current_stats_display's initial load.
         """
-        current_params = query_current_tcp_parameters_for_display()
         row = 1
         col_pair = 0
-
-        display_order = list(TCP_REG_PARAMS_INFO.keys())
-
-        for param_display_name in display_order:
+        for param_display_name in TCP_REG_PARAMS_INFO:
             value_str = str(current_params.get(param_display_name, "N/A"))
 
-            if initial_load:
-                name_label = QLabel(f"{param_display_name}:")
-                name_label.setObjectName("statLabel")
-                name_label.setAlignment(Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter)
+            name_label = QLabel(f"{param_display_name}:")
+            name_label.setObjectName("statLabel")
+            name_label.setAlignment(Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter)
 
-                value_widget = QLabel(value_str)
-                value_widget.setObjectName("statValue")
-                value_widget.setTextInteractionFlags(Qt.TextInteractionFlag.TextSelectableByMouse)
+            value_widget = QLabel(value_str)
+            value_widget.setObjectName("statValue")
+            value_widget.setTextInteractionFlags(Qt.TextInteractionFlag.TextSelectableByMouse)
 
-                grid_layout_ref.addWidget(name_label, row, col_pair * 2)
-                grid_layout_ref.addWidget(value_widget, row, col_pair * 2 + 1)
-                self.displayed_stat_labels[param_display_name] = value_widget
-            else:
-                if param_display_name in self.displayed_stat_labels:
-                    self.displayed_stat_labels[param_display_name].setText(value_str)
+            grid_layout_ref.addWidget(name_label, row, col_pair * 2)
+            grid_layout_ref.addWidget(value_widget, row, col_pair * 2 + 1)
+            self.displayed_stat_labels[param_display_name] = value_widget
+            self._last_stat_values[param_display_name] = value_str
 
             col_pair += 1
             if col_pair >= 2:
                 col_pair = 0
                 row += 1
 
-        if initial_load:
-            if col_pair != 0:
-                grid_layout_ref.addItem(
-                    QSpacerItem(20, 20, QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Minimum),
-                    row, col_pair * 2 + 2, 1, -1
-                )
-            grid_layout_ref.setRowStretch(row + 1, 1)
-            grid_layout_ref.setColumnStretch(4, 1)
+        # (name, value label) pairs in display order, walked directly by every refresh
+        self._stat_rows = list(self.displayed_stat_labels.items())
 
-            if not self.displayed_stat_labels and platform.system().lower() == "windows":
-                grid_layout_ref.addWidget(
-                    QLabel("Could not load current TCP/IP parameters."),
-                    1, 0, 1, 4
-                )
+        if col_pair != 0:
+            grid_layout_ref.addItem(
+                QSpacerItem(20, 20, QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Minimum),
+                row, col_pair * 2 + 2, 1, -1
+            )
+        grid_layout_ref.setRowStretch(row + 1, 1)
+        grid_layout_ref.setColumnStretch(4, 1)
 
-    def _refresh_displayed_stats(self):
+        if not self.displayed_stat_labels and _IS_WINDOWS:
+            grid_layout_ref.addWidget(
+                QLabel("Could not load current TCP/IP parameters."),
+                1, 0, 1, 4
+            )
+
+    def _refresh_displayed_stats(self, current_params=None):
         """
-        Refreshes the displayed TCP/IP stats by re-querying and updating labels.
+        Refreshes the displayed TCP/IP stats by re-querying (unless current_params is given)
+        and updating labels. Given params are applied even while hidden (setText is cheap);
+        without them a hidden page only marks the stats stale, so showEvent queries once.
         """
-        if platform.system().lower() != "windows":
+        if not _IS_WINDOWS:
             return
+        if current_params is None and not self.isVisible():
+            self._stats_dirty = True
+            return
+        self._stats_dirty = False
         GlobalLogger.append("[TCPOptimizerPage] Refreshing displayed TCP/IP statistics.", is_internal=True)
-        self._populate_current_stats_display(self.stats_grid_layout, initial_load=False)
+        self._populate_current_stats_display(self.stats_grid_layout, initial_load=False, current_params=current_params)
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        if self._stats_dirty:
+            self._refresh_displayed_stats()
 
     def update_profile_description_display(self, profile_name):
         """
         Updates the profile description label when the combo box changes.
         """
-        description = TCP_PROFILES.get(profile_name, {}).get("description", "No description available.")
+        description = TCP_PROFILE_DESCRIPTIONS.get(profile_name, "No description available.")
         self.profile_description_label.setText(f"Info: {description}")
 
+    def _log_batch(self, lines):
+        """
+        Appends lines to the action log as a single edit, with painting held off until done.
+        """
+        if not lines:
+            return
+        text = "\n".join(lines)
+        cursor = self._log_cursor
+        cursor.movePosition(QTextCursor.End)
+        if not cursor.atStart():
+            text = "\n" + text
+        self.log_text_edit.setUpdatesEnabled(False)
+        try:
+            cursor.beginEditBlock()
+            cursor.insertText(text)
+            cursor.endEditBlock()
+        finally:
+            self.log_text_edit.setUpdatesEnabled(True)
+        scroll_bar = self.log_text_edit.verticalScrollBar()
+        scroll_bar.setValue(scroll_bar.maximum())
+
+    def _log(self, message):
+        """
+        Queue a line for the action log; bursts are coalesced into one batch.
+        """
+        self._log_buf.append(message)
+        if not self._log_flush.isActive():
+            self._log_flush.start()
+
+    def _flush_log(self):
+        if self._log_buf:
+            self._log_batch(self._log_buf)
+            self._log_buf.clear()
+
     def on_apply_profile_button_click(self):
         """
         Handles the 'Apply Selected Profile' button click.
@@ -758,7 +1214,7 @@ class TCPOptimizerPage(QWidget):
             f"[TCPOptimizerPage] 'Apply Profile' button clicked for: {selected_profile}"
         )
 
-        if platform.system().lower() != "windows":
+        if not _IS_WINDOWS:
             return
 
         confirm_msg = (
@@ -775,28 +1231,69 @@ class TCPOptimizerPage(QWidget):
             QMessageBox.StandardButton.No
         )
         if reply == QMessageBox.StandardButton.No:
-            self.log_text_edit.append(f"[*] Application of '{selected_profile}' profile cancelled by user.")
+            self._log(f"[*] Application of '{selected_profile}' profile cancelled by user.")
             return
 
-        self.log_text_edit.append(f"[*] Backing up current settings before applying '{selected_profile}'...")
-        backup_msg = backup_current_tcp_settings()
-        self.log_text_edit.append(backup_msg)
+        self._log(f"[*] Backing up current settings before applying '{selected_profile}'...")
+        self._start_job("apply", self._apply_profile_job, selected_profile)
 
-        self.log_text_edit.append(f"\n[*] Applying '{selected_profile}' profile settings...")
-        apply_logs = []
+    @staticmethod
+    def _apply_profile_job(selected_profile):
+        """
+        Worker-thread half of 'Apply Selected Profile': backup, then apply. Returns the log text.
+        """
+        backup_msg = backup_current_tcp_settings()
+        apply_logs = [backup_msg, f"\n[*] Applying '{selected_profile}' profile settings..."]
         _apply_profile_logic(selected_profile, apply_logs)
-        self.log_text_edit.append("\n".join(apply_logs))
+        GlobalLogger.append(f"[TCPOptimizerPage] Profile '{selected_profile}' application process complete.")
+        return "\n".join(apply_logs)
 
-        self._refresh_displayed_stats()
+    def _start_job(self, kind, job, *args):
+        """
+        Runs job(*args) on the page's worker thread with the buttons disabled.
+        The job's log text and a fresh stats query come back through job_finished.
+        """
+        self.apply_btn.setEnabled(False)
+        self.restore_btn.setEnabled(False)
+        self.profile_combo.setEnabled(False)
+        future = self._job_pool.submit(self._job_with_stats, job, *args)
+        future.add_done_callback(lambda f, k=kind: self.job_finished.emit(k, f))
+
+    @staticmethod
+    def _job_with_stats(job, *args):
+        return job(*args), query_current_tcp_parameters_for_display()
+
+    @Slot(str, object)
+    def _on_job_finished(self, kind, future):
+        self.apply_btn.setEnabled(True)
+        self.restore_btn.setEnabled(True)
+        self.profile_combo.setEnabled(True)
+        try:
+            log_text, current_params = future.result()
+        except Exception as e:
+            self._log(f"[-] TCP {kind} failed: {e}")
+            GlobalLogger.append(f"[TCPOptimizerPage] TCP {kind} job failed: {e}", is_error=True)
+            QMessageBox.critical(self, "TCP Optimizer Error", f"The TCP {kind} did not complete:\n{e}")
+            return
 
-        QMessageBox.information(
-            self,
-            "TCP Optimization Applied",
-            f"The '{selected_profile}' profile has been applied.\n"
-            "Please review the action log for details.\n\n"
-            "A system REBOOT is strongly recommended."
-        )
-        GlobalLogger.append(f"[TCPOptimizerPage] Profile '{selected_profile}' application process complete.")
+        self._log(log_text)
+        self._refresh_displayed_stats(current_params)
+
+        if kind == "apply":
+            QMessageBox.information(
+                self,
+                "TCP Optimization Applied",
+                f"The '{self.profile_combo.currentText()}' profile has been applied.\n"
+                "Please review the action log for details.\n\n"
+                "A system REBOOT is strongly recommended."
+            )
+        else:
+            QMessageBox.information(
+                self,
+                "TCP Settings Restored",
+                "TCP/IP settings restoration process has finished.\n"
+                "Review the log. A REBOOT is highly recommended."
+            )
 
     def on_restore_settings_button_click(self):
         """
@@ -804,7 +1301,7 @@ class TCPOptimizerPage(QWidget):
         Restores from backup if available, else applies Windows default.
         """
         GlobalLogger.append("[TCPOptimizerPage] 'Restore TCP Settings' button clicked.")
-        if platform.system().lower() != "windows":
+        if not _IS_WINDOWS:
             return
 
         restore_msg_detail = "from the last backup if available, otherwise to Windows default settings."
@@ -820,22 +1317,21 @@ class TCPOptimizerPage(QWidget):
             QMessageBox.StandardButton.No
         )
         if reply == QMessageBox.StandardButton.Yes:
-            self.log_text_edit.append("\n[*] Initiating TCP settings restoration...")
-            restore_logs_str = restore_settings()
-            self.log_text_edit.append(restore_logs_str)
-            self._refresh_displayed_stats()
-            QMessageBox.information(
-                self,
-                "TCP Settings Restored",
-                "TCP/IP settings restoration process has finished.\n"
-                "Review the log. A REBOOT is highly recommended."
-            )
+            self._log("\n[*] Initiating TCP settings restoration...")
+            self._start_job("restore", restore_settings)
         else:
-            self.log_text_edit.append("[*] TCP settings restoration cancelled by user.")
+            self._log("[*] TCP settings restoration cancelled by user.")
 
     def shutdown(self):
         """
         Called when the application is closing.
-        Logs shutdown; no additional cleanup needed here.
+        Waits for a running apply/restore and stops the registry watcher, if any.
         """
+        # Let a running apply/restore finish rather than leave the TCP stack half-configured
+        self._job_pool.shutdown(wait=True, cancel_futures=True)
+        self._log_flush.stop()
+        self._flush_log()
+        if self._reg_watcher is not None:
+            self._reg_watcher.close()
+            self._reg_watcher = None
         GlobalLogger.append("[TCPOptimizerPage] Shutdown.", is_internal=True)
@@ -6,9 +6,15 @@ Helper to safely locate resource files and determine where to store
 settings/logs in both development and PyInstaller‐bundled modes.
 """
 
+import functools
 import os
 import sys
 
+# Resource root, fixed for the life of the process: PyInstaller's temp folder (_MEIPASS)
+# when frozen, otherwise the folder where this .py lives
+_BASE = getattr(sys, "_MEIPASS", None) or os.path.dirname(os.path.abspath(__file__))
+
+@functools.lru_cache(maxsize=None)
 def resource_path(relative_path):
     """
     Get absolute path to resource (e.g. an icon), works for dev and for PyInstaller.
@@ -16,14 +22,7 @@ def resource_path(relative_path):
         resource_path('resources/icon.ico')
     When frozen, sys._MEIPASS is the temporary folder holding bundled data.
     """
-    try:
-        # PyInstaller creates a temp folder and stores path in _MEIPASS
-        base_path = sys._MEIPASS
-    except AttributeError:
-        # Not frozen: use the folder where this .py lives
-        base_path = os.path.dirname(os.path.abspath(__file__))
-
-    return os.path.join(base_path, relative_path)
+    return os.path.join(_BASE, relative_path)
 
 
 # utils/path_utils.py
@@ -32,11 +31,30 @@ import os
 import sys
 import ctypes
 
+# kernel32.SetFileAttributesW, looked up once with its signature declared
+if os.name == "nt":
+    from ctypes import wintypes
+    _SetFileAttributesW = ctypes.WinDLL("kernel32").SetFileAttributesW
+    _SetFileAttributesW.argtypes = [wintypes.LPCWSTR, wintypes.DWORD]
+    _SetFileAttributesW.restype = wintypes.BOOL
+
+@functools.lru_cache(maxsize=None)
 def app_data_path(file_name=None):
     """
     Return a folder named "ROP_data" next to the .exe (if frozen) or next to the script (if dev).
     Mark it as hidden on Windows so it doesn't clutter Explorer.
     """
+    base_dir = _app_data_dir()
+    if file_name:
+        return os.path.join(base_dir, file_name)
+    return base_dir
+
+
+@functools.lru_cache(maxsize=1)
+def _app_data_dir():
+    """
+    Locates, creates and hides the ROP_data folder. Cached, so this runs once per process.
+    """
     # 1) Determine where to place the folder
     if getattr(sys, "frozen", False):
         exe_folder = os.path.dirname(os.path.abspath(sys.executable))
@@ -57,12 +75,9 @@ def app_data_path(file_name=None):
         FILE_ATTRIBUTE_HIDDEN = 0x02
         try:
             # Use the wide‐char version (SetFileAttributesW) for correct Unicode support
-            ctypes.windll.kernel32.SetFileAttributesW(base_dir, FILE_ATTRIBUTE_HIDDEN)
+            _SetFileAttributesW(base_dir, FILE_ATTRIBUTE_HIDDEN)
         except Exception as ex:
             # If it fails (e.g. lack of permission), just continue without error
             print(f"Warning: could not hide folder {base_dir}: {ex}")
 
-    # 4) Return either the folder or the specific file inside it
-    if file_name:
-        return os.path.join(base_dir, file_name)
     return base_dir
@@ -4,8 +4,10 @@ import ctypes
 import subprocess
 import os
 import sys # Added sys for platform check
-import platform # Added platform for platform check
-from datetime import datetime # For timestamping logs
+import atexit
+import queue
+import threading
+import time # For timestamping logs
 import winreg
 
 # --- Helper for resource paths (ensure this is correctly defined if not using a separate utils.py) ---
@@ -17,14 +19,63 @@ try:
 except ImportError:
     # Fallback definition if utils.path_utils is not found (e.g. running this file standalone for testing)
     # This basic version works if resources are relative to this script's dir, or for _MEIPASS.
+    _BASE = getattr(sys, "_MEIPASS", None) or os.path.dirname(os.path.abspath(__file__))
+
     def resource_path(relative_path):
-        try:
-            base_path = sys._MEIPASS
-        except AttributeError:
-            base_path = os.path.abspath(os.path.dirname(__file__))
-        return os.path.join(base_path, relative_path)
+        return os.path.join(_BASE, relative_path)
     print("Warning: 'utils.path_utils.resource_path' not found, using fallback resource_path in visual_tweaks_and_logs.py.")
 
+# Checked once here instead of calling platform.system() on every tweak
+_IS_WINDOWS = sys.platform == "win32"
+
+# WM_SETTINGCHANGE broadcast after UserPreferencesMask changes
+HWND_BROADCAST = 0xFFFF
+WM_SETTINGCHANGE = 0x001A
+SMTO_ABORTIFHUNG = 0x0002
+SETTINGCHANGE_TIMEOUT_MS = 5000
+
+# app.log is rotated once it reaches this size, keeping this many old files (app.log.1 is newest)
+LOG_MAX_BYTES = 2_000_000
+LOG_BACKUP_COUNT = 3
+
+# Entry prefixes indexed by level: 0 normal, 1 internal/debug, 2 error
+_LOG_PREFIXES = ("", "[DEBUG] ", "[ERROR] ")
+
+# get_log_since() reads at most this much of the end of app.log when it starts from the top
+LOG_TAIL_BYTES = 256 * 1024
+
+# UserPreferencesMask values (little-endian 64-bit), decoded once.
+# These might vary slightly between Windows versions.
+BEST_PERFORMANCE_MASK = bytes.fromhex("9012038010000000") # "Adjust for best performance"
+BEST_APPEARANCE_MASK = bytes.fromhex("9E3E078012000000") # Common default for "Best Appearance"
+
+
+# user32 entry points, looked up once with their signatures declared.
+# A private WinDLL keeps these argtypes from leaking onto ctypes.windll.user32.
+if _IS_WINDOWS:
+    from ctypes import wintypes
+    _user32 = ctypes.WinDLL("user32")
+    _SystemParametersInfoW = _user32.SystemParametersInfoW
+    _SystemParametersInfoW.argtypes = [wintypes.UINT, wintypes.UINT, ctypes.c_wchar_p, wintypes.UINT]
+    _SystemParametersInfoW.restype = wintypes.BOOL
+    _SendMessageTimeoutW = _user32.SendMessageTimeoutW
+    _SendMessageTimeoutW.argtypes = [
+        wintypes.HWND, wintypes.UINT, wintypes.WPARAM, wintypes.LPARAM,
+        wintypes.UINT, wintypes.UINT, ctypes.POINTER(ctypes.c_size_t)
+    ]
+    _SendMessageTimeoutW.restype = wintypes.LPARAM
+
+
+def _broadcast_setting_change():
+    """
+    Tells top-level windows that user preferences changed, skipping any that hang.
+    """
+    result = ctypes.c_size_t()
+    _SendMessageTimeoutW(
+        HWND_BROADCAST, WM_SETTINGCHANGE, 0, 0,
+        SMTO_ABORTIFHUNG, SETTINGCHANGE_TIMEOUT_MS, ctypes.byref(result)
+    )
+
 
 class VisualTweaks:
     @staticmethod
@@ -33,13 +84,13 @@ class VisualTweaks:
         Uses the Windows API to set the desktop wallpaper to a blank string,
         effectively disabling it. (Windows-specific)
         """
-        if platform.system().lower() != "windows":
+        if not _IS_WINDOWS:
             return "[-] Wallpaper modification is Windows-specific."
         try:
             # SPI_SETDESKWALLPAPER = 20
             # SPIF_UPDATEINIFILE = 0x01, SPIF_SENDCHANGE = 0x02
             # The last parameter '3' is SPIF_UPDATEINIFILE | SPIF_SENDCHANGE
-            ctypes.windll.user32.SystemParametersInfoW(20, 0, "", 3)
+            _SystemParametersInfoW(20, 0, "", 3)
             return "[*] Wallpaper temporarily disabled (set to blank)."
         except Exception as e:
             return f"[-] Failed to disable wallpaper: {e}"
@@ -50,12 +101,12 @@ class VisualTweaks:
         Restores the desktop wallpaper from the given file path. (Windows-specific)
         If the path is invalid or empty, returns an error message.
         """
-        if platform.system().lower() != "windows":
+        if not _IS_WINDOWS:
             return "[-] Wallpaper modification is Windows-specific."
         try:
             if not wallpaper_path or not os.path.isfile(wallpaper_path): # Check if file exists
                 return f"[-] Invalid wallpaper path or file does not exist: {wallpaper_path}. Cannot restore."
-            ctypes.windll.user32.SystemParametersInfoW(20, 0, str(wallpaper_path), 3)
+            _SystemParametersInfoW(20, 0, str(wallpaper_path), 3)
             return f"[*] Wallpaper restored to: {wallpaper_path}"
         except Exception as e:
             return f"[-] Failed to restore wallpaper: {e}"
@@ -67,15 +118,11 @@ class VisualTweaks:
         by updating the UserPreferencesMask registry value. (Windows-specific)
         The mask 0x90,0x12,0x03,0x80,0x10,0x00,0x00,0x00 corresponds to "Adjust for best performance".
         """
-        if platform.system().lower() != "windows":
+        if not _IS_WINDOWS:
             return "[-] Visual effects modification is Windows-specific."
         
-        # UserPreferencesMask for "Adjust for best performance"
+        # UserPreferencesMask for "Adjust for best performance" (BEST_PERFORMANCE_MASK)
         # This value might vary slightly between Windows versions but generally aims to turn off visuals.
-        # Little-endian representation of a 64-bit integer.
-        # Original value (example, 'Best appearance'): 0x9E, 0x3E, 0x07, 0x80, 0x12, 0x00, 0x00, 0x00
-        # 'Best performance' value (example):       0x90, 0x12, 0x03, 0x80, 0x10, 0x00, 0x00, 0x00
-        best_performance_mask_hex = "9012038010000000" # As a flat hex string
         
         # This can also be set directly via winreg for HKEY_CURRENT_USER\Control Panel\Desktop\UserPreferencesMask REG_BINARY
         # However, SystemParametersInfo with SPI_SETUSERPREFERENCESMASK (value 4119 or 0x1017) is another way,
@@ -84,21 +131,12 @@ class VisualTweaks:
         try:
             reg_path = r"Control Panel\Desktop"
             value_name = "UserPreferencesMask"
-            # Convert hex string to bytes
-            mask_bytes = bytes.fromhex(best_performance_mask_hex)
-            
-            key = winreg.OpenKey(winreg.HKEY_CURRENT_USER, reg_path, 0, winreg.KEY_SET_VALUE)
-            winreg.SetValueEx(key, value_name, 0, winreg.REG_BINARY, mask_bytes)
-            winreg.CloseKey(key)
-            
-            # Changes to UserPreferencesMask often require a logoff/logon or a broadcast of WM_SETTINGCHANGE.
-            # Forcing a refresh of settings (might not be fully effective for all visuals without logoff):
-            ctypes.windll.user32.SystemParametersInfoW(0x0011, 0, None, 0x0002 | 0x0001) # SPI_SETDESKWALLPAPER with null path, SPIF_SENDCHANGE | SPIF_UPDATEINIFILE
-            # A more targeted way for UserPreferencesMask might be needed if above doesn't refresh all.
-            # SendMessageTimeout might be better:
-            # HWND_BROADCAST = 0xFFFF
-            # WM_SETTINGCHANGE = 0x001A
-            # SendMessageTimeout(HWND_BROADCAST, WM_SETTINGCHANGE, 0, "Policy", SMTO_ABORTIFHUNG, 5000, NULL)
+            with winreg.OpenKey(winreg.HKEY_CURRENT_USER, reg_path, 0, winreg.KEY_SET_VALUE) as key:
+                winreg.SetValueEx(key, value_name, 0, winreg.REG_BINARY, BEST_PERFORMANCE_MASK)
+
+            # Changes to UserPreferencesMask often require a logoff/logon; broadcasting
+            # WM_SETTINGCHANGE lets running windows pick up what they can now.
+            _broadcast_setting_change()
 
             return "[*] Visual effects set to 'Best Performance' (registry updated)."
         except Exception as e:
@@ -111,29 +149,37 @@ class VisualTweaks:
         Re-enables common Windows visual effects by restoring UserPreferencesMask
         to a typical "Let Windows choose" or "Best appearance" value. (Windows-specific)
         """
-        if platform.system().lower() != "windows":
+        if not _IS_WINDOWS:
             return "[-] Visual effects modification is Windows-specific."
 
-        # 'Let Windows choose' or 'Best appearance' (example, can vary)
-        best_appearance_mask_hex = "9E3E078012000000" # Common default for "Best Appearance"
-        
+        # 'Let Windows choose' or 'Best appearance' (BEST_APPEARANCE_MASK, can vary)
         try:
             reg_path = r"Control Panel\Desktop"
             value_name = "UserPreferencesMask"
-            mask_bytes = bytes.fromhex(best_appearance_mask_hex)
-            
-            key = winreg.OpenKey(winreg.HKEY_CURRENT_USER, reg_path, 0, winreg.KEY_SET_VALUE)
-            winreg.SetValueEx(key, value_name, 0, winreg.REG_BINARY, mask_bytes)
-            winreg.CloseKey(key)
+            with winreg.OpenKey(winreg.HKEY_CURRENT_USER, reg_path, 0, winreg.KEY_SET_VALUE) as key:
+                winreg.SetValueEx(key, value_name, 0, winreg.REG_BINARY, BEST_APPEARANCE_MASK)
 
             # Force refresh
-            ctypes.windll.user32.SystemParametersInfoW(0x0011, 0, None, 0x0002 | 0x0001)
+            _broadcast_setting_change()
 
             return "[*] Visual effects restored towards 'Best Appearance' (registry updated)."
         except Exception as e:
             return f"[-] Exception restoring visual effects via registry: {e}"
 
 
+class _WriterRequest:
+    """
+    A control item for GlobalLogger's writer thread, handled in order with the entries
+    queued before it. done is set once handled; error holds any exception raised.
+    """
+    __slots__ = ("kind", "done", "error")
+
+    def __init__(self, kind):
+        self.kind = kind # "flush" or "clear"
+        self.done = threading.Event()
+        self.error = None
+
+
 class GlobalLogger:
     """
     Provides simple, timestamped, file-based logging to 'app.log'.
@@ -151,57 +197,240 @@ class GlobalLogger:
         # Print to stderr if directory creation fails, as logging itself might not work yet
         print(f"CRITICAL: Failed to create log directory '{os.path.dirname(log_file)}'. Error: {e}", file=sys.stderr)
 
+    # Append handle, opened on the first write and kept for the rest of the run.
+    # Only the writer thread touches it (clear_log too, if no writer is running), always with _lock held.
+    _fh = None
+    _lock = threading.Lock()
+
+    # append() only queues the formatted entry; the writer thread drains the queue
+    # and writes whatever has piled up with one write() and flush().
+    # _WriterRequest items (flush barriers, clears) are handled at their place in the queue.
+    _queue = queue.SimpleQueue()
+    _writer = None
+    _STOP = object()
+
+    # Bumped whenever app.log is replaced or emptied, so readers holding a byte offset
+    # into the old file know to start over even if the new one has grown past it
+    _generation = 0
+
+    # File size that triggers the next rotation; pushed back by LOG_MAX_BYTES when one fails
+    _rotate_at = LOG_MAX_BYTES
+
+    # (second, "YYYY-MM-DD HH:MM:SS") of the last entry; strftime runs once per second
+    _ts_cache = (None, "")
+
+    @staticmethod
+    def _handle():
+        """
+        Returns the open append handle, opening it if needed. Call with _lock held.
+        """
+        if GlobalLogger._fh is None:
+            GlobalLogger._fh = open(GlobalLogger.log_file, "a", encoding="utf-8")
+        return GlobalLogger._fh
+
+    @staticmethod
+    def _rotate():
+        """
+        Moves app.log to app.log.1 (shifting older files up, dropping the oldest)
+        and starts a new app.log. Call with _lock held.
+        """
+        if GlobalLogger._fh is not None:
+            GlobalLogger._fh.close()
+            GlobalLogger._fh = None
+        base = GlobalLogger.log_file
+        for index in range(LOG_BACKUP_COUNT - 1, 0, -1):
+            older = f"{base}.{index}"
+            if os.path.exists(older):
+                os.replace(older, f"{base}.{index + 1}")
+        os.replace(base, f"{base}.1")
+        GlobalLogger._generation += 1
+        GlobalLogger._handle()
+
+    @staticmethod
+    def _start_writer():
+        with GlobalLogger._lock:
+            if GlobalLogger._writer is None:
+                writer = threading.Thread(target=GlobalLogger._write_loop, name="GlobalLogger", daemon=True)
+                writer.start()
+                GlobalLogger._writer = writer
+
+    @staticmethod
+    def _write_entries(entries):
+        """
+        Writes a list of formatted entries in one go. Called on the writer thread.
+        """
+        if not entries:
+            return
+        text = "".join(entries)
+        with GlobalLogger._lock:
+            try:
+                fh = GlobalLogger._handle()
+                fh.write(text)
+                fh.flush()
+                size = fh.tell()
+            except Exception as e_log:
+                try:
+                    print(f"LOGGER_FAILURE: Failed to write to log file '{GlobalLogger.log_file}'. Error: {e_log}. Lost entries: {text}", file=sys.stderr)
+                except:
+                    pass # Absolute fallback
+                return
+
+            if size < GlobalLogger._rotate_at:
+                return
+            try:
+                GlobalLogger._rotate()
+                GlobalLogger._rotate_at = LOG_MAX_BYTES
+            except Exception as e_rotate:
+                # The entries are written; only the rotation failed (on Windows, e.g. while
+                # another process has the file open). Try again once it grows another step.
+                GlobalLogger._rotate_at = size + LOG_MAX_BYTES
+                try:
+                    print(f"LOGGER_WARNING: Failed to rotate log file '{GlobalLogger.log_file}'. Error: {e_rotate}. Retrying at {GlobalLogger._rotate_at} bytes.", file=sys.stderr)
+                except:
+                    pass # Absolute fallback
+
+    @staticmethod
+    def _truncate():
+        """
+        Empties the log file through the kept handle. Call with _lock held.
+        """
+        # In append mode the next write starts at 0
+        GlobalLogger._handle().truncate(0)
+        GlobalLogger._generation += 1
+
+    @staticmethod
+    def _write_loop():
+        log_queue = GlobalLogger._queue
+        while True:
+            batch = [log_queue.get()]
+            while True:
+                try:
+                    batch.append(log_queue.get_nowait())
+                except queue.Empty:
+                    break
+            entries = []
+            for item in batch:
+                if isinstance(item, str):
+                    entries.append(item)
+                    continue
+                # Everything queued before a control item is written before it is handled
+                GlobalLogger._write_entries(entries)
+                entries = []
+                if item is GlobalLogger._STOP:
+                    return
+                if item.kind == "clear":
+                    try:
+                        with GlobalLogger._lock:
+                            GlobalLogger._truncate()
+                    except Exception as e:
+                        item.error = e
+                item.done.set()
+            GlobalLogger._write_entries(entries)
+
+    @staticmethod
+    def _run_request(kind, timeout=5):
+        """
+        Queues a _WriterRequest and waits for the writer thread to handle it.
+        Returns False if there is no writer running, in which case nothing is pending.
+        Raises the request's error, if any.
+        """
+        writer = GlobalLogger._writer
+        if writer is None or not writer.is_alive():
+            return False
+        request = _WriterRequest(kind)
+        GlobalLogger._queue.put(request)
+        request.done.wait(timeout)
+        if request.error is not None:
+            raise request.error
+        return True
+
+    @staticmethod
+    def _sync():
+        """
+        Waits until everything appended so far is in the file.
+        """
+        GlobalLogger._run_request("flush")
+
+    @staticmethod
+    def _close():
+        """
+        Writes out anything still queued and closes the handle. Registered with atexit.
+        """
+        writer = GlobalLogger._writer
+        if writer is not None and writer.is_alive():
+            GlobalLogger._queue.put(GlobalLogger._STOP)
+            writer.join(timeout=5)
+        with GlobalLogger._lock:
+            if GlobalLogger._fh is not None:
+                GlobalLogger._fh.close()
+                GlobalLogger._fh = None
 
     @staticmethod
     def append(message, is_error=False, is_internal=False):
         """
-        Appends a timestamped message to the log file.
+        Appends a timestamped message to the log file. The write itself happens on a
+        background thread, so this returns without touching the disk.
         - message: The string message to log.
         - is_error: If True, prepends "[ERROR]" to the message.
         - is_internal: If True, prepends "[DEBUG]" (for internal/verbose logs).
         """
         try:
-            timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S.%f")[:-3] # Timestamp with milliseconds
-            prefix = ""
-            if is_error:
-                prefix = "[ERROR] "
-            elif is_internal: # For verbose/debug type messages from within components
-                prefix = "[DEBUG] "
-            
-            # Ensure message is a string
-            if not isinstance(message, str):
-                try:
-                    message = str(message)
-                except:
-                    message = "Undescribable log message object"
+            now = time.time()
+            sec = int(now)
+            cached_sec, date_prefix = GlobalLogger._ts_cache
+            if sec != cached_sec:
+                date_prefix = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(sec))
+                GlobalLogger._ts_cache = (sec, date_prefix)
+            # Errors win over internal (verbose/debug) messages; non-str messages are formatted by the f-string
+            level = 2 if is_error else 1 if is_internal else 0
+            log_entry = f"{date_prefix}.{int((now - sec) * 1000):03d} - {_LOG_PREFIXES[level]}{message}\n"
 
-            log_entry = f"{timestamp} - {prefix}{message}\n"
-            
-            with open(GlobalLogger.log_file, "a", encoding="utf-8") as f:
-                f.write(log_entry)
+            if GlobalLogger._writer is None:
+                GlobalLogger._start_writer()
+            GlobalLogger._queue.put(log_entry)
         except Exception as e_log:
             # Fallback if logging fails: print to stderr
             # Avoid recursion if print itself causes issues with GlobalLogger.append
             try:
-                print(f"LOGGER_FAILURE: Failed to write to log file '{GlobalLogger.log_file}'. Error: {e_log}. Original message: {message}", file=sys.stderr)
+                print(f"LOGGER_FAILURE: Failed to queue log entry for '{GlobalLogger.log_file}'. Error: {e_log}. Original message: {message}", file=sys.stderr)
             except:
                 pass # Absolute fallback
 
     @staticmethod
-    def get_log():
+    def get_log_since(offset=0, generation=None):
         """
-        Returns the full contents of the log file.
-        Returns a placeholder string if the log file doesn't exist or is unreadable.
+        Returns (text, end_offset, reset, generation) for the complete lines written after
+        byte offset. Pass end_offset and generation back in on the next call (generation=None
+        when there is none yet). If the file was rotated or cleared since then, or is shorter
+        than offset, reading restarts from the beginning and reset is True.
+        Reading from the beginning returns only the last LOG_TAIL_BYTES (from the first whole
+        line) behind a truncation marker when the file is larger.
+        Returns ("", offset, False, generation) if the log file doesn't exist or is unreadable.
         """
+        GlobalLogger._sync()
         try:
-            if os.path.exists(GlobalLogger.log_file):
-                with open(GlobalLogger.log_file, "r", encoding="utf-8") as f:
-                    return f.read()
-            else:
-                return "[*] Log file does not exist yet."
-        except Exception as e:
-            GlobalLogger.append(f"Failed to read log file for display: {e}", is_error=True)
-            return f"[-] Error reading log file: {e}"
+            # Under the lock the file can't be rotated or truncated mid-read
+            with GlobalLogger._lock, open(GlobalLogger.log_file, "rb") as f:
+                current_generation = GlobalLogger._generation
+                size = f.seek(0, os.SEEK_END)
+                reset = size < offset or (generation is not None and generation != current_generation)
+                if reset:
+                    offset = 0
+                marker = ""
+                if offset == 0 and size > LOG_TAIL_BYTES:
+                    f.seek(size - LOG_TAIL_BYTES)
+                    f.readline() # Drop the partial first line
+                    offset = f.tell()
+                    marker = "[*] ...log truncated, showing the most recent entries...\n"
+                f.seek(offset)
+                data = f.read(size - offset)
+        except OSError:
+            return "", offset, False, generation
+
+        # Leave a line that is still being written for the next call; decode straight
+        # from a view of the buffer rather than slicing off a copy first
+        end = data.rfind(b"\n") + 1
+        return marker + str(memoryview(data)[:end], "utf-8", "replace"), offset + end, reset, current_generation
 
     @staticmethod
     def clear_log():
@@ -210,10 +439,12 @@ class GlobalLogger:
         Returns a status message.
         """
         try:
+            GlobalLogger._sync()
             if os.path.exists(GlobalLogger.log_file):
-                # Open in 'w' mode to truncate, then close. This is safer than os.remove sometimes.
-                with open(GlobalLogger.log_file, "w", encoding="utf-8") as f:
-                    f.write("") # Truncate the file
+                # Truncated on the writer thread, after every entry queued before this call
+                if not GlobalLogger._run_request("clear"):
+                    with GlobalLogger._lock:
+                        GlobalLogger._truncate()
                 GlobalLogger.append("Log file cleared by user.", is_internal=True) # Log the clear action itself
                 return "[*] Log file has been cleared."
             else:
@@ -235,4 +466,7 @@ class GlobalLogger:
     #             os.makedirs(log_dir, exist_ok=True)
     #         GlobalLogger.append(f"Log file path explicitly set to: {new_path}", is_internal=True)
     #     except Exception as e:
-    #         print(f"CRITICAL: Failed to create directory for new log path '{new_path}'. Error: {e}", file=sys.stderr)
\ No newline at end of file
+    #         print(f"CRITICAL: Failed to create directory for new log path '{new_path}'. Error: {e}", file=sys.stderr)
+
+
+atexit.register(GlobalLogger._close)